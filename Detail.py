@@ -1,5 +1,5 @@
 """
-실제 실행 중인 Chrome에 연결하여 자기소개서 추출
+헤드리스 Chromium(Playwright)으로 자기소개서/자격증 추출
 """
 from bs4.element import Tag
 
@@ -8,13 +8,14 @@ from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 import json
 import time
-import subprocess
-import os
-import signal
-import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from src.account_manager import AccountManager
 from src.auth import JobKoreaAuth
+from src.browser_pool import BrowserPool
+from src.checkpoint_log import CheckpointLog
+from src.detail_cache import DetailCache
+from grade import MIN_SCORE, CandidateScorer
 
 
 
@@ -91,6 +92,72 @@ def extract_certificates_from_page(page):
     return data if data else None
 
 
+def process_resume(page, resume: dict, checkpoint: CheckpointLog, detail_cache: DetailCache = None) -> bool:
+    """
+    이력서 1건 방문 → 자기소개서/자격증 추출 → 체크포인트 기록
+
+    Returns:
+        성공 여부
+    """
+    resume_no = resume.get('이력서번호')
+
+    try:
+        # 이력서 페이지 이동
+        page.goto(resume.get('이력서링크'), wait_until='domcontentloaded', timeout=30000)
+
+        # JavaScript 실행 대기
+        time.sleep(3)
+
+        # 자기소개서 추출
+        intro_data = extract_introduction_from_page(page)
+
+        # 자격증 추출
+        cert_data = extract_certificates_from_page(page)
+
+    except Exception as e:
+        print(f"   ❌ 오류: {e}")
+
+        result = {
+            **resume,
+            "자기소개서": None,
+            "자격증": None,
+            "추출상태": f"오류: {str(e)}"
+        }
+        checkpoint.append(str(resume_no), result, status=CheckpointLog.STATUS_ERROR)
+        return False
+
+    # 결과 구성
+    result = {
+        **resume,
+        "자기소개서": intro_data,
+        "자격증": cert_data,
+        "추출상태": "성공"
+    }
+    checkpoint.append(str(resume_no), result)
+    if detail_cache is not None:
+        detail_cache.put(resume_no, intro_data, cert_data)
+
+    # 출력
+    if intro_data:
+        print(f"   ✅ 자기소개서 {len(intro_data)}개 추출")
+        # 미리보기
+        if intro_data[0]['body_text']:
+            preview = intro_data[0]['body_text'][:100]
+            print(f"   📝 {preview}...")
+    else:
+        print(f"   ⚠️  자기소개서 없음")
+
+    if cert_data:
+        print(f"   ✅ 자격증 {len(cert_data)}개 추출")
+        # 자격증 목록 출력
+        cert_names = [c['자격증명'] for c in cert_data[:3]]
+        print(f"   🏆 {', '.join(cert_names)}{'...' if len(cert_data) > 3 else ''}")
+    else:
+        print(f"   ⚠️  자격증 없음")
+
+    return True
+
+
 def login_and_get_cookies(username: str, password: str):
     """
     잡코리아 로그인하여 쿠키 반환
@@ -117,249 +184,304 @@ def login_and_get_cookies(username: str, password: str):
     return cookies
 
 
-def extract_all_resumes(summary_json_path: str, max_count: int = None, output_file: str = "output/Details.json"):
+def run_shard(
+    username: str,
+    cookies: list,
+    resumes: list,
+    checkpoint: CheckpointLog,
+    detail_cache: DetailCache = None,
+    headless: bool = True
+) -> int:
     """
-    실행 중인 Chrome에 연결하여 자기소개서 일괄 추출
-    1명씩 처리할 때마다 JSON 파일에 저장 (중간 손실 방지)
+    샤드 1개 처리: 계정 전용 브라우저/컨텍스트로 할당된 이력서 순회
+
+    Args:
+        username: 계정 아이디 (컨텍스트 이름)
+        cookies: 계정 로그인 쿠키
+        resumes: 이 샤드에 할당된 이력서 목록
+        checkpoint: 결과를 기록할 체크포인트 로그 (샤드 간 공유)
+        detail_cache: 상세정보 캐시 (샤드 간 공유)
+        headless: 브라우저 창 없이 실행 여부
+
+    Returns:
+        성공 개수
     """
-    # 이력서 목록 로드
-    with open(summary_json_path, 'r', encoding='utf-8') as f:
-        resumes = json.load(f)
+    tag = f"[{username}]"
+    success_count = 0
 
-    print(f"📋 총 {len(resumes)}개 이력서 발견")
+    with sync_playwright() as p:
+        pool = BrowserPool(p, headless=headless)
+        try:
+            pool.start()
 
-    if max_count:
-        resumes = resumes[:max_count]
-        print(f"   → {max_count}개만 처리합니다.\n")
+            # 🔥 계정 전용 컨텍스트 생성 + 쿠키 주입
+            pool.new_context(username, cookies)
+            print(f"{tag} 🍪 로그인 쿠키 주입 완료\n")
 
-    # 기존 진행 상황 확인 (이어서 하기)
-    if Path(output_file).exists():
-        with open(output_file, 'r', encoding='utf-8') as f:
-            try:
-                existing_results = json.load(f)
-                processed_rnos = {r.get('이력서번호') for r in existing_results if r.get('추출상태') == '성공'}
-                print(f"💾 기존 저장 파일 발견: {len(existing_results)}개 처리됨")
-                print(f"   이어서 진행합니다...\n")
-                results = existing_results
-            except:
-                results = []
-    else:
-        processed_rnos = set()
-        results = []
+            # 각 이력서 순회
+            for idx, resume in enumerate(resumes, 1):
+                name = resume.get('이름', 'Unknown')
+                print(f"{tag} [{idx}/{len(resumes)}] {name} (rNo={resume.get('이력서번호')})")
 
-    # 계정 정보 로드
-    excel_path = "configs/jobkorea_Excel.xlsx"
-    account_manager = AccountManager(excel_path)
-    accounts = account_manager.list_accounts()
+                ok = process_resume(pool.page(username), resume, checkpoint, detail_cache)
+                print(f"   💾 기록 완료 ({idx}/{len(resumes)}){'' if ok else ' (오류 포함)'}\n")
 
-    if not accounts:
-        print("❌ 계정이 없습니다.")
-        return []
+                if ok:
+                    success_count += 1
+                else:
+                    # 오류 발생 시 브라우저 상태 확인 (죽었으면 재실행)
+                    pool.ensure_healthy()
 
-    credentials = account_manager.get_credentials(accounts[0])
-    if not credentials:
-        print("❌ 계정 정보를 불러올 수 없습니다.")
-        return []
+                # 요청 간 간격
+                time.sleep(1)
 
-    username = credentials['username']
-    password = credentials['password']
+            pool.print_report()
 
-    # 로그인하여 쿠키 획득
-    cookies = login_and_get_cookies(username, password)
-    if not cookies:
-        return []
+        except Exception as e:
+            print(f"\n{tag} ❌ 브라우저 실행 실패: {e}")
+            print("\n해결 방법:")
+            print("   Chromium이 설치되어 있는지 확인하세요: playwright install chromium")
+            import traceback
+            traceback.print_exc()
+        finally:
+            pool.close()
 
-    # Chrome 자동 실행
-    chrome_process = None
-    print("=" * 80)
-    print("🚀 Chrome 디버깅 모드 자동 실행")
-    print("=" * 80)
+    return success_count
 
-    # OS별 Chrome 경로 및 user-data-dir 설정
-    system = platform.system()
-    if system == "Darwin":  # macOS
-        chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-        user_data_dir = "/tmp/chrome-debug"
-        manual_cmd = '/Applications/Google\\ Chrome.app/Contents/MacOS/Google\\ Chrome --remote-debugging-port=9222'
-    elif system == "Windows":
-        # Windows Chrome 경로 (일반적인 위치들 체크)
-        possible_paths = [
-            "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
-            "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
-            os.path.expandvars("%LOCALAPPDATA%\\Google\\Chrome\\Application\\chrome.exe")
-        ]
-        chrome_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                chrome_path = path
-                break
-        if not chrome_path:
-            chrome_path = "chrome.exe"  # PATH에 있을 경우
-        user_data_dir = os.path.expandvars("%TEMP%\\chrome-debug")
-        manual_cmd = 'chrome.exe --remote-debugging-port=9222'
-    else:  # Linux
-        chrome_path = "google-chrome"
-        user_data_dir = "/tmp/chrome-debug"
-        manual_cmd = 'google-chrome --remote-debugging-port=9222'
 
-    try:
-        chrome_cmd = [
-            chrome_path,
-            "--remote-debugging-port=9222",
-            f"--user-data-dir={user_data_dir}"
-        ]
-
-        print(f"📌 OS: {system}")
-        print(f"📌 실행 명령어:")
-        if system == "Windows":
-            print(f'   "{chrome_path}" --remote-debugging-port=9222 --user-data-dir={user_data_dir}\n')
-        else:
-            print(f"   {' '.join([f'\"{p}\"' if ' ' in p else p for p in chrome_cmd])}\n")
+def prune_by_score_bound(resumes: list, min_score: int):
+    """
+    요약 정보만으로 점수 상한을 계산하여 상세정보 수집 대상 선별
 
-        # Chrome 프로세스 실행
-        chrome_process = subprocess.Popen(
-            chrome_cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+    기본 규칙(data/scoring_rules.json)에서는 상세정보로 최대 50점(자격증 20 + 커뮤니케이션 20 + 동기 10)이
+    추가될 수 있고 모두 실제로 받을 수 있는 점수이므로, 기본 합격 기준(30점)으로는 제외되는 이력서가 없음
+    (수집 순서만 점수 상한 순으로 정렬). 합격 기준이 상세정보 최대 점수보다 높을 때만 실제로 제외됨
 
-        print("✅ Chrome 실행 중...")
-        print("⏳ Chrome이 완전히 시작될 때까지 5초 대기...\n")
-        time.sleep(5)
+    Args:
+        resumes: 이력서 요약 목록 (상세정보를 아직 모르는 이력서)
+        min_score: 합격 기준 점수 (grade.py의 MIN_SCORE)
 
-    except Exception as e:
-        print(f"⚠️  Chrome 자동 실행 실패: {e}")
-        print("수동으로 실행해주세요:")
-        print(f"   {manual_cmd}\n")
+    Returns:
+        (수집 대상 - 점수 상한 높은 순, [(제외 이력서, 점수 상한)])
+    """
+    scorer = CandidateScorer()
+    headroom = scorer.detail_headroom()
+    if min_score <= headroom:
+        # 요약 점수가 0점이어도 상세정보로 합격 기준에 도달할 수 있음 → 제외 대상 없음 (수집 순서만 정렬)
+        print(f"ℹ️  상세정보로 최대 {headroom}점 추가 가능 → {min_score}점 기준으로는 제외할 이력서 없음 (점수 상한 높은 순으로만 수집)")
 
-    with sync_playwright() as p:
-        try:
-            # 실행 중인 Chrome에 연결
-            print("🔗 실행 중인 Chrome에 연결 시도...")
-            browser = p.chromium.connect_over_cdp("http://localhost:9222")
-            print("✅ Chrome 연결 성공!\n")
+    bounded = [(resume, scorer.upper_bound_score(resume)) for resume in resumes]
 
-            # 기본 컨텍스트 가져오기
-            contexts = browser.contexts
-            if not contexts:
-                print("❌ Chrome 컨텍스트를 찾을 수 없습니다.")
-                return []
+    to_fetch = [(resume, bound) for resume, bound in bounded if bound >= min_score]
+    pruned = [(resume, bound) for resume, bound in bounded if bound < min_score]
 
-            context = contexts[0]
-            pages = context.pages
+    to_fetch.sort(key=lambda x: x[1], reverse=True)
+    return [resume for resume, _ in to_fetch], pruned
 
-            if not pages:
-                print("❌ 열린 탭이 없습니다. Chrome에서 새 탭을 열어주세요.")
-                return []
 
-            # 첫 번째 페이지 사용 (또는 새 탭 생성)
-            page = pages[0]
-            print(f"✅ 현재 탭 사용: {page.url}\n")
+def checkpoint_path_for(output_file: str) -> str:
+    """출력 파일에 대응하는 체크포인트 로그 경로"""
+    path = Path(output_file)
+    return str(path.with_name(f"{path.stem}.checkpoint.jsonl"))
 
-            # 🔥 쿠키 주입!
-            print("🍪 로그인 쿠키 주입 중...")
-            context.add_cookies(cookies)
-            print("✅ 쿠키 주입 완료!\n")
 
-            # 각 이력서 순회
-            for idx, resume in enumerate(resumes, 1):
-                resume_no = resume.get('이력서번호')
-                resume_link = resume.get('이력서링크')
-                name = resume.get('이름', 'Unknown')
+def finalize_results(checkpoint: CheckpointLog, output_file: str, detail_cache: DetailCache = None) -> list:
+    """
+    체크포인트 로그를 정리하여 최종 JSON 저장 (+ 상세정보 캐시 정리)
 
-                # 이미 처리된 경우 건너뛰기
-                if resume_no in processed_rnos:
-                    print(f"[{idx}/{len(resumes)}] {name} (rNo={resume_no}) - ⏭️  건너뜀 (이미 처리됨)")
-                    continue
+    기존 JSON의 채점 결과(점수상세/채점키)는 유지 → 입력이 그대로인 후보자는 grade.py가 재채점하지 않음
+    """
+    if detail_cache is not None:
+        detail_cache.close()
 
-                print(f"[{idx}/{len(resumes)}] {name} (rNo={resume_no})")
-
-                try:
-                    # 이력서 페이지 이동
-                    page.goto(resume_link, wait_until='domcontentloaded', timeout=30000)
-
-                    # JavaScript 실행 대기
-                    time.sleep(3)
-
-                    # 자기소개서 추출
-                    intro_data = extract_introduction_from_page(page)
-
-                    # 자격증 추출
-                    cert_data = extract_certificates_from_page(page)
-
-                    # 결과 구성
-                    result = {
-                        **resume,
-                        "자기소개서": intro_data,
-                        "자격증": cert_data,
-                        "추출상태": "성공"
-                    }
-                    results.append(result)
-
-                    # 출력
-                    if intro_data:
-                        print(f"   ✅ 자기소개서 {len(intro_data)}개 추출")
-                        # 미리보기
-                        if intro_data[0]['body_text']:
-                            preview = intro_data[0]['body_text'][:100]
-                            print(f"   📝 {preview}...")
-                    else:
-                        print(f"   ⚠️  자기소개서 없음")
-
-                    if cert_data:
-                        print(f"   ✅ 자격증 {len(cert_data)}개 추출")
-                        # 자격증 목록 출력
-                        cert_names = [c['자격증명'] for c in cert_data[:3]]
-                        print(f"   🏆 {', '.join(cert_names)}{'...' if len(cert_data) > 3 else ''}")
-                    else:
-                        print(f"   ⚠️  자격증 없음")
-
-                    # 🔥 즉시 JSON 파일에 저장
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        json.dump(results, f, ensure_ascii=False, indent=2)
-                    print(f"   💾 저장 완료 ({len(results)}/{len(resumes)})\n")
-
-                    # 요청 간 간격
-                    time.sleep(1)
-
-                except Exception as e:
-                    print(f"   ❌ 오류: {e}\n")
-
-                    result = {
-                        **resume,
-                        "자기소개서": None,
-                        "자격증": None,
-                        "추출상태": f"오류: {str(e)}"
-                    }
-                    results.append(result)
-
-                    # 🔥 오류 발생해도 즉시 저장
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        json.dump(results, f, ensure_ascii=False, indent=2)
-                    print(f"   💾 저장 완료 (오류 포함)\n")
-
-                    time.sleep(1)
+    checkpoint.close()
+    results = checkpoint.compact(output_file, key_field='이력서번호', keep_fields=CandidateScorer.SCORE_FIELDS)
+    print(f"💾 체크포인트 정리 완료: {len(results)}개 → {output_file}")
+    return results
 
-        except Exception as e:
-            print(f"\n❌ Chrome 연결 실패: {e}")
-            print("\n해결 방법:")
-            print("1. Chrome을 디버깅 모드로 실행하세요:")
-            print("   /Applications/Google\\ Chrome.app/Contents/MacOS/Google\\ Chrome --remote-debugging-port=9222")
-            print("\n2. 또는 다른 터미널에서 위 명령어를 실행한 후 다시 시도하세요")
-            import traceback
-            traceback.print_exc()
-            return []
-        finally:
-            # Chrome 프로세스 종료
-            if chrome_process:
-                print("\n🛑 Chrome 프로세스 종료 중...")
-                try:
-                    chrome_process.terminate()
-                    chrome_process.wait(timeout=5)
-                    print("✅ Chrome 종료 완료")
-                except:
-                    chrome_process.kill()
-                    print("✅ Chrome 강제 종료 완료")
+
+def fetch_details(
+    pending: list,
+    checkpoint: CheckpointLog,
+    detail_cache: DetailCache = None,
+    shard_accounts: bool = False,
+    headless: bool = True
+):
+    """
+    계정 로그인 후 상세정보 수집 (결과는 체크포인트 로그에 기록)
+
+    Args:
+        pending: 수집할 이력서 목록
+        checkpoint: 결과를 기록할 체크포인트 로그
+        detail_cache: 상세정보 캐시
+        shard_accounts: True면 '계정' 시트의 모든 계정으로 나눠 동시 처리
+        headless: 브라우저 창 없이 실행 여부
+    """
+    # 계정 정보 로드 + 로그인 (샤딩 모드면 '계정' 시트의 모든 계정)
+    excel_path = "configs/jobkorea_Excel.xlsx"
+    account_manager = AccountManager(excel_path)
+    accounts = account_manager.list_accounts()
+
+    if not accounts:
+        print("❌ 계정이 없습니다.")
+        return
+
+    if not shard_accounts:
+        accounts = accounts[:1]
+
+    sessions = []
+    for account in accounts:
+        credentials = account_manager.get_credentials(account)
+        if not credentials:
+            print(f"❌ 계정 정보를 불러올 수 없습니다: {account}")
+            continue
+
+        # 로그인하여 쿠키 획득 (계정별 세션)
+        cookies = login_and_get_cookies(credentials['username'], credentials['password'])
+        if cookies:
+            sessions.append((credentials['username'], cookies))
+
+    if not sessions:
+        print("❌ 로그인 가능한 계정이 없습니다.")
+        return
+
+    # 샤드 분할 (계정 수만큼 라운드 로빈)
+    shards = [
+        (username, cookies, pending[i::len(sessions)])
+        for i, (username, cookies) in enumerate(sessions)
+    ]
+    shards = [shard for shard in shards if shard[2]]
+
+    print("=" * 80)
+    print(f"🚀 헤드리스 Chromium 실행 (샤드 {len(shards)}개)")
+    for username, _, shard_resumes in shards:
+        print(f"   [{username}] {len(shard_resumes)}개")
+    print("=" * 80)
+
+    if len(shards) == 1:
+        run_shard(*shards[0], checkpoint=checkpoint, detail_cache=detail_cache, headless=headless)
+    else:
+        # 샤드별 워커 스레드 (스레드마다 별도 Playwright/브라우저)
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(run_shard, *shard, checkpoint=checkpoint, detail_cache=detail_cache, headless=headless)
+                for shard in shards
+            ]
+            for future in futures:
+                future.result()
+
+
+def extract_all_resumes(
+    summary_json_path: str,
+    max_count: int = None,
+    output_file: str = "output/Details.json",
+    cache_path: str = "output/detail_cache.jsonl",
+    cache_ttl_hours: float = 72,
+    headless: bool = True,
+    shard_accounts: bool = False,
+    prune_min_score: int = None
+):
+    """
+    헤드리스 Chromium으로 자기소개서 일괄 추출
+    1명씩 처리할 때마다 체크포인트 로그에 추가 기록 (중간 손실 방지)
+    처리 종료 시 로그를 정리하여 output_file(JSON)로 저장
+
+    Args:
+        summary_json_path: 이력서 목록 파일 (main.py 출력)
+        max_count: 최대 처리 개수 (None이면 전체)
+        output_file: 출력 JSON 파일
+        cache_path: 상세정보 캐시 파일 (None이면 캐시 사용 안 함)
+        cache_ttl_hours: 상세정보 캐시 유효 시간 (시간 단위)
+        headless: 브라우저 창 없이 실행 여부
+        shard_accounts: True면 '계정' 시트의 모든 계정으로 이력서를 나눠 동시 처리
+        prune_min_score: 점수 상한이 이 점수 미만인 이력서는 상세정보 수집 생략 (None이면 전체 수집)
+    """
+    # 이력서 목록 로드
+    with open(summary_json_path, 'r', encoding='utf-8') as f:
+        resumes = json.load(f)
+
+    print(f"📋 총 {len(resumes)}개 이력서 발견")
+
+    if max_count:
+        resumes = resumes[:max_count]
+        print(f"   → {max_count}개만 처리합니다.\n")
+
+    # 기존 진행 상황 확인 (이어서 하기)
+    checkpoint = CheckpointLog(checkpoint_path_for(output_file))
+    if not checkpoint.exists() and Path(output_file).exists():
+        imported = checkpoint.import_json(output_file, key_field='이력서번호', ok_field='추출상태', ok_value='성공')
+        print(f"💾 기존 저장 파일을 체크포인트 로그로 변환: {imported}개")
+
+    statuses = checkpoint.scan_keys()
+    processed_rnos = {rno for rno, status in statuses.items() if status == CheckpointLog.STATUS_OK}
+    if statuses:
+        print(f"💾 기존 체크포인트 발견: {len(statuses)}개 처리됨 (성공 {len(processed_rnos)}개)")
+        print(f"   이어서 진행합니다...\n")
+
+    # 상세정보 캐시 (유효한 캐시는 페이지 방문 없이 재사용)
+    detail_cache = None
+    observed_at = None
+    if cache_path:
+        detail_cache = DetailCache(cache_path, ttl_hours=cache_ttl_hours)
+        observed_at = Path(summary_json_path).stat().st_mtime  # 요약 수집 시각 (최근활동 기준)
+
+    try:
+        # 이미 처리된 이력서 제외 (이력서번호 중복도 제거)
+        # 캐시를 쓰면 처리된 이력서도 유효 시간 경과/이력서 수정 여부를 확인해서 다시 수집
+        pending_by_rno = {}
+        stale_rnos = set()
+        for resume in resumes:
+            rno = str(resume.get('이력서번호'))
+            if rno in pending_by_rno:
+                continue
+            if rno in processed_rnos:
+                if detail_cache is None or detail_cache.get(resume, observed_at=observed_at) is not None:
+                    continue
+                stale_rnos.add(rno)
+            pending_by_rno[rno] = resume
+        pending = list(pending_by_rno.values())
+        if len(pending) < len(resumes):
+            print(f"⏭️  이미 처리됨/중복: {len(resumes) - len(pending)}개 건너뜀")
+        if stale_rnos:
+            print(f"🔄 처리됐지만 캐시 만료/이력서 수정: {len(stale_rnos)}개 다시 수집")
+
+        # 상세정보 캐시 확인 (다시 수집하기로 한 이력서는 이미 확인했으므로 제외)
+        if detail_cache is not None:
+            to_fetch = []
+            for resume in pending:
+                if str(resume.get('이력서번호')) in stale_rnos:
+                    to_fetch.append(resume)
+                    continue
+                cached = detail_cache.get(resume, observed_at=observed_at)
+                if cached is None:
+                    to_fetch.append(resume)
+                    continue
+                checkpoint.append(str(resume.get('이력서번호')), {**resume, **cached, "추출상태": "성공"})
+
+            detail_cache.print_stats()
+            pending = to_fetch
+
+        # 점수 상한 기반 사전 필터링 (캐시에도 없어서 상세정보를 모르는 이력서 중 합격 기준에 못 미치는 이력서 제외)
+        if prune_min_score is not None:
+            pending, pruned = prune_by_score_bound(pending, prune_min_score)
+            for resume, bound in pruned:
+                result = {
+                    **resume,
+                    "자기소개서": None,
+                    "자격증": None,
+                    "추출상태": f"생략: 점수상한 {bound}점 < {prune_min_score}점"
+                }
+                checkpoint.append(str(resume.get('이력서번호')), result, status=CheckpointLog.STATUS_SKIPPED)
+            print(f"✂️  점수 상한 {prune_min_score}점 미만: {len(pruned)}개 상세정보 수집 생략 (나머지는 상한 높은 순으로 수집)")
+
+        print(f"🔎 상세정보 수집 대상: {len(pending)}개\n")
+        if pending:
+            fetch_details(pending, checkpoint, detail_cache, shard_accounts=shard_accounts, headless=headless)
+        else:
+            print("✅ 새로 수집할 이력서가 없습니다.")
+    finally:
+        # 체크포인트 로그 정리 → 최종 JSON 저장 (계정 없음/로그인 실패/중단 시에도 캐시/체크포인트 정리)
+        results = finalize_results(checkpoint, output_file, detail_cache)
 
     return results
 
@@ -372,6 +494,17 @@ def main():
     summary_json = "output/kspac2022_summary.json"
     output_file = "output/kspac2022_with_introduction.json"
 
+    # 상세정보 캐시 (이력서번호 기준, 유효 시간 내 + 이력서 수정 없음 → 재사용)
+    cache_file = "output/detail_cache.jsonl"  # None이면 캐시 사용 안 함
+    cache_ttl_hours = 72
+
+    # True: '계정' 시트의 모든 계정으로 나눠서 동시 처리 / False: 첫 번째 계정만 사용
+    shard_accounts = False
+
+    # 점수 상한이 합격 기준(grade.py MIN_SCORE) 미만이면 상세정보 수집 생략 (None이면 전체 수집)
+    # 기본 규칙에서는 상세정보로 최대 50점이 추가될 수 있어 MIN_SCORE 30으로는 제외되는 이력서 없음 (수집 순서만 정렬)
+    prune_min_score = MIN_SCORE
+
     if not Path(summary_json).exists():
         print(f"❌ 파일을 찾을 수 없습니다: {summary_json}")
         return
@@ -383,13 +516,17 @@ def main():
     results = extract_all_resumes(
         summary_json_path=summary_json,
         max_count=None,  # None으로 변경하면 전체 처리
-        output_file=output_file
+        output_file=output_file,
+        cache_path=cache_file,
+        cache_ttl_hours=cache_ttl_hours,
+        shard_accounts=shard_accounts,
+        prune_min_score=prune_min_score
     )
 
     if not results:
         return
 
-    # 최종 결과는 이미 저장되어 있음 (각 단계마다 저장했으므로)
+    # 최종 결과는 체크포인트 로그를 정리하여 저장됨
 
     # ⏱️ 종료 시간 및 경과 시간 계산
     end_time = time.time()
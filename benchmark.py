@@ -0,0 +1,363 @@
+"""
+성능 측정 스크립트
+실제 데이터 없이 합성 데이터로 각 구성요소의 처리 속도 측정
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from grade import CandidateScorer, grade_candidates_parallel
+from position_offer import PositionOfferGenerator
+from src.batch_scorer import BatchScorer
+from src.circuit_breaker import CircuitBreaker
+from src.excel_updater import ResultExcelUpdater
+from src.exporter import ExcelExporter
+from src.keyword_matcher import KeywordMatcher
+from src.llm_backend import HTTPBackend
+from src.mock_llm_server import MockLLMServer
+from src.retry_policy import RetryPolicy
+from src.scoring_rules import load_rules
+
+
+def _random_word(rng: random.Random, length: int) -> str:
+    """임의의 한글 단어 생성"""
+    return "".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(length))
+
+
+def _synthetic_text(rng: random.Random, keywords: list, words: int = 60) -> str:
+    """키워드가 일부 섞인 합성 텍스트 생성"""
+    tokens = []
+    for _ in range(words):
+        if rng.random() < 0.1:
+            tokens.append(rng.choice(keywords))
+        else:
+            tokens.append(_random_word(rng, rng.randint(2, 4)))
+    return " ".join(tokens)
+
+
+def synthetic_candidates(count: int, seed: int = 0) -> list:
+    """
+    채점용 합성 후보자 생성 (키워드 사전 + 수치/어학 표현을 임의 조합)
+
+    Args:
+        count: 생성할 후보자 수
+        seed: 난수 시드
+    """
+    rng = random.Random(seed)
+    vocab = [kw for keywords in load_rules().keywords.values() for kw in keywords]
+    vocab += ["개발자", "백엔드", "12건", "30%", "+5%", "TOEIC 850", "토익 650", "OPIc IH", "오픽 IM2", "신입", "3년2개월"]
+
+    def phrase(max_words):
+        return " ".join(rng.choice(vocab) for _ in range(rng.randint(0, max_words)))
+
+    candidates = []
+    for idx in range(count):
+        candidate = {
+            "이력서번호": str(10000000 + idx),
+            "이름": f"후보{idx}",
+            "경력": phrase(1),
+            "제목": phrase(3),
+            "직무": ", ".join(phrase(1) for _ in range(3)),
+            "기술스택": phrase(3),
+            "학력": phrase(2),
+        }
+        if rng.random() < 0.7:
+            candidate["자격증"] = [{"자격증명": rng.choice(vocab)} for _ in range(rng.randint(0, 3))]
+        if rng.random() < 0.7:
+            candidate["자기소개서"] = [{"index": 1, "title": "성장과정", "body_text": phrase(80)}]
+        candidates.append(candidate)
+    return candidates
+
+
+def bench_keyword_matcher(dictionary_sizes=(100, 1000, 10000), texts: int = 300):
+    """
+    키워드 사전 크기별 텍스트 1건당 매칭 비용 (기존 has_any 방식 vs Aho-Corasick)
+
+    Args:
+        dictionary_sizes: 측정할 전체 키워드 수 목록
+        texts: 측정할 텍스트 수
+    """
+    print(f"\n{'='*60}")
+    print(f"🔤 키워드 매칭: 사전 크기별 텍스트 1건당 비용")
+    print(f"{'='*60}")
+    print(f"{'키워드 수':>10} | {'has_any (ms)':>14} | {'매처 (ms)':>10} | {'컴파일 (ms)':>12}")
+
+    rng = random.Random(0)
+    base_keywords = [kw for keywords in load_rules().keywords.values() for kw in keywords]
+
+    for size in dictionary_sizes:
+        # 실제 사전 + 합성 키워드로 size개 채우기, 16개 그룹으로 분할
+        keywords = base_keywords + [_random_word(rng, rng.randint(2, 5)) for _ in range(max(0, size - len(base_keywords)))]
+        groups = {f"group{i}": keywords[i::16] for i in range(16)}
+        samples = [_synthetic_text(rng, base_keywords) for _ in range(texts)]
+
+        started = time.perf_counter()
+        for text in samples:
+            for group_keywords in groups.values():
+                CandidateScorer.has_any(text, group_keywords)
+        naive_ms = (time.perf_counter() - started) * 1000 / texts
+
+        started = time.perf_counter()
+        matcher = KeywordMatcher(groups)
+        compile_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for text in samples:
+            matcher.scan(text)
+        matcher_ms = (time.perf_counter() - started) * 1000 / texts
+
+        print(f"{size:>10} | {naive_ms:>14.3f} | {matcher_ms:>10.3f} | {compile_ms:>12.1f}")
+
+
+def bench_intro_scoring(count: int = 3000, intro_words=(100, 400, 1600)):
+    """
+    자기소개서 길이별 채점 비용 (전체 자기소개서 길이에 비례하는지 확인)
+
+    Args:
+        count: 후보자 수
+        intro_words: 측정할 자기소개서 단어 수 목록
+    """
+    print(f"\n{'='*60}")
+    print(f"📝 자기소개서 채점: 후보자 {count:,}명")
+    print(f"{'='*60}")
+    print(f"{'단어 수':>8} | {'총 글자 수':>12} | {'채점 (초)':>10} | {'1만 자당 (ms)':>14}")
+
+    rng = random.Random(0)
+    keywords = [kw for keywords in load_rules().keywords.values() for kw in keywords]
+    candidates = synthetic_candidates(count)
+    scorer = CandidateScorer()
+
+    for words in intro_words:
+        for candidate in candidates:
+            candidate["자기소개서"] = [{"index": 1, "title": "지원동기", "body_text": _synthetic_text(rng, keywords, words)}]
+        total_chars = sum(len(c["자기소개서"][0]["body_text"]) for c in candidates)
+
+        started = time.perf_counter()
+        for candidate in candidates:
+            scorer.calculate_score(candidate)
+        elapsed = time.perf_counter() - started
+
+        print(f"{words:>8} | {total_chars:>12,} | {elapsed:>10.2f} | {elapsed * 1000 / (total_chars / 10000):>14.2f}")
+
+
+def bench_batch_scoring(count: int = 100000):
+    """
+    후보자별 calculate_score 반복 vs BatchScorer 일괄 채점 (결과 일치 확인 포함)
+
+    Args:
+        count: 후보자 수
+    """
+    print(f"\n{'='*60}")
+    print(f"📊 일괄 채점: 후보자 {count:,}명")
+    print(f"{'='*60}")
+
+    candidates = synthetic_candidates(count)
+    scorer = CandidateScorer()
+    batch_scorer = BatchScorer(scorer)
+
+    started = time.perf_counter()
+    for candidate in candidates:
+        scorer.calculate_score(candidate)
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch_scorer.score(candidates)
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = batch_scorer.verify(candidates[:10000])
+
+    print(f"   후보자별 채점: {loop_seconds:.2f}초 ({count / loop_seconds:,.0f}명/초)")
+    print(f"   일괄 채점:     {batch_seconds:.2f}초 ({count / batch_seconds:,.0f}명/초)")
+    print(f"   결과 일치: {'✅ 전부 일치' if not mismatches else f'❌ {len(mismatches)}명 불일치'} (앞 10,000명 비교)")
+
+
+def bench_parallel_grading(count: int = 200000, worker_counts=(1, 2, 4, 8)):
+    """
+    워커 수별 병렬 채점 처리 속도 (grade_candidates_parallel)
+
+    Args:
+        count: 후보자 수
+        worker_counts: 측정할 워커 수 목록 (CPU 코어 수 초과분은 제외)
+    """
+    print(f"\n{'='*60}")
+    print(f"⚙️  병렬 채점: 후보자 {count:,}명 (CPU {os.cpu_count()}코어)")
+    print(f"{'='*60}")
+
+    work_dir = tempfile.mkdtemp()
+    source = os.path.join(work_dir, "candidates.json")
+    with open(source, "w", encoding="utf-8") as f:
+        json.dump(synthetic_candidates(count), f, ensure_ascii=False, indent=2)
+
+    try:
+        for workers in worker_counts:
+            if workers > (os.cpu_count() or 1):
+                continue
+            input_json = os.path.join(work_dir, f"input_{workers}.json")
+            shutil.copy(source, input_json)
+
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                grade_candidates_parallel(input_json, os.path.join(work_dir, "scored.json"), workers=workers)
+            elapsed = time.perf_counter() - started
+
+            print(f"   워커 {workers}개: {elapsed:.2f}초 ({count / elapsed:,.0f}명/초)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _synthetic_result_excel(path: str, rows: int, seed: int = 0) -> tuple:
+    """
+    main.py 결과 형식의 합성 엑셀 생성
+
+    Returns:
+        (이력서번호 → 점수, 이력서번호 → 제안문구)
+    """
+    rng = random.Random(seed)
+    people = []
+    for idx in range(rows):
+        person = {col: _random_word(rng, 4) for col in ExcelExporter.COLUMNS}
+        person["번호"] = idx + 1
+        person["나이"] = f"{rng.randint(20, 50)}세"
+        person["이력서번호"] = str(10000000 + idx)
+        people.append(person)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ExcelExporter().save(people, path)
+
+    scores = {p["이력서번호"]: rng.randint(0, 100) for p in people}
+    offers = {rno: ResultExcelUpdater.OFFER_COLUMN + " " + _random_word(rng, 60) for rno, score in scores.items() if score >= 30}
+    return scores, offers
+
+
+def _legacy_excel_update(path: str, scores: dict, offers: dict):
+    """기존 방식: insert_cols로 점수 컬럼 삽입 + 셀 단위 순회, 제안문구는 다시 로드/저장"""
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path)
+    ws = wb.active
+    headers = [cell.value for cell in ws[1]]
+    score_col = headers.index("나이") + 2
+    ws.insert_cols(score_col)
+    ws.cell(row=1, column=score_col).value = "점수"
+    rno_col = headers.index("이력서번호") + 2
+    for row_idx in range(2, ws.max_row + 1):
+        rno = ws.cell(row=row_idx, column=rno_col).value
+        if rno and str(rno) in scores:
+            ws.cell(row=row_idx, column=score_col).value = scores[str(rno)]
+    wb.save(path)
+
+    wb = openpyxl.load_workbook(path)
+    ws = wb.active
+    offer_col = ws.max_column + 1
+    ws.cell(row=1, column=offer_col).value = "제안문구"
+    for row_idx in range(2, ws.max_row + 1):
+        rno = ws.cell(row=row_idx, column=rno_col).value
+        if rno and str(rno) in offers:
+            ws.cell(row=row_idx, column=offer_col).value = offers[str(rno)]
+    wb.save(path)
+
+
+def bench_excel_update(rows: int = 50000):
+    """
+    결과 엑셀 점수/제안문구 기록: 기존 방식 vs ResultExcelUpdater (결과 일치 확인 포함)
+
+    Args:
+        rows: 엑셀 행 수
+    """
+    import openpyxl
+
+    print(f"\n{'='*60}")
+    print(f"📊 엑셀 업데이트: {rows:,}행")
+    print(f"{'='*60}")
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(work_dir, "source.xlsx")
+        scores, offers = _synthetic_result_excel(source, rows)
+
+        legacy_path = os.path.join(work_dir, "legacy.xlsx")
+        shutil.copy(source, legacy_path)
+        started = time.perf_counter()
+        _legacy_excel_update(legacy_path, scores, offers)
+        legacy_seconds = time.perf_counter() - started
+
+        updater_path = os.path.join(work_dir, "updater.xlsx")
+        shutil.copy(source, updater_path)
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            ResultExcelUpdater(updater_path).update(scores=scores, offers=offers)
+        updater_seconds = time.perf_counter() - started
+
+        def read_values(path):
+            wb = openpyxl.load_workbook(path, read_only=True)
+            values = [tuple(row) for row in wb.active.iter_rows(values_only=True)]
+            values = [row[:max((i + 1 for i, v in enumerate(row) if v is not None), default=0)] for row in values]
+            wb.close()
+            return values
+
+        same = read_values(legacy_path) == read_values(updater_path)
+
+        print(f"   기존 방식 (insert_cols + 로드/저장 2회): {legacy_seconds:.2f}초")
+        print(f"   일괄 업데이트 (로드/저장 1회):          {updater_seconds:.2f}초 ({legacy_seconds / updater_seconds:.1f}배)")
+        print(f"   결과 일치: {'✅ 전부 일치' if same else '❌ 불일치'}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def bench_offer_throughput(count: int = 200, latency: float = 0.05, error_rate: float = 0.0, rpm_limit: int = None):
+    """
+    제안문구 생성 처리량 (로컬 테스트 서버, API 키/비용 없음)
+
+    Args:
+        count: 생성 인원 (자기소개서/자격증이 있는 합성 후보자)
+        latency: 서버 응답 지연 (초)
+        error_rate: 서버 오류 주입 비율 (재시도/재시도 대기열 동작 확인용)
+        rpm_limit: 서버 분당 요청 한도 (None이면 제한 없음)
+    """
+    print(f"\n{'='*60}")
+    print(f"💬 제안문구 생성 처리량: {count}명 (응답 지연 {latency * 1000:.0f}ms, 오류 {error_rate:.0%})")
+    print(f"{'='*60}")
+
+    people = [c for c in synthetic_candidates(count * 3, seed=1) if PositionOfferGenerator.needs_llm(c)][:count]
+    modes = [
+        ("순차 (동시 1개)", {"max_concurrency": 1}),
+        ("동시 8개", {"max_concurrency": 8}),
+        ("동시 8개 + 5명 묶음 요청", {"max_concurrency": 8, "prompt_batch_size": 5}),
+    ]
+
+    for label, options in modes:
+        with MockLLMServer(latency=latency, error_rate=error_rate, rpm_limit=rpm_limit) as server:
+            generator = PositionOfferGenerator(
+                backend=HTTPBackend(server.base_url),
+                retry_policy=RetryPolicy(base_delay=latency, max_delay=1.0),
+                breaker=CircuitBreaker(cooldown=1.0),
+                **options
+            )
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                offers = generator.generate_offers([dict(p) for p in people])
+                generator.close()
+            elapsed = time.perf_counter() - started
+
+            failed = sum(1 for offer in offers if offer is None)
+            print(f"   {elapsed:6.2f}초 ({len(people) / elapsed:6.1f}명/초, 요청 {server.stats['requests']:>3}회, "
+                  f"재시도 {generator.telemetry.retries}회, 실패 {failed}명) - {label}")
+
+
+def main():
+    """메인 실행"""
+    bench_keyword_matcher()
+    bench_intro_scoring()
+    bench_batch_scoring()
+    bench_parallel_grading()
+    bench_excel_update()
+    bench_offer_throughput()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,45 +4,68 @@ grade.js를 Python으로 변환
 입력: kspac2022_with_introduction.json
 출력: kspac2022_scored.json (점수 필터링된 결과)
 """
+import hashlib
 import json
+import os
 import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+
+from src.excel_updater import ResultExcelUpdater
+from src.json_stream import JsonArrayWriter, iter_chunks, iter_json_array
+from src.keyword_matcher import FIELD_SEPARATOR, FOLD_VERSION, KeywordMatcher, fold_normalize
+from src.scoring_rules import DEFAULT_RULES_PATH, DEFAULT_RULES_SHEET, RulesWatcher, ScoringRules, load_rules
+
+
+# 최소 합격 점수 (Detail.py 점수 상한 필터링도 같은 기준 사용)
+MIN_SCORE = 30
 
 
 class CandidateScorer:
     """채용 후보자 점수 계산기"""
 
-    # 키워드 사전
-    KW = {
-        "insuranceSales": ["보험 영업", "보험영업", "보험상품", "설계사", "FP", "GA", "생명보험", "손해보험", "보장 분석", "보장설계", "종합재무설계", "리모델링"],
-        "financeSales": ["금융 영업", "금융상품", "자산관리", "PB", "WM", "펀드", "증권", "투자", "대출상담", "카드영업", "지점 영업"],
-        "generalSales": ["영업", "세일즈", "판매", "B2B 영업", "B2C 영업", "영업관리", "상담원", "상담", "텔레마케팅", "TM", "영업지원", "영업기획", "고객유치", "가망고객", "리드", "콜"],
-        "indirectSales": ["고객응대", "CS", "시장조사", "프로모션", "홍보", "행사 운영", "매장관리", "판촉"],
-        "activity": ["동아리", "인턴", "대외활동", "프로젝트", "공모전", "서포터즈", "홍보대사"],
-        "commStrong": ["고객 니즈", "니즈 파악", "경청", "문제 해결", "클레임", "VOC", "고객 만족", "재구매", "추천", "관계 형성", "관계관리", "상담 스크립트", "컨설팅", "제안", "설득"],
-        "commMedium": ["소통", "협업", "커뮤니케이션", "팀워크", "협력", "친화력", "긍정", "배려", "설명"],
-        "certHigh": ["손해사정사", "AFPK", "CFP", "투자자산운용사", "증권투자권유대행인", "파생상품투자권유자문인력", "보험계리사"],
-        "certBasic": ["보험 모집인", "생명보험 모집인", "손해보험 모집인", "펀드투자권유대행인", "펀드투자상담사", "은행FP", "퇴직연금", "신용분석사"],
-        "certLight": ["운전면허", "2종보통", "1종보통", "CS리더스", "MOS"],
-        "majorFinance": ["금융", "경제", "경영", "보험", "재무", "회계", "금융공학", "보험계리", "비즈니스"],
-        "eduFinance": ["금융 교육", "펀드 교육", "자산관리 교육", "세일즈 교육", "세일즈 트레이닝", "상담 스킬", "세일즈 아카데미", "콜 교육", "FP 교육"],
-        "motiveStrong": ["보험 산업", "보험업", "GA 채널", "모집질서", "준법", "소비자보호", "보장분석", "리드관리", "고객발굴", "리텐션", "리쿠르팅", "월납", "보장성", "인바운드/아웃바운드", "컨설팅영업"],
-        "motiveWeak": ["성장", "열정", "도전", "문제 해결", "목표", "성과", "책임감", "자기계발"],
-        "langNames": ["TOEIC", "토익", "OPIC", "OPIc", "오픽", "TOEFL", "IELTS"]
+    # 채점 텍스트 구성 (이름 → 사용하는 필드)
+    TEXT_FIELDS = {
+        "exp": ["경력", "제목", "직무", "기술스택"],   # 영업 경력
+        "job": ["직무"],                              # 지원 분야
+        "cert": ["자격증", "기술스택"],               # 자격증
+        "edu": ["학력", "제목"],                      # 학력/교육
+        "lang": ["기술스택"],                         # 어학
+        "intro": ["자기소개서"],                      # 자기소개서 (커뮤니케이션/동기)
     }
 
-    # 정규식 패턴
-    RX = {
-        "numberHit": re.compile(r'(\d{2,}\s*(%|건|명|회|개|만원|억|개월|주|일))|(\+\d{1,}%)', re.IGNORECASE),
-        "toeic": re.compile(r'(TOEIC|토익)\s*[:\-]?\s*(\d{3,4})', re.IGNORECASE),
-        "opic": re.compile(r'(OPIC|OPIc|오픽)\s*[:\-]?\s*([AIL]\w?)', re.IGNORECASE)
-    }
+    # 상세정보 페이지에서만 얻는 필드 (요약에는 없음 → 점수 상한 계산 시 최대 점수로 가정)
+    DETAIL_FIELDS = ("자기소개서", "자격증")
+
+    # 채점 결과로 후보자에 추가하는 필드 (Detail.py가 결과 JSON을 다시 만들 때 유지)
+    SCORE_FIELDS = ("점수상세", "채점키")
+
+    def __init__(self, rules_path: str = DEFAULT_RULES_PATH, sheet_name: str = DEFAULT_RULES_SHEET):
+        """
+        Args:
+            rules_path: 채점 규칙 파일 (.json 또는 설정 엑셀의 '채점규칙' 시트)
+            sheet_name: 엑셀일 때 규칙 시트명
+        """
+        # 규칙은 내용 해시 기준으로 1회 컴파일, 파일이 바뀌면 자동 재로드
+        self.rules_watcher = RulesWatcher(rules_path, sheet_name)
+
+    @property
+    def rules(self) -> ScoringRules:
+        """현재 채점 규칙 (키워드 사전/정규식/배점)"""
+        return self.rules_watcher.current()
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        """현재 규칙의 키워드 매처"""
+        return self.rules.matcher
 
     @staticmethod
     def normalize(text: str) -> str:
-        """텍스트 정규화"""
-        return str(text).lower().strip()
+        """텍스트 정규화 (소문자 + 공백/문장부호 접기, 키워드와 동일 기준)"""
+        return fold_normalize(text)
 
     @staticmethod
     def has_any(text: str, keywords: List[str]) -> bool:
@@ -75,128 +98,141 @@ class CandidateScorer:
                 texts.append(item["자격증명"])
         return " ".join(texts)
 
-    def score_sales_exp(self, candidate: Dict) -> int:
+    def features(self, candidate: Dict, rules: ScoringRules = None) -> "CandidateFeatures":
+        """후보자 채점용 특징 객체 생성 (rules가 None이면 현재 규칙)"""
+        return CandidateFeatures(candidate, self, rules)
+
+    def score_sales_exp(self, features: "CandidateFeatures") -> int:
         """영업 경력 점수 (최대 30점)"""
-        # 텍스트 수집
-        exp_text = " ".join([
-            str(candidate.get("경력", "")),
-            str(candidate.get("제목", "")),
-            str(candidate.get("직무", "")),
-            str(candidate.get("기술스택", ""))
-        ])
+        points = features.rules.points["sales"]
+        exp_hits = features.hits("exp")
+        number_hit = features.number_hit
 
         # 활동 여부
-        act_hit = self.has_any(exp_text, self.KW["activity"]) or self.RX["numberHit"].search(exp_text)
+        act_hit = "activity" in exp_hits or number_hit
 
         # 기본 점수
         base = 0
-        if self.has_any(exp_text, self.KW["insuranceSales"]) or self.has_any(exp_text, self.KW["financeSales"]):
-            base = 20
-        elif self.has_any(exp_text, self.KW["generalSales"]):
-            base = 15
-        elif self.has_any(exp_text, self.KW["indirectSales"]):
-            base = 10
+        if exp_hits & {"insuranceSales", "financeSales"}:
+            base = points["insuranceFinance"]
+        elif "generalSales" in exp_hits:
+            base = points["general"]
+        elif "indirectSales" in exp_hits:
+            base = points["indirect"]
 
         # 활동 점수
         activity = 0
         if act_hit:
-            activity = 5 if self.RX["numberHit"].search(exp_text) else 3
+            activity = points["activityNumber"] if number_hit else points["activity"]
 
-        exp_25 = min(25, base + activity)
+        exp_25 = min(points["expCap"], base + activity)
 
         # 지원 분야 점수
-        job_field = str(candidate.get("직무", ""))
+        job_hits = features.hits("job")
         job_5 = 0
-        if self.has_any(job_field, self.KW["insuranceSales"] + self.KW["financeSales"]):
-            job_5 = 5
-        elif self.has_any(job_field, self.KW["generalSales"]):
-            job_5 = 3
+        if job_hits & {"insuranceSales", "financeSales"}:
+            job_5 = points["jobInsuranceFinance"]
+        elif "generalSales" in job_hits:
+            job_5 = points["jobGeneral"]
 
         return exp_25 + job_5
 
-    def score_customer_comm(self, candidate: Dict) -> int:
-        """고객 커뮤니케이션 점수 (최대 5점) - 자기소개서 제거됨"""
-        # 자기소개서 관련 점수는 0점
+    def score_customer_comm(self, features: "CandidateFeatures") -> int:
+        """고객 커뮤니케이션 점수 (최대 25점)"""
+        points = features.rules.points["comm"]
+
+        # 자기소개서 점수 (자기소개서 전체를 1회 스캔한 결과 재사용)
+        intro_hits = features.hits("intro")
         comm_20 = 0
+        if "commStrong" in intro_hits:
+            comm_20 = points["commStrong"]
+        elif "commMedium" in intro_hits:
+            comm_20 = points["commMedium"]
 
         # 인재상 점수 (없음)
         fit_5 = 0
 
         return comm_20 + fit_5
 
-    def score_specialization(self, candidate: Dict) -> int:
+    @staticmethod
+    def score_cert(cert_hits: set, rules: ScoringRules) -> int:
+        """자격증 점수 (최대 20점)"""
+        points = rules.points["cert"]
+        for group in ("certHigh", "certBasic", "certLight"):
+            if group in cert_hits:
+                return points[group]
+        return 0
+
+    def score_specialization(self, features: "CandidateFeatures") -> int:
         """전문성 점수 (최대 30점)"""
-        # 자격증 텍스트
-        cert_text = self.extract_cert_text(candidate.get("자격증"))
-        cert_text += " " + str(candidate.get("기술스택", ""))
-
-        # 학력 텍스트
-        edu_text = str(candidate.get("학력", "")) + " " + str(candidate.get("제목", ""))
-
-        # 자격증 점수
-        cert_20 = 0
-        if self.has_any(cert_text, self.KW["certHigh"]):
-            cert_20 = 20
-        elif self.has_any(cert_text, self.KW["certBasic"]):
-            cert_20 = 10
-        elif self.has_any(cert_text, self.KW["certLight"]):
-            cert_20 = 2
-
-        # 학력/교육 점수
+        # 자격증 점수 (자격증명 + 기술스택)
+        cert_20 = self.score_cert(features.hits("cert"), features.rules)
+
+        # 학력/교육 점수 (학력 + 제목)
+        points = features.rules.points["edu"]
+        edu_hits = features.hits("edu")
         edu_10 = 0
-        if self.has_any(edu_text, self.KW["majorFinance"]) or self.has_any(edu_text, self.KW["eduFinance"]):
-            edu_10 = 10
-        elif self.has_any(edu_text, ["경제원론", "재무회계", "마케팅", "금융상품"]):
-            edu_10 = 5
+        if edu_hits & {"majorFinance", "eduFinance"}:
+            edu_10 = points["finance"]
+        elif "eduBasic" in edu_hits:
+            edu_10 = points["basic"]
 
         return cert_20 + edu_10
 
-    def score_motivation_and_lang(self, candidate: Dict) -> int:
-        """동기 및 어학 점수 (최대 5점) - 자기소개서 제거됨"""
-        # 자기소개서 관련 점수는 0점
-        mot_10 = 0
+    def score_motivation_and_lang(self, features: "CandidateFeatures") -> int:
+        """동기 및 어학 점수 (최대 15점)"""
+        points = features.rules.points["lang"]
 
-        # 어학 텍스트
-        lang_text = str(candidate.get("기술스택", ""))
+        # 지원 동기 점수 (자기소개서)
+        motive = features.rules.points["motive"]
+        intro_hits = features.hits("intro")
+        mot_10 = 0
+        if "motiveStrong" in intro_hits:
+            mot_10 = motive["motiveStrong"]
+        elif "motiveWeak" in intro_hits:
+            mot_10 = motive["motiveWeak"]
 
         # 어학 점수
         lang_5 = 0
 
-        # TOEIC 확인
-        toeic_match = self.RX["toeic"].search(lang_text)
-        if toeic_match:
-            toeic = int(toeic_match.group(2))
-            if toeic >= 900:
-                lang_5 = 5
-            elif toeic >= 700:
-                lang_5 = 3
-            elif toeic >= 600:
-                lang_5 = 1
+        # TOEIC 확인 (높은 기준부터)
+        toeic = features.toeic_score
+        if toeic is not None:
+            for threshold, score in points["toeic"]:
+                if toeic >= threshold:
+                    lang_5 = score
+                    break
 
         # OPIC 확인
         if lang_5 == 0:
-            opic_match = self.RX["opic"].search(lang_text)
-            if opic_match:
-                opic_level = opic_match.group(2).upper()
+            opic_level = features.opic_level
+            if opic_level is not None:
                 if re.search(r'AL|IH', opic_level):
-                    lang_5 = 5
+                    lang_5 = points["opicHigh"]
                 elif 'IM' in opic_level:
-                    lang_5 = 3
+                    lang_5 = points["opicMid"]
                 else:
-                    lang_5 = 1
+                    lang_5 = points["opicLow"]
 
         # 기타 어학 점수
-        if lang_5 == 0 and self.has_any(lang_text, self.KW["langNames"]):
-            lang_5 = 1
+        if lang_5 == 0 and "langNames" in features.hits("lang"):
+            lang_5 = points["langName"]
 
         return mot_10 + lang_5
 
-    def calculate_score(self, candidate: Dict) -> Dict:
-        """총점 계산"""
-        sales_exp = self.score_sales_exp(candidate)
-        customer_comm = self.score_customer_comm(candidate)
-        specialization = self.score_specialization(candidate)
-        motivation_lang = self.score_motivation_and_lang(candidate)
+    def calculate_score(self, candidate) -> Dict:
+        """
+        총점 계산
+
+        Args:
+            candidate: 후보자 딕셔너리 또는 CandidateFeatures
+        """
+        features = candidate if isinstance(candidate, CandidateFeatures) else self.features(candidate)
+
+        sales_exp = self.score_sales_exp(features)
+        customer_comm = self.score_customer_comm(features)
+        specialization = self.score_specialization(features)
+        motivation_lang = self.score_motivation_and_lang(features)
 
         total = sales_exp + customer_comm + specialization + motivation_lang
 
@@ -208,108 +244,220 @@ class CandidateScorer:
             "총점": total
         }
 
+    def scoring_key(self, candidate: Dict, rules: ScoringRules = None) -> str:
+        """
+        채점 입력 키 (채점기가 읽는 필드 + 규칙 버전 + 접기 규칙 버전의 해시)
+
+        Args:
+            candidate: 후보자 딕셔너리
+            rules: 채점 규칙 (None이면 현재 규칙)
+
+        Returns:
+            해시 문자열 (입력 필드나 규칙이 바뀌면 달라짐)
+        """
+        rules = rules or self.rules
+        fields = sorted({field for fields in self.TEXT_FIELDS.values() for field in fields})
+        payload = json.dumps(
+            [rules.version_key, FOLD_VERSION] + [candidate.get(field) for field in fields],
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def update_score(self, candidate: Dict) -> bool:
+        """
+        후보자 점수상세/채점키 갱신 (입력과 규칙이 그대로면 기존 점수 재사용)
+
+        Args:
+            candidate: 후보자 딕셔너리 (점수상세, 채점키가 추가/갱신됨)
+
+        Returns:
+            기존 점수 재사용 여부
+        """
+        features = self.features(candidate)
+        key = self.scoring_key(candidate, features.rules)
+        if candidate.get("채점키") == key and "점수상세" in candidate:
+            return True
+
+        candidate["점수상세"] = self.calculate_score(features)
+        candidate["채점키"] = key
+        return False
 
-def update_excel_with_scores(excel_path: str, candidates: List[Dict]):
-    """
-    기존 엑셀 파일에 점수 컬럼 추가
+    def detail_headroom(self, rules: ScoringRules = None) -> int:
+        """
+        상세정보(자격증/자기소개서)로 추가될 수 있는 최대 점수
+        (기본 규칙: 20 + 20 + 10 = 50점, MIN_SCORE 이상이므로 기본 설정에서는 점수 상한 필터링으로 제외되는 이력서 없음)
 
-    Args:
-        excel_path: 엑셀 파일 경로
-        candidates: 점수가 포함된 후보자 리스트
-    """
-    import openpyxl
-    from openpyxl.styles import Font, Alignment
+        Args:
+            rules: 채점 규칙 (None이면 현재 규칙)
 
-    # 이력서번호 → 점수 매핑
-    score_map = {}
-    for candidate in candidates:
-        rno = candidate.get("이력서번호")
-        if rno and "점수상세" in candidate:
-            score_map[str(rno)] = candidate["점수상세"]["총점"]
+        Returns:
+            자격증 최대 점수 + 커뮤니케이션/동기 최대 점수
+        """
+        points = (rules or self.rules).points
+        return max(points["cert"].values()) + max(points["comm"].values()) + max(points["motive"].values())
 
-    # 엑셀 파일 열기
-    if not Path(excel_path).exists():
-        print(f"⚠️  엑셀 파일을 찾을 수 없습니다: {excel_path}")
-        return
+    def upper_bound_score(self, candidate: Dict) -> int:
+        """
+        요약 정보만으로 계산한 총점 상한
+        (상세정보가 있더라도 이 점수를 넘을 수 없음)
 
-    wb = openpyxl.load_workbook(excel_path)
-    ws = wb.active
+        - 요약 필드로 정해지는 점수는 그대로 계산
+        - 상세정보 필드가 들어가는 점수(자격증, 자기소개서)만 최대 점수로 가정
 
-    # 헤더 찾기
-    headers = [cell.value for cell in ws[1]]
+        Args:
+            candidate: 요약 레코드 (main.py 출력)
 
-    # "점수" 컬럼이 이미 있는지 확인
-    if "점수" in headers:
-        print(f"⚠️  '점수' 컬럼이 이미 존재합니다. 기존 점수를 업데이트합니다.")
-        score_col_idx = headers.index("점수") + 1
-    else:
-        # "나이" 컬럼 위치 찾기
-        if "나이" not in headers:
-            print(f"⚠️  '나이' 컬럼을 찾을 수 없습니다.")
-            return
+        Returns:
+            총점 상한
+        """
+        summary = {k: v for k, v in candidate.items() if k not in self.DETAIL_FIELDS}
+        features = self.features(summary)
+        total = self.calculate_score(features)["총점"]
 
-        age_col_idx = headers.index("나이") + 1  # openpyxl은 1-based index
+        # 자격증(자격증명 + 기술스택): 요약(기술스택)만으로 얻은 점수 → 최대 점수로 교체
+        # 자기소개서: 요약에는 없으므로 커뮤니케이션/동기 점수는 0 → 최대 점수 가산
+        cert_from_summary = self.score_cert(features.hits("cert"), features.rules)
+        return total - cert_from_summary + self.detail_headroom(features.rules)
 
-        # "점수" 컬럼 삽입 (나이 다음)
-        score_col_idx = age_col_idx + 1
-        ws.insert_cols(score_col_idx)
 
-        # 헤더 추가
-        ws.cell(row=1, column=score_col_idx).value = "점수"
-        ws.cell(row=1, column=score_col_idx).font = Font(bold=True)
-        ws.cell(row=1, column=score_col_idx).alignment = Alignment(horizontal='center')
+class CandidateFeatures:
+    """
+    후보자 1명의 채점용 특징
 
-        # 헤더 다시 읽기 (컬럼 삽입 후)
-        headers = [cell.value for cell in ws[1]]
+    - 각 필드는 1회만 정규화
+    - 필드 조합별 키워드 그룹 스캔/정규식 검사도 1회만 수행하고 결과 캐시
+    - 모든 채점 항목이 이 객체를 공유하므로 규칙이 늘어도 추가 비용은 거의 없음
+    - 생성 시점의 규칙을 고정 (채점 도중 규칙이 재로드되어도 후보자 1명은 같은 규칙으로 채점)
+    """
 
-    # 이력서번호 컬럼 위치 찾기
-    rno_col_idx = None
-    if "이력서번호" in headers:
-        rno_col_idx = headers.index("이력서번호") + 1
+    def __init__(self, candidate: Dict, scorer: CandidateScorer, rules: ScoringRules = None):
+        """
+        Args:
+            candidate: 후보자 딕셔너리
+            scorer: 매처/정규식을 가진 채점기
+            rules: 채점 규칙 (None이면 채점기의 현재 규칙)
+        """
+        self.candidate = candidate
+        self.scorer = scorer
+        self.rules = rules or scorer.rules
+        self._raw = {}
+        self._normalized = {}
+        self._hits = {}
+        self._regex = {}
+
+    def with_rules(self, rules: ScoringRules) -> "CandidateFeatures":
+        """
+        다른 규칙으로 채점하는 특징 객체 (정규화/키워드 스캔/정규식 결과 공유)
+
+        Args:
+            rules: 채점 규칙 (배점만 바뀐 변형이면 스캔 결과를 그대로 재사용)
+        """
+        view = CandidateFeatures(self.candidate, self.scorer, rules)
+        view._raw = self._raw
+        view._normalized = self._normalized
+        if rules.matcher is self.rules.matcher:
+            view._hits = self._hits
+        if rules.regex is self.rules.regex:
+            view._regex = self._regex
+        return view
+
+    def raw(self, field: str) -> str:
+        """필드 원문 (자격증/자기소개서는 항목 텍스트를 이어붙인 텍스트)"""
+        if field not in self._raw:
+            if field == "자격증":
+                self._raw[field] = CandidateScorer.extract_cert_text(self.candidate.get("자격증"))
+            elif field == "자기소개서":
+                self._raw[field] = CandidateScorer.extract_intro_text(self.candidate.get("자기소개서"))
+            else:
+                self._raw[field] = str(self.candidate.get(field, ""))
+        return self._raw[field]
+
+    def normalized(self, field: str) -> str:
+        """필드 정규화 결과 (필드당 1회, 공백/문장부호 접기)"""
+        if field not in self._normalized:
+            self._normalized[field] = fold_normalize(self.raw(field))
+        return self._normalized[field]
+
+    def text(self, name: str) -> str:
+        """채점 텍스트 원문 (정규식 검사용)"""
+        return " ".join(self.raw(field) for field in self.scorer.TEXT_FIELDS[name])
+
+    def hits(self, name: str) -> set:
+        """채점 텍스트에 등장한 키워드 그룹 (텍스트당 1회 스캔)"""
+        if name not in self._hits:
+            text = FIELD_SEPARATOR.join(self.normalized(field) for field in self.scorer.TEXT_FIELDS[name])
+            self._hits[name] = self.rules.matcher.scan_normalized(text)
+        return self._hits[name]
+
+    def _search(self, rx_name: str, text_name: str):
+        """정규식 검사 결과 캐시"""
+        key = (rx_name, text_name)
+        if key not in self._regex:
+            self._regex[key] = self.rules.regex[rx_name].search(self.text(text_name))
+        return self._regex[key]
+
+    @property
+    def number_hit(self) -> bool:
+        """영업 경력 텍스트에 수치 성과 표현이 있는지"""
+        return self._search("numberHit", "exp") is not None
+
+    @property
+    def toeic_score(self) -> Optional[int]:
+        """TOEIC 점수 (없으면 None)"""
+        match = self._search("toeic", "lang")
+        return int(match.group(2)) if match else None
+
+    @property
+    def opic_level(self) -> Optional[str]:
+        """OPIC 등급 (없으면 None)"""
+        match = self._search("opic", "lang")
+        return match.group(2).upper() if match else None
 
-    if not rno_col_idx:
-        print(f"⚠️  '이력서번호' 컬럼을 찾을 수 없습니다.")
-        return
 
-    # 각 행에 점수 입력
-    updated_count = 0
-    for row_idx in range(2, ws.max_row + 1):
-        rno = ws.cell(row=row_idx, column=rno_col_idx).value
-        if rno and str(rno) in score_map:
-            score = score_map[str(rno)]
-            ws.cell(row=row_idx, column=score_col_idx).value = score
-            ws.cell(row=row_idx, column=score_col_idx).alignment = Alignment(horizontal='center')
-            updated_count += 1
+def update_excel_with_scores(excel_path: str, candidates: List[Dict]):
+    """
+    기존 엑셀 파일에 점수 컬럼 추가 ("나이" 다음, 이미 있으면 업데이트)
 
-    # 점수 컬럼 너비 조정
-    ws.column_dimensions[openpyxl.utils.get_column_letter(score_col_idx)].width = 10
+    Args:
+        excel_path: 엑셀 파일 경로
+        candidates: 점수가 포함된 후보자 리스트
+    """
+    # 이력서번호 → 점수 매핑
+    score_map = {}
+    for candidate in candidates:
+        rno = candidate.get("이력서번호")
+        if rno and "점수상세" in candidate:
+            score_map[str(rno)] = candidate["점수상세"]["총점"]
 
-    # 저장
-    wb.save(excel_path)
-    print(f"\n📊 엑셀 파일 업데이트 완료!")
-    print(f"   파일: {excel_path}")
-    print(f"   점수 입력: {updated_count}개 행")
+    ResultExcelUpdater(excel_path).update(scores=score_map)
 
 
 def grade_candidates(
     input_json: str,
     output_json: str,
     excel_path: str = None,
-    min_score: int = 30
-):
+    min_score: int = MIN_SCORE,
+    rules_path: str = DEFAULT_RULES_PATH,
+    on_pass: Optional[Callable[[Dict], None]] = None
+) -> Optional[List[Dict]]:
     """
     후보자 채점 및 필터링
 
     Args:
         input_json: 입력 JSON 파일 (kspac2022_with_introduction.json)
         output_json: 출력 JSON 파일 (점수 필터링된 결과)
-        excel_path: 엑셀 파일 경로 (점수 컬럼 추가용)
+        excel_path: 엑셀 파일 경로 (점수 컬럼 추가용, None이면 엑셀은 그대로)
         min_score: 최소 합격 점수 (기본 30점)
+        rules_path: 채점 규칙 파일
+        on_pass: 합격자가 나올 때마다 바로 호출 (후보자) - 제안문구 생성 파이프라인용
+
+    Returns:
+        점수가 포함된 전체 후보자 리스트 (입력 파일이 없으면 None)
     """
     # 입력 파일 로드
     if not Path(input_json).exists():
         print(f"❌ 파일을 찾을 수 없습니다: {input_json}")
-        return
+        return None
 
     with open(input_json, 'r', encoding='utf-8') as f:
         candidates = json.load(f)
@@ -317,30 +465,33 @@ def grade_candidates(
     print(f"📋 총 {len(candidates)}명 채점 시작")
     print(f"🎯 합격 기준: {min_score}점 이상\n")
 
-    scorer = CandidateScorer()
+    scorer = CandidateScorer(rules_path)
+    print(f"📐 채점 규칙: {scorer.rules.source} (버전 {scorer.rules.version_key})\n")
     passed_candidates = []
     failed_count = 0
+    reused_count = 0  # 입력/규칙이 그대로라 기존 점수를 재사용한 인원
     all_candidates_with_score = []  # 모든 후보자 (엑셀 업데이트용)
 
-    # 각 후보자 채점
+    # 각 후보자 채점 (채점키가 같으면 기존 점수 재사용)
     for idx, candidate in enumerate(candidates, 1):
         name = candidate.get("이름", "Unknown")
 
-        # 점수 계산
-        scores = scorer.calculate_score(candidate)
-        total_score = scores["총점"]
-
-        # 점수 추가
-        candidate["점수상세"] = scores
+        reused = scorer.update_score(candidate)
+        if reused:
+            reused_count += 1
+        total_score = candidate["점수상세"]["총점"]
         all_candidates_with_score.append(candidate)
+        mark = " ♻️" if reused else ""
 
         # 합격/불합격 판정
         if total_score >= min_score:
             passed_candidates.append(candidate)
-            print(f"[{idx}/{len(candidates)}] ✅ {name} - {total_score}점 (합격)")
+            print(f"[{idx}/{len(candidates)}] ✅ {name} - {total_score}점 (합격){mark}")
+            if on_pass:
+                on_pass(candidate)
         else:
             failed_count += 1
-            print(f"[{idx}/{len(candidates)}] ❌ {name} - {total_score}점 (불합격)")
+            print(f"[{idx}/{len(candidates)}] ❌ {name} - {total_score}점 (불합격){mark}")
 
     # 점수 순으로 정렬
     passed_candidates.sort(key=lambda x: x["점수상세"]["총점"], reverse=True)
@@ -355,6 +506,7 @@ def grade_candidates(
     print(f"   합격: {len(passed_candidates)}명")
     print(f"   불합격: {failed_count}명")
     print(f"   합격률: {len(passed_candidates)/len(candidates)*100:.1f}%")
+    print(f"   재사용: {reused_count}명 (입력/규칙 변경 없음), 재채점: {len(candidates) - reused_count}명")
     print(f"\n💾 저장: {output_json}")
     print(f"{'='*60}")
 
@@ -362,10 +514,216 @@ def grade_candidates(
     if excel_path:
         update_excel_with_scores(excel_path, all_candidates_with_score)
 
-    # 원본 JSON 파일도 점수 업데이트 (position_offer.py에서 사용)
+    # 원본 JSON 파일도 점수 업데이트 (position_offer.py에서 사용) - 바뀐 점수가 있을 때만
+    if reused_count == len(candidates):
+        print(f"\n⏭️  원본 JSON 변경 없음: {input_json}")
+        return all_candidates_with_score
+
     with open(input_json, 'w', encoding='utf-8') as f:
         json.dump(all_candidates_with_score, f, ensure_ascii=False, indent=2)
     print(f"\n💾 원본 JSON 업데이트: {input_json} (점수 포함)")
+    return all_candidates_with_score
+
+
+_worker_scorer = None
+
+
+def _init_grade_worker(rules_path: str):
+    """병렬 채점 워커 초기화 (프로세스마다 채점기 1회 생성)"""
+    global _worker_scorer
+    _worker_scorer = CandidateScorer(rules_path)
+
+
+def _grade_chunk(chunk: List[Dict]) -> tuple:
+    """
+    후보자 묶음 채점 (워커 프로세스에서 실행)
+
+    Returns:
+        (점수가 추가된 묶음, 기존 점수 재사용 인원)
+    """
+    reused = sum(1 for candidate in chunk if _worker_scorer.update_score(candidate))
+    return chunk, reused
+
+
+def grade_candidates_parallel(
+    input_json: str,
+    output_json: str,
+    excel_path: str = None,
+    min_score: int = MIN_SCORE,
+    workers: int = None,
+    chunk_size: int = 2000,
+    rules_path: str = DEFAULT_RULES_PATH
+):
+    """
+    대용량 후보자 파일 병렬 채점
+
+    - 입력 파일을 chunk_size명씩 스트리밍으로 읽어 프로세스 풀에 분배
+    - 메모리에는 합격자(점수 순)와 이력서번호→총점만 유지
+    - 점수가 추가된 전체 후보자는 입력 순서대로 임시 파일에 이어 쓴 뒤 원본 교체
+
+    Args:
+        input_json: 입력 JSON 파일
+        output_json: 출력 JSON 파일 (합격자만)
+        excel_path: 엑셀 파일 경로 (점수 컬럼 추가용)
+        min_score: 최소 합격 점수
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        chunk_size: 워커에 한 번에 넘길 후보자 수
+        rules_path: 채점 규칙 파일 (워커마다 로드, 변경 시 자동 재로드)
+    """
+    if not Path(input_json).exists():
+        print(f"❌ 파일을 찾을 수 없습니다: {input_json}")
+        return
+
+    workers = workers or os.cpu_count() or 1
+    rules = load_rules(rules_path)
+    print(f"📋 병렬 채점 시작 (워커 {workers}개, 묶음 {chunk_size}명)")
+    print(f"🎯 합격 기준: {min_score}점 이상")
+    print(f"📐 채점 규칙: {rules.source} (버전 {rules.version_key})\n")
+
+    started = time.perf_counter()
+    passed_candidates = []
+    score_map = {}  # 이력서번호 → 총점 (엑셀 업데이트용)
+    total_count = 0
+    reused_count = 0
+    tmp_path = input_json + ".tmp"
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_grade_worker,
+                             initargs=(rules_path,)) as executor, \
+            JsonArrayWriter(tmp_path) as writer:
+        in_flight = deque()
+
+        def collect_oldest():
+            """가장 먼저 보낸 묶음 결과 수집 (입력 순서 유지)"""
+            nonlocal reused_count
+            scored, reused = in_flight.popleft().result()
+            reused_count += reused
+            for candidate in scored:
+                writer.write(candidate)
+                total_score = candidate["점수상세"]["총점"]
+                rno = candidate.get("이력서번호")
+                if rno:
+                    score_map[str(rno)] = total_score
+                if total_score >= min_score:
+                    passed_candidates.append(candidate)
+            return len(scored)
+
+        for chunk in iter_chunks(iter_json_array(input_json), chunk_size):
+            in_flight.append(executor.submit(_grade_chunk, chunk))
+
+            # 처리 중인 묶음 수 제한 (메모리 사용량 고정)
+            if len(in_flight) >= workers * 2:
+                total_count += collect_oldest()
+                print(f"   ⏳ {total_count:,}명 채점 (합격 {len(passed_candidates):,}명)")
+
+        while in_flight:
+            total_count += collect_oldest()
+
+    # 바뀐 점수가 없으면 원본 유지
+    unchanged = reused_count == total_count
+    if unchanged:
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, input_json)
+    elapsed = time.perf_counter() - started
+
+    # 점수 순으로 정렬 후 저장 (합격자만)
+    passed_candidates.sort(key=lambda x: x["점수상세"]["총점"], reverse=True)
+    with open(output_json, 'w', encoding='utf-8') as f:
+        json.dump(passed_candidates, f, ensure_ascii=False, indent=2)
+
+    print(f"\n{'='*60}")
+    print(f"✅ 병렬 채점 완료!")
+    print(f"   총 인원: {total_count:,}명")
+    print(f"   합격: {len(passed_candidates):,}명")
+    print(f"   불합격: {total_count - len(passed_candidates):,}명")
+    if total_count:
+        print(f"   합격률: {len(passed_candidates)/total_count*100:.1f}%")
+    print(f"   재사용: {reused_count:,}명 (입력/규칙 변경 없음), 재채점: {total_count - reused_count:,}명")
+    print(f"   처리 속도: {total_count / elapsed:,.0f}명/초 ({elapsed:.2f}초)")
+    print(f"\n💾 저장: {output_json}")
+    if unchanged:
+        print(f"⏭️  원본 JSON 변경 없음: {input_json}")
+    else:
+        print(f"💾 원본 JSON 업데이트: {input_json} (점수 포함)")
+    print(f"{'='*60}")
+
+    # 엑셀 파일 업데이트 (모든 후보자 점수 추가)
+    if excel_path:
+        update_excel_with_scores(
+            excel_path,
+            [{"이력서번호": rno, "점수상세": {"총점": score}} for rno, score in score_map.items()]
+        )
+
+
+def sweep_thresholds(
+    input_json: str,
+    thresholds: List[int] = (20, 25, 30, 35, 40),
+    variants: Dict[str, Dict] = None,
+    rules_path: str = DEFAULT_RULES_PATH,
+    bin_size: int = 10
+) -> Dict[str, Dict]:
+    """
+    합격 기준/규칙 변형별 합격 인원 비교 (what-if, 파일 쓰기 없음)
+
+    - 후보자별 특징(정규화/키워드 스캔/정규식)은 1회만 계산하고 모든 변형이 공유
+    - 배점만 바꾼 변형은 추가 스캔 없이 점수 합산만 다시 수행
+
+    Args:
+        input_json: 입력 JSON 파일
+        thresholds: 비교할 합격 기준 점수 목록
+        variants: {변형 이름: {"points": {...}, "keywords": {...}}} (ScoringRules.with_overrides 형식)
+        rules_path: 기준 채점 규칙 파일
+        bin_size: 점수 분포 구간 크기
+
+    Returns:
+        {변형 이름: {"passed": {기준: 인원}, "histogram": {구간 시작: 인원}}}
+    """
+    if not Path(input_json).exists():
+        print(f"❌ 파일을 찾을 수 없습니다: {input_json}")
+        return {}
+
+    scorer = CandidateScorer(rules_path)
+    base_rules = scorer.rules
+    variant_rules = {"기본": base_rules}
+    for name, overrides in (variants or {}).items():
+        variant_rules[name] = base_rules.with_overrides(name, overrides)
+
+    started = time.perf_counter()
+    totals = {name: [] for name in variant_rules}
+    count = 0
+    for candidate in iter_json_array(input_json):
+        features = scorer.features(candidate, base_rules)
+        for name, rules in variant_rules.items():
+            view = features if rules is base_rules else features.with_rules(rules)
+            totals[name].append(scorer.calculate_score(view)["총점"])
+        count += 1
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*60}")
+    print(f"🔬 합격 기준 비교: {count:,}명 × 변형 {len(variant_rules)}개 ({elapsed:.2f}초)")
+    print(f"{'='*60}")
+
+    results = {}
+    for name, scores in totals.items():
+        passed = {threshold: sum(1 for score in scores if score >= threshold) for threshold in thresholds}
+        histogram = {}
+        for score in scores:
+            start = score // bin_size * bin_size
+            histogram[start] = histogram.get(start, 0) + 1
+        histogram = dict(sorted(histogram.items()))
+        results[name] = {"passed": passed, "histogram": histogram}
+
+        print(f"\n📐 {name} ({variant_rules[name].version_key})")
+        for threshold, passed_count in passed.items():
+            rate = passed_count / count * 100 if count else 0
+            print(f"   {threshold:>3}점 이상: {passed_count:>6,}명 ({rate:5.1f}%)")
+        peak = max(histogram.values(), default=0)
+        for start, bin_count in histogram.items():
+            bar = "█" * round(bin_count / peak * 30) if peak else ""
+            print(f"   {start:>3}~{start + bin_size - 1:<3}점 | {bar} {bin_count:,}")
+
+    print(f"{'='*60}")
+    return results
 
 
 def main():
@@ -373,9 +731,26 @@ def main():
     INPUT_FILE = "output/kspac2022_with_introduction.json"
     OUTPUT_FILE = "output/kspac2022_scored.json"
     EXCEL_FILE = "output/kspac2022_결과.xlsx"  # main.py에서 생성된 엑셀 파일
-    MIN_SCORE = 30  # 최소 합격 점수
+    RULES_FILE = DEFAULT_RULES_PATH  # 채점 규칙 (data/scoring_rules.json, 설정 엑셀의 '채점규칙' 시트도 가능: "configs/jobkorea_Excel.xlsx")
+
+    # 대용량 파일(수개월치 누적 등)은 병렬 채점 사용
+    PARALLEL = False  # True: 묶음 단위 스트리밍 + 프로세스 병렬 채점
+    WORKERS = None    # 병렬 워커 수 (None이면 CPU 코어 수)
+
+    # 합격 기준 튜닝: 파일을 쓰지 않고 기준/규칙 변형별 합격 인원과 점수 분포만 출력
+    SWEEP = False
+    SWEEP_THRESHOLDS = [20, 25, 30, 35, 40]
+    SWEEP_VARIANTS = {
+        "자격증가중": {"points": {"cert": {"certHigh": 25, "certBasic": 15}}},
+        "경력완화": {"points": {"sales": {"general": 20}}},
+    }
 
-    grade_candidates(INPUT_FILE, OUTPUT_FILE, EXCEL_FILE, MIN_SCORE)
+    if SWEEP:
+        sweep_thresholds(INPUT_FILE, SWEEP_THRESHOLDS, SWEEP_VARIANTS, rules_path=RULES_FILE)
+    elif PARALLEL:
+        grade_candidates_parallel(INPUT_FILE, OUTPUT_FILE, EXCEL_FILE, MIN_SCORE, workers=WORKERS, rules_path=RULES_FILE)
+    else:
+        grade_candidates(INPUT_FILE, OUTPUT_FILE, EXCEL_FILE, MIN_SCORE, rules_path=RULES_FILE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+"""
+채점 → 포지션 제안 문구 스트리밍 파이프라인
+grade.py 채점 중 합격자가 나오는 즉시 제안문구 생성 큐에 넣어 동시에 진행
+입력: kspac2022_with_introduction.json
+출력: kspac2022_scored.json, kspac2022_with_offers.json, 결과 엑셀(점수/제안문구)
+"""
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from grade import grade_candidates
+from position_offer import PositionOfferGenerator, offer_log_path, save_offer_results
+from src.checkpoint_log import CheckpointLog
+from src.circuit_breaker import CircuitBreaker
+from src.llm_backend import HTTPBackend
+from src.offer_cache import OfferCache
+from src.retry_policy import RetryPolicy
+from src.scoring_rules import DEFAULT_RULES_PATH
+
+
+# 채점 종료 표시
+_DONE = object()
+
+
+def _iter_queue(passed: queue.Queue, idle_seconds: float) -> Iterator[Optional[Tuple[int, Dict]]]:
+    """
+    합격자 큐 → 제안문구 생성 입력 스트림
+
+    Args:
+        passed: (인덱스, 후보자) 큐
+        idle_seconds: 이 시간 동안 새 합격자가 없으면 None (모아 둔 묶음 요청 전송)
+    """
+    while True:
+        try:
+            item = passed.get(timeout=idle_seconds)
+        except queue.Empty:
+            yield None
+            continue
+        if item is _DONE:
+            return
+        yield item
+
+
+def run_pipeline(
+    input_json: str,
+    scored_json: str,
+    offers_json: str,
+    excel_path: str,
+    generator: PositionOfferGenerator,
+    min_score: int = 30,
+    rules_path: str = DEFAULT_RULES_PATH,
+    idle_seconds: float = 0.5
+):
+    """
+    채점과 제안문구 생성을 동시에 실행
+
+    - 채점은 별도 스레드에서 진행, 합격자는 바로 큐로 전달
+    - 제안문구는 큐에서 꺼내는 대로 생성 (동시 요청/캐시/묶음 설정은 generator 그대로)
+    - 제안문구는 1명씩 로그에 추가 기록, 다시 실행하면 기록된 합격자는 큐에 넣지 않음 (지원자 정보가 같을 때)
+    - JSON/엑셀은 마지막에 1번만 저장 (엑셀은 점수/제안문구를 함께 기록)
+
+    Args:
+        input_json: 입력 JSON 파일 (채점 후 점수 포함으로 업데이트)
+        scored_json: 채점 결과 JSON (합격자만, 점수순)
+        offers_json: 제안문구 JSON (합격자만, 합격 순서)
+        excel_path: 결과 엑셀 파일 경로
+        generator: 제안문구 생성기
+        min_score: 최소 합격 점수
+        rules_path: 채점 규칙 파일
+        idle_seconds: 합격자가 이 시간 동안 없으면 모아 둔 묶음 요청을 바로 전송
+    """
+    passed = queue.Queue()
+    qualified: List[Dict] = []
+    graded = {"candidates": None, "error": None}
+    started = time.perf_counter()
+    first_offer = None
+
+    offer_log = CheckpointLog(offer_log_path(offers_json))
+    logged = generator.load_offer_log(offer_log)
+    restored = 0
+
+    def on_pass(candidate: Dict):
+        nonlocal restored
+        qualified.append(candidate)
+        if generator.restore_offer(candidate, logged):
+            restored += 1
+            return
+        passed.put((len(qualified) - 1, candidate))
+
+    def grade_worker():
+        try:
+            graded["candidates"] = grade_candidates(input_json, scored_json, None, min_score, rules_path, on_pass=on_pass)
+        except Exception as e:
+            graded["error"] = e
+        finally:
+            passed.put(_DONE)
+
+    def on_result(idx: int, candidate: Dict, offer_text: str):
+        nonlocal first_offer
+        if first_offer is None:
+            first_offer = time.perf_counter() - started
+        name = candidate.get("이름", "Unknown")
+        score = candidate.get("점수상세", {}).get("총점", 0)
+        print(f"   💬 [{idx + 1}] {name} ({score}점) 제안문구 생성")
+
+        # 제안 문구 추가 + 로그 기록
+        candidate["포지션제안문구"] = offer_text
+        generator.log_offer(offer_log, candidate, offer_text)
+
+    grader = threading.Thread(target=grade_worker, name="grade")
+    grader.start()
+    try:
+        generator.generate_offers_stream(_iter_queue(passed, idle_seconds), on_result)
+    finally:
+        offer_log.close()
+    generator.close()
+    grader.join()
+    generator.compact_offer_log(offer_log)
+
+    if graded["error"] is not None:
+        raise graded["error"]
+    candidates = graded["candidates"]
+    if candidates is None:
+        return
+
+    elapsed = time.perf_counter() - started
+    print(f"\n{'='*60}")
+    first = f" (첫 제안문구 {first_offer:.1f}초)" if first_offer is not None else ""
+    print(f"⏱️  파이프라인 완료: {elapsed:.1f}초{first}")
+    print(f"   합격자 {len(qualified)}명 (로그에서 복원 {restored}명, 새로 생성 {len(qualified) - restored}명)")
+    print(f"{'='*60}\n")
+
+    if not qualified:
+        print(f"⚠️  {min_score}점 이상인 사람이 없습니다.")
+        return
+
+    # JSON 저장 (합격자만) + 엑셀 점수/제안문구 1회 기록
+    save_offer_results(qualified, candidates, offers_json, excel_path, min_score)
+
+
+def main():
+    """메인 실행"""
+    INPUT_FILE = "output/kspac2022_with_introduction.json"  # Detail.py의 출력 (전체)
+    SCORED_FILE = "output/kspac2022_scored.json"
+    OFFERS_FILE = "output/kspac2022_with_offers.json"
+    EXCEL_FILE = "output/kspac2022_결과.xlsx"
+    MIN_SCORE = 30
+    RULES_FILE = DEFAULT_RULES_PATH  # 채점 규칙 (grade.py와 동일)
+
+    # 제안문구 생성 설정 (position_offer.py와 동일)
+    CONCURRENCY = 8
+    RPM_LIMIT = 500
+    TPM_LIMIT = 30000
+    CACHE_FILE = "output/offer_cache.jsonl"
+    BUCKET_OFFERS = True
+    PROMPT_BATCH_SIZE = 5
+    MAX_PROMPT_TOKENS = 900
+    LLM_BASE_URL = None  # OpenAI 호환 서버 주소 (None이면 OpenAI)
+
+    # 일시적 오류(429/5xx/연결) 재시도, 오류율 급증 시 전체 일시 정지
+    MAX_RETRIES = 4          # 요청 1건당 최대 재시도 (지수 백오프 + 지터, 429는 Retry-After 준수)
+    BREAKER_COOLDOWN = 30    # 최근 호출 절반 이상 실패 시 일시 정지 시간 (초)
+    DEFERRED_ROUNDS = 1      # 재시도까지 실패한 사람을 마지막에 다시 생성하는 횟수 (그래도 실패하면 비워 둠)
+    IDLE_SECONDS = 0.5  # 합격자가 이 시간 동안 없으면 모아 둔 묶음 요청 전송
+
+    try:
+        generator = PositionOfferGenerator(
+            max_concurrency=CONCURRENCY,
+            rpm_limit=RPM_LIMIT,
+            tpm_limit=TPM_LIMIT,
+            cache=OfferCache(CACHE_FILE),
+            bucket_offers=BUCKET_OFFERS,
+            prompt_batch_size=PROMPT_BATCH_SIZE,
+            max_prompt_tokens=MAX_PROMPT_TOKENS,
+            backend=HTTPBackend(LLM_BASE_URL, os.getenv("OPENAI_API_KEY_COMPANY")) if LLM_BASE_URL else None,
+            retry_policy=RetryPolicy(max_retries=MAX_RETRIES),
+            breaker=CircuitBreaker(cooldown=BREAKER_COOLDOWN),
+            deferred_rounds=DEFERRED_ROUNDS
+        )
+    except ValueError as e:
+        print(f"❌ 오류: {e}")
+        print("\n💡 OpenAI API 키 설정 방법:")
+        print("   환경변수: export OPENAI_API_KEY_COMPANY='sk-...'")
+        return
+
+    run_pipeline(INPUT_FILE, SCORED_FILE, OFFERS_FILE, EXCEL_FILE, generator,
+                 MIN_SCORE, RULES_FILE, idle_seconds=IDLE_SECONDS)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,24 @@
 포지션 제안 문구 생성
 자기소개서 + 자격증 정보를 기반으로 LLM이 맞춤형 제안 문구 생성
 """
+import hashlib
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, List
-from openai import OpenAI
-import openpyxl
-from openpyxl.styles import Font, Alignment
+from typing import Callable, Iterable, Optional, Dict, List, Tuple
+
+from src.checkpoint_log import CheckpointLog
+from src.circuit_breaker import CircuitBreaker
+from src.excel_updater import ResultExcelUpdater
+from src.llm_backend import HTTPBackend, LLMBackend, OpenAIBackend
+from src.llm_telemetry import LLMTelemetry
+from src.offer_cache import OfferCache
+from src.rate_limiter import RateLimiter
+from src.retry_policy import RetryPolicy
+from src.token_counter import TokenCounter
 
 
 class PositionOfferGenerator:
@@ -19,50 +30,152 @@ class PositionOfferGenerator:
 저희가 찾고있는 포지션에 적합한 인재라고 생각되어 이렇게 제안 드립니다.
 긍정적인 검토 부탁 드리며, 관련 자세한 내용이 궁금하시다면 응답기간 내 회신 부탁 드립니다."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    SYSTEM_PROMPT = "당신은 전문 채용 담당자입니다."
+
+    # 프롬프트 버전 (문구 자체는 서명에 자동 반영, 응답 처리 방식 등을 바꾸면 올려서 기존 제안문구 로그 무효화)
+    PROMPT_VERSION = 1
+
+    # 응답 토큰 예상치 (TPM 한도 계산용, 3-4문장)
+    COMPLETION_TOKENS = 300
+
+    # 모델별 100만 토큰당 가격 (USD, 요청/응답) - 캐시 절약 비용 계산용
+    MODEL_PRICES = {
+        "gpt-4o": (2.50, 10.00),
+        "gpt-4o-mini": (0.15, 0.60),
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o",
+        temperature: float = 0.7,
+        max_concurrency: int = 1,
+        rpm_limit: Optional[int] = None,
+        tpm_limit: Optional[int] = None,
+        offline: bool = False,
+        cache: Optional[OfferCache] = None,
+        bucket_offers: bool = False,
+        prompt_batch_size: int = 1,
+        max_prompt_tokens: int = 900,
+        backend: Optional[LLMBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        deferred_rounds: int = 1
+    ):
         """
         Args:
             api_key: OpenAI API 키 (None이면 환경변수에서 자동 로드)
+            model: 사용할 모델
+            temperature: 생성 온도
+            max_concurrency: 동시 요청 수 (1이면 순차 처리)
+            rpm_limit: 분당 최대 요청 수 (None이면 제한 없음)
+            tpm_limit: 분당 최대 토큰 수 (None이면 제한 없음)
+            offline: True면 API 클라이언트 없이 생성 (배치 요청 파일 작성/결과 반영만 할 때)
+            cache: 제안 문구 캐시 (같은 요청이면 API 호출 없이 재사용)
+            bucket_offers: True면 프롬프트 정보가 같은 사람끼리 묶어 1번만 생성하고 공유
+            prompt_batch_size: 한 번의 요청에 넣을 인원 (1이면 1명씩 요청)
+            max_prompt_tokens: 1명 요청의 프롬프트 토큰 예산 (시스템 프롬프트 포함, 자기소개서/자격증을 예산에 맞춰 줄임)
+            backend: LLM 호출 백엔드 (None이면 API 키로 OpenAIBackend 생성, 로컬 테스트 서버는 HTTPBackend)
+            retry_policy: 오류 분류/재시도 대기 (None이면 기본값: 최대 4회, 1초부터 지수 백오프)
+            breaker: 오류율 급증 시 전체 호출 일시 정지 (None이면 기본값: 최근 20건 중 50% 실패 시 30초)
+            deferred_rounds: 재시도를 모두 실패한 사람을 마지막에 다시 생성하는 횟수 (실패하면 제안문구를 비워 둠)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY_COMPANY")
-        if not self.api_key:
+        if backend is not None:
+            self.backend = backend
+        elif offline:
+            self.backend = None
+        elif not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다. 환경변수 OPENAI_API_KEY를 설정하거나 인자로 전달하세요.")
-
-        self.client = OpenAI(api_key=self.api_key)
-
-    def _create_prompt(self, person_data: Dict) -> str:
+        else:
+            self.backend = OpenAIBackend(self.api_key)
+        self.model = model
+        self.temperature = temperature
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = RateLimiter(rpm_limit, tpm_limit)
+        self.cache = cache
+        self.bucket_offers = bucket_offers
+        self.prompt_batch_size = max(1, prompt_batch_size)
+        self.telemetry = LLMTelemetry()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.deferred_rounds = deferred_rounds
+        self._task_state = threading.local()  # 요청 1건 안에서 LLM으로 생성한 사람 (묶음 절약 집계용)
+
+        # 프롬프트 토큰 예산 (지원자 정보를 뺀 고정 부분은 1번만 계산)
+        self.token_counter = TokenCounter(model)
+        self.max_prompt_tokens = max_prompt_tokens
+        frame = self._render_prompt({"career": "", "job": "", "intro_summary": "", "certs": []})
+        self._frame_tokens = self.token_counter.count(self.SYSTEM_PROMPT) + self.token_counter.count(frame)
+        self._prompt_hash = hashlib.sha1((self.SYSTEM_PROMPT + frame).encode("utf-8")).hexdigest()
+
+    def _prompt_inputs(self, person_data: Dict) -> Dict:
         """
-        LLM에게 전달할 프롬프트 생성
+        프롬프트에 들어가는 지원자 정보 추출
 
         Args:
             person_data: 개인 정보 (자기소개서, 자격증 포함)
 
         Returns:
-            프롬프트 문자열
+            {"career", "job", "intro_summary", "certs"}
         """
-        # 자기소개서 요약
-        intro_summary = ""
-        if person_data.get("자기소개서"):
-            intro_list = person_data["자기소개서"]
-            if intro_list and len(intro_list) > 0:
-                # 첫 번째 자기소개서만 사용 (길이 제한)
-                first_intro = intro_list[0].get("body_text", "")
-                if first_intro:
-                    # 너무 길면 앞부분만 (최대 500자)
-                    intro_summary = first_intro[:500]
-
-        # 자격증 요약
-        cert_summary = ""
-        if person_data.get("자격증"):
-            cert_list = person_data["자격증"]
-            if cert_list:
-                cert_names = [c.get("자격증명", "") for c in cert_list if c.get("자격증명")]
-                cert_summary = ", ".join(cert_names[:5])  # 최대 5개만
-
         # 기본 정보
         career = person_data.get("경력", "")
         job = person_data.get("직무", "")
+        count = self.token_counter.count
 
+        # 지원자 정보에 쓸 수 있는 토큰 (예산 - 고정 부분 - 경력/직무)
+        budget = self.max_prompt_tokens - self._frame_tokens - count(str(career)) - count(str(job))
+
+        # 자격증 요약 (앞에서부터 예산의 1/4까지)
+        cert_names = []
+        if person_data.get("자격증"):
+            cert_names = [c.get("자격증명", "") for c in person_data["자격증"] if c.get("자격증명")]
+        certs = []
+        cert_tokens = 0
+        for cert_name in cert_names:
+            cost = count(cert_name) + 1  # 구분자 ", "
+            if cert_tokens + cost > budget // 4:
+                break
+            certs.append(cert_name)
+            cert_tokens += cost
+
+        # 자기소개서 요약 (첫 번째 자기소개서, 남은 예산만큼 앞부분)
+        first_intro = ""
+        if person_data.get("자기소개서"):
+            first_intro = person_data["자기소개서"][0].get("body_text", "") or ""
+        intro_summary = self.token_counter.truncate(first_intro, budget - cert_tokens)
+
+        if len(certs) < len(cert_names) or len(intro_summary) < len(first_intro):
+            self.telemetry.record_truncated(str(person_data.get("이력서번호") or id(person_data)))
+
+        return {
+            "career": career,
+            "job": job,
+            "intro_summary": intro_summary,
+            "certs": certs,
+        }
+
+    # 프롬프트 요구사항 (단일/묶음 요청 공통)
+    PROMPT_REQUIREMENTS = """1. **기존 문구의 구조와 톤을 유지**하세요
+2. 지원자의 경력, 강점, 자격증을 **자연스럽게 1-2문장만 추가**하세요
+3. 너무 길지 않게 (전체 3-4문장)
+4. 존댓말 유지
+5. "한국중소기업진흥원"이라는 회사명은 유지
+6. **지원자의 이름은 절대 언급하지 마세요** (OO님, 귀하 등도 사용 금지)"""
+
+    @staticmethod
+    def _render_person(inputs: Dict) -> str:
+        """지원자 정보 항목 구성"""
+        intro_summary = inputs["intro_summary"]
+        cert_summary = ", ".join(inputs["certs"])
+        return f"""- 경력: {inputs["career"]}
+- 직무: {inputs["job"]}
+- 자기소개서 요약: {intro_summary if intro_summary else "(없음)"}
+- 자격증: {cert_summary if cert_summary else "(없음)"}"""
+
+    def _render_prompt(self, inputs: Dict) -> str:
+        """지원자 정보로 프롬프트 문자열 구성"""
         prompt = f"""당신은 채용 담당자입니다.
 아래 정보를 바탕으로 **기존 포지션 제안 문구를 조금만 수정**하여 맞춤형 제안 문구를 작성해주세요.
 
@@ -70,66 +183,668 @@ class PositionOfferGenerator:
 {self.BASE_TEMPLATE}
 
 ## 지원자 정보:
-- 경력: {career}
-- 직무: {job}
-- 자기소개서 요약: {intro_summary if intro_summary else "(없음)"}
-- 자격증: {cert_summary if cert_summary else "(없음)"}
+{self._render_person(inputs)}
 
 ## 요구사항:
-1. **기존 문구의 구조와 톤을 유지**하세요
-2. 지원자의 경력, 강점, 자격증을 **자연스럽게 1-2문장만 추가**하세요
-3. 너무 길지 않게 (전체 3-4문장)
-4. 존댓말 유지
-5. "한국중소기업진흥원"이라는 회사명은 유지
-6. **지원자의 이름은 절대 언급하지 마세요** (OO님, 귀하 등도 사용 금지)
+{self.PROMPT_REQUIREMENTS}
 
 ## 출력 형식:
 수정된 제안 문구만 출력하세요. 부연 설명 없이."""
 
         return prompt
 
-    def generate_offer(self, person_data: Dict) -> str:
+    def _render_multi_prompt(self, people: List[Dict]) -> str:
         """
-        개인 정보를 기반으로 포지션 제안 문구 생성
+        여러 명을 한 번에 요청하는 프롬프트 (기존 문구/요구사항은 1번만 포함)
 
         Args:
-            person_data: 개인 정보 딕셔너리
+            people: 개인 정보 리스트 (이력서번호가 서로 다름)
 
         Returns:
-            생성된 제안 문구
+            프롬프트 문자열 (응답은 이력서번호별 JSON)
         """
-        # 자기소개서나 자격증이 없으면 기본 템플릿 사용
+        blocks = "\n\n".join(
+            f"### 이력서번호 {person['이력서번호']}\n{self._render_person(self._prompt_inputs(person))}"
+            for person in people
+        )
+
+        prompt = f"""당신은 채용 담당자입니다.
+아래 지원자 {len(people)}명 각각에 대해 **기존 포지션 제안 문구를 조금만 수정**하여 맞춤형 제안 문구를 작성해주세요.
+
+## 기존 문구 (이것을 기반으로 수정):
+{self.BASE_TEMPLATE}
+
+## 지원자 정보:
+{blocks}
+
+## 요구사항:
+{self.PROMPT_REQUIREMENTS}
+7. 지원자마다 따로 작성하고, 다른 지원자의 정보를 섞지 마세요
+
+## 출력 형식:
+JSON 객체만 출력하세요. 모든 이력서번호를 빠짐없이 포함하세요.
+{{"offers": {{"이력서번호": "수정된 제안 문구", ...}}}}"""
+
+        return prompt
+
+    def _create_prompt(self, person_data: Dict) -> str:
+        """
+        LLM에게 전달할 프롬프트 생성
+
+        Args:
+            person_data: 개인 정보 (자기소개서, 자격증 포함)
+
+        Returns:
+            프롬프트 문자열
+        """
+        return self._render_prompt(self._prompt_inputs(person_data))
+
+    def offer_signature(self, person_data: Dict) -> str:
+        """
+        제안 문구 공유용 정규화 서명 (프롬프트에 들어가는 정보가 사실상 같으면 동일)
+
+        - 공백 차이 무시, 직무/자격증은 순서·중복 무시
+        - LLM 생성 대상이 아니면 모두 같은 서명 (기본 템플릿)
+        """
+        if not self.needs_llm(person_data):
+            return "template"
+
+        def collapse(text) -> str:
+            return " ".join(str(text).split())
+
+        inputs = self._prompt_inputs(person_data)
+        jobs = sorted({collapse(job) for job in str(inputs["job"]).split(",") if job.strip()})
+        canonical = {
+            "career": collapse(inputs["career"]),
+            "job": jobs,
+            "intro_summary": collapse(inputs["intro_summary"]),
+            "certs": sorted({collapse(cert) for cert in inputs["certs"]}),
+        }
+        return json.dumps(canonical, ensure_ascii=False, sort_keys=True)
+
+    def _estimate_tokens(self, prompt: str, offers: int = 1) -> int:
+        """요청 토큰 예상치 (프롬프트 토큰 + 응답 토큰)"""
+        count = self.token_counter.count
+        return count(self.SYSTEM_PROMPT) + count(prompt) + self.COMPLETION_TOKENS * offers
+
+    def _chat_body(self, prompt: str, json_output: bool = False) -> Dict:
+        """Chat Completions 요청 본문 (즉시 호출/배치 요청 공통)"""
+        body = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.temperature
+        }
+        if json_output:
+            body["response_format"] = {"type": "json_object"}
+        return body
+
+    @staticmethod
+    def needs_llm(person_data: Dict) -> bool:
+        """LLM 생성 대상인지 (자기소개서나 자격증이 없으면 기본 템플릿 사용)"""
         has_intro = person_data.get("자기소개서") and len(person_data["자기소개서"]) > 0
         has_cert = person_data.get("자격증") and len(person_data["자격증"]) > 0
+        return bool(has_intro or has_cert)
+
+    def _call_llm(self, prompt: str, offers: int = 1) -> Tuple[str, Dict]:
+        """
+        LLM 호출 (분당 요청/토큰 한도 내에서, 일시적 오류는 재시도)
+
+        - 429/5xx/연결 오류: 지수 백오프 + 지터로 재시도 (429의 Retry-After 동안은 전체 워커 대기)
+        - 오류율이 급증하면 회로 차단기가 모든 워커의 호출을 잠시 멈춤
+        - 그 외 오류(잘못된 요청 등)나 재시도 소진 시 예외 발생
+
+        Args:
+            prompt: 사용자 프롬프트
+            offers: 요청에 포함된 인원 (2명 이상이면 JSON 응답 요청)
+
+        Returns:
+            (생성된 텍스트, {"prompt_tokens", "completion_tokens", "latency"})
+        """
+        estimated = self._estimate_tokens(prompt, offers)
+        body = self._chat_body(prompt, json_output=offers > 1)
+        path = "multi" if offers > 1 else "single"
+
+        attempt = 0
+        while True:
+            probe = self.breaker.wait()
+            self.rate_limiter.acquire(estimated)
+
+            started = time.perf_counter()
+            try:
+                text, usage = self.backend.chat(body)
+                break
+            except Exception as e:
+                self.telemetry.record_error(path)
+                self.rate_limiter.settle(estimated, 0)
+
+                kind = self.retry_policy.classify(e)
+                retry_after = getattr(e, "retry_after", None)
+                self.breaker.record(False, probe)  # 재시도하지 않는 오류(인증 오류 등)도 실패로 집계 (연속되면 차단)
+                if kind == RetryPolicy.RATE_LIMIT and retry_after:
+                    self.breaker.pause(retry_after)
+                if kind == RetryPolicy.FATAL or attempt >= self.retry_policy.max_retries:
+                    raise
+
+                delay = self.retry_policy.delay(attempt, retry_after)
+                attempt += 1
+                self.telemetry.increment("retries")
+                print(f"   🔁 {kind} 오류, {delay:.1f}초 후 재시도 ({attempt}/{self.retry_policy.max_retries}): {e}")
+                time.sleep(delay)
+
+        latency = time.perf_counter() - started
+        self.breaker.record(True, probe)
+
+        if usage is not None:
+            self.rate_limiter.settle(estimated, usage["total_tokens"])
+
+        stats = {
+            "prompt_tokens": usage["prompt_tokens"] if usage is not None else 0,
+            "completion_tokens": usage["completion_tokens"] if usage is not None else 0,
+            "latency": latency,
+        }
+        self.telemetry.record_call(path, offers, **stats)
+        return text.strip(), stats
+
+    def _valid_offer(self, offer, person_data: Dict) -> bool:
+        """묶음 응답의 제안 문구 검증 (빈 문구, 이름 언급 제외)"""
+        if not isinstance(offer, str) or not offer.strip():
+            return False
+        name = str(person_data.get("이름") or "").strip()
+        return not (len(name) >= 2 and name in offer)
+
+    def _generate_group(self, group: List[Dict]) -> List[str]:
+        """
+        여러 명을 한 번의 요청으로 생성 (JSON 응답 검증, 누락/오류는 1명씩 다시 생성)
+
+        Args:
+            group: 개인 정보 리스트 (모두 LLM 생성 대상)
+
+        Returns:
+            제안 문구 리스트 (group과 같은 순서)
+        """
+        results = [None] * len(group)
+        cache_keys = [None] * len(group)
+        pending = {}  # 이력서번호 → group 인덱스
+
+        for i, person in enumerate(group):
+            if self.cache is not None:
+                cache_keys[i] = OfferCache.key(self._chat_body(self._create_prompt(person)))
+                cached = self.cache.get(cache_keys[i])
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            rno = str(person.get("이력서번호") or "")
+            if rno and rno not in pending:
+                pending[rno] = i
+
+        if len(pending) >= 2:
+            members = [group[i] for i in pending.values()]
+            try:
+                text, stats = self._call_llm(self._render_multi_prompt(members), offers=len(members))
+                parsed = json.loads(text).get("offers", {})
+            except Exception as e:
+                print(f"   ⚠️  묶음 생성 오류 ({len(members)}명, 1명씩 다시 생성): {e}")
+                parsed, stats = {}, None
+
+            for rno, i in pending.items():
+                offer = parsed.get(rno) if isinstance(parsed, dict) else None
+                if not self._valid_offer(offer, group[i]):
+                    continue
+                results[i] = offer.strip()
+                self._mark_generated(group[i])
+                if cache_keys[i] is not None:
+                    share = len(members)
+                    self.cache.put(cache_keys[i], results[i], stats["prompt_tokens"] // share,
+                                   stats["completion_tokens"] // share, stats["latency"] / share)
+
+            missing = sum(1 for i in pending.values() if results[i] is None)
+            if missing:
+                self.telemetry.increment("regenerated", missing)
+
+        # 묶음 응답에서 빠졌거나 검증에 실패한 사람은 1명씩 생성
+        for i, person in enumerate(group):
+            if results[i] is None:
+                results[i] = self.generate_offer(person)
+        return results
+
+    def generate_offer(self, person_data: Dict) -> Optional[str]:
+        """
+        개인 정보를 기반으로 포지션 제안 문구 생성
 
-        if not has_intro and not has_cert:
+        Args:
+            person_data: 개인 정보 딕셔너리
+
+        Returns:
+            생성된 제안 문구 (재시도까지 실패하면 None → 재시도 대기열)
+        """
+        # 자기소개서나 자격증이 없으면 기본 템플릿 사용
+        if not self.needs_llm(person_data):
             print(f"   ⚠️  자기소개서/자격증 없음 - 기본 템플릿 사용")
+            self.telemetry.increment("templated")
             return self.BASE_TEMPLATE
 
         try:
-            # 프롬프트 생성
+            # 프롬프트 생성 (같은 요청이 캐시에 있으면 API 호출 생략)
             prompt = self._create_prompt(person_data)
+            cache_key = None
+            if self.cache is not None:
+                cache_key = OfferCache.key(self._chat_body(prompt))
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
             # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4o", 
-                messages=[
-                    {"role": "system", "content": "당신은 전문 채용 담당자입니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7
-            )
-
-            generated_text = response.choices[0].message.content.strip()
-            return generated_text
+            offer_text, stats = self._call_llm(prompt)
+            self._mark_generated(person_data)
+            if cache_key is not None:
+                self.cache.put(cache_key, offer_text, **stats)
+            return offer_text
 
         except Exception as e:
-            print(f"   ❌ LLM 생성 오류: {e}")
-            return self.BASE_TEMPLATE
+            print(f"   ❌ LLM 생성 오류 (재시도 대기열로 이동): {e}")
+            self.telemetry.increment("deferred")
+            return None
+
+    def _mark_generated(self, person_data: Dict):
+        """LLM 응답으로 제안 문구를 만든 사람 기록 (_run_task 안에서만, 캐시/기본 템플릿은 제외)"""
+        generated = getattr(self._task_state, "generated", None)
+        if generated is not None:
+            generated.add(id(person_data))
+
+    def _run_task(self, representatives: List[Dict]) -> Tuple[List[Optional[str]], List[bool]]:
+        """
+        요청 1건 실행 (1명이면 단일 요청, 여러 명이면 묶음 요청)
+
+        Returns:
+            (제안 문구 리스트, 사람별 LLM 생성 여부)
+        """
+        self._task_state.generated = set()
+        try:
+            if len(representatives) == 1:
+                offers = [self.generate_offer(representatives[0])]
+            else:
+                offers = self._generate_group(representatives)
+            return offers, [id(person) in self._task_state.generated for person in representatives]
+        finally:
+            self._task_state.generated = None
+
+    def generate_offers_stream(
+        self,
+        items: Iterable[Optional[Tuple[int, Dict]]],
+        on_result: Optional[Callable[[int, Dict, str], None]] = None
+    ) -> int:
+        """
+        입력이 들어오는 대로 제안 문구 생성 (채점과 동시에 진행하는 파이프라인용)
+
+        - 같은 묶음(offer_signature)은 대표 1명만 생성, 늦게 들어온 사람은 완료 결과를 바로 공유
+        - 묶음 요청(prompt_batch_size > 1)은 인원이 차거나 입력이 잠시 멈추면(None) 바로 전송
+        - 재시도까지 실패한 사람은 대기열에 모았다가 마지막에 deferred_rounds번 다시 생성 (그래도 실패하면 on_result 없음)
+
+        Args:
+            items: (인덱스, 개인 정보) 스트림, None이면 입력 대기 중 (모아 둔 묶음 요청 전송)
+            on_result: 1명 완료 시 호출 (인덱스, 개인 정보, 제안 문구) - 호출한 스레드에서 완료 순서대로 실행
+
+        Returns:
+            처리 인원
+        """
+        started = time.perf_counter()
+        buckets = {}   # 서명 → {"members": [(인덱스, 개인 정보)], "offer": 제안 문구, "generated": LLM 생성 여부}
+        group = []     # 묶음 요청 대기 중인 버킷
+        futures = {}   # future → 버킷 리스트
+        deferred = []  # 생성 실패 버킷 (재시도 대기열)
+        received = 0
+
+        def finish(task: List[Dict], result: Tuple[List[Optional[str]], List[bool]]):
+            task_offers, generated = result
+            for bucket, offer_text, from_llm in zip(task, task_offers, generated):
+                if offer_text is None:
+                    deferred.append(bucket)
+                    continue
+                bucket["offer"] = offer_text
+                bucket["generated"] = from_llm
+                if on_result:
+                    for idx, person in bucket["members"]:
+                        on_result(idx, person, offer_text)
+
+        def submit(task: List[Dict]):
+            representatives = [bucket["members"][0][1] for bucket in task]
+            if executor is None:
+                finish(task, self._run_task(representatives))
+            else:
+                futures[executor.submit(self._run_task, representatives)] = task
+
+        def collect_done():
+            for future in [f for f in futures if f.done()]:
+                finish(futures.pop(future), future.result())
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency) if self.max_concurrency > 1 else None
+        try:
+            for item in items:
+                if item is None:
+                    if group:
+                        submit(group)
+                        group = []
+                    collect_done()
+                    continue
+
+                idx, person = item
+                received += 1
+                key = self.offer_signature(person) if self.bucket_offers else idx
+                bucket = buckets.get(key)
+                if bucket is not None:
+                    # 같은 묶음: 이미 생성됐으면 바로 전달, 아니면 완료 시 함께 전달
+                    if bucket["offer"] is not None:
+                        if on_result:
+                            on_result(idx, person, bucket["offer"])
+                    else:
+                        bucket["members"].append((idx, person))
+                    continue
+
+                bucket = buckets[key] = {"members": [(idx, person)], "offer": None, "generated": False}
+                if self.prompt_batch_size > 1 and self.needs_llm(person):
+                    group.append(bucket)
+                    if len(group) >= self.prompt_batch_size:
+                        submit(group)
+                        group = []
+                else:
+                    submit([bucket])
+                collect_done()
+
+            if group:
+                submit(group)
+            for future in as_completed(list(futures)):
+                finish(futures.pop(future), future.result())
+
+            # 재시도 대기열: 실패한 사람만 1명씩 다시 생성
+            for round_no in range(1, self.deferred_rounds + 1):
+                if not deferred:
+                    break
+                retry_buckets = deferred[:]
+                deferred.clear()
+                print(f"🔁 재시도 대기열 {sum(len(b['members']) for b in retry_buckets)}명 다시 생성 ({round_no}/{self.deferred_rounds})")
+                for bucket in retry_buckets:
+                    submit([bucket])
+                for future in as_completed(list(futures)):
+                    finish(futures.pop(future), future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.bucket_offers and received:
+            # LLM으로 생성한 묶음만 집계 (기본 템플릿/캐시 적중/최종 실패 묶음은 생성도 절약도 아님)
+            generated = [bucket for bucket in buckets.values() if bucket["generated"]]
+            saved = sum(len(bucket["members"]) - 1 for bucket in generated)
+            print(f"🪣 {received}명 → {len(buckets)}개 묶음 (LLM 생성 {len(generated)}회, {saved}회 절약)")
+        failed = sum(len(bucket["members"]) for bucket in deferred)
+        if failed:
+            self.telemetry.increment("failed", failed)
+            print(f"⚠️  {failed}명 생성 실패 - 제안문구를 비워 둠 (다시 실행하면 생성)")
+        if received:
+            elapsed = time.perf_counter() - started
+            print(f"⏱️  {received}명 생성: {elapsed:.1f}초 (동시 {self.max_concurrency}개, "
+                  f"한도 대기 {self.rate_limiter.waited_seconds:.1f}초)")
+        return received
+
+    def generate_offers(
+        self,
+        people: List[Dict],
+        on_result: Optional[Callable[[int, Dict, str], None]] = None
+    ) -> List[str]:
+        """
+        여러 명의 제안 문구 생성 (max_concurrency개까지 동시 요청)
+
+        Args:
+            people: 개인 정보 리스트
+            on_result: 1명 완료 시 호출 (인덱스, 개인 정보, 제안 문구) - 호출한 스레드에서 완료 순서대로 실행
+
+        Returns:
+            제안 문구 리스트 (people과 같은 순서)
+        """
+        offers = [None] * len(people)
+
+        def collect(idx: int, person: Dict, offer_text: str):
+            offers[idx] = offer_text
+            if on_result:
+                on_result(idx, person, offer_text)
+
+        self.generate_offers_stream(enumerate(people), collect)
+        return offers
+
+    def _signature_hash(self, person_data: Dict) -> str:
+        """
+        제안문구 로그 유효성 확인용 서명 해시
+
+        지원자 정보, 모델, 생성 온도, 프롬프트(시스템 프롬프트/기본 템플릿/요구사항, PROMPT_VERSION) 중
+        하나라도 바뀌면 달라짐 (OfferCache 키와 같은 기준)
+        """
+        payload = json.dumps(
+            [self.model, self.temperature, self.PROMPT_VERSION, self._prompt_hash, self.offer_signature(person_data)],
+            ensure_ascii=False,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def load_offer_log(offer_log: CheckpointLog) -> Dict[str, Dict]:
+        """
+        제안문구 로그의 이력서번호별 마지막 기록
+
+        Returns:
+            {이력서번호: {"포지션제안문구", "서명"}}
+        """
+        return {
+            key: record
+            for key, (status, record) in offer_log.latest_records().items()
+            if status == CheckpointLog.STATUS_OK
+        }
+
+    def restore_offer(self, person_data: Dict, logged: Dict[str, Dict]) -> bool:
+        """
+        로그에 기록된 제안문구 복원 (지원자 정보가 기록 당시와 같을 때만)
+
+        Returns:
+            복원 여부 (False면 새로 생성 필요)
+        """
+        rno = str(person_data.get("이력서번호") or "")
+        record = logged.get(rno) if rno else None
+        if not record or not record.get("포지션제안문구") or record.get("서명") != self._signature_hash(person_data):
+            return False
+        person_data["포지션제안문구"] = record["포지션제안문구"]
+        return True
+
+    def log_offer(self, offer_log: CheckpointLog, person_data: Dict, offer_text: str):
+        """생성된 제안문구 1건을 로그에 추가 기록 (이력서번호가 없으면 기록하지 않음)"""
+        rno = person_data.get("이력서번호")
+        if rno:
+            offer_log.append(str(rno), {"포지션제안문구": offer_text, "서명": self._signature_hash(person_data)})
+
+    @staticmethod
+    def compact_offer_log(offer_log: CheckpointLog):
+        """로그를 이력서번호별 마지막 기록만 남기도록 정리"""
+        offer_log.rewrite((key, status, record) for key, (status, record) in offer_log.latest_records().items())
+
+    def generate_offers_logged(
+        self,
+        people: List[Dict],
+        offer_log: CheckpointLog,
+        on_result: Optional[Callable[[int, Dict, str], None]] = None
+    ) -> int:
+        """
+        제안문구를 1명씩 로그에 추가 기록하며 생성 (중단 후 다시 실행하면 기록된 사람은 건너뜀)
+
+        - 결과는 people의 "포지션제안문구"에 기록 (JSON/엑셀 저장은 호출하는 쪽에서 마지막에 1번)
+        - 로그의 제안문구는 지원자 정보(서명)가 그대로일 때만 재사용
+
+        Args:
+            people: 개인 정보 리스트
+            offer_log: 제안문구 로그 (이력서번호 기준)
+            on_result: 1명 완료 시 호출 (인덱스, 개인 정보, 제안 문구) - 새로 생성한 사람만
+
+        Returns:
+            새로 생성한 인원
+        """
+        logged = self.load_offer_log(offer_log)
+        pending = [idx for idx, person in enumerate(people) if not self.restore_offer(person, logged)]
+        if len(pending) < len(people):
+            print(f"💾 제안문구 로그 발견: {len(people) - len(pending)}명 생성됨 → 나머지 {len(pending)}명만 생성\n")
+
+        def record(idx: int, person: Dict, offer_text: str):
+            person["포지션제안문구"] = offer_text
+            self.log_offer(offer_log, person, offer_text)
+            if on_result:
+                on_result(idx, person, offer_text)
+
+        try:
+            self.generate_offers_stream(((idx, people[idx]) for idx in pending), record)
+        finally:
+            offer_log.close()
+        self.compact_offer_log(offer_log)
+        return len(pending)
+
+    def close(self):
+        """호출/캐시 통계 출력 및 정리"""
+        self.telemetry.print_summary(self.MODEL_PRICES.get(self.model))
+        if self.cache is not None:
+            self.cache.print_stats(self.MODEL_PRICES.get(self.model))
+            self.cache.close()
+        if self.backend is not None:
+            self.backend.close()
+
+    @staticmethod
+    def batch_custom_id(person_data: Dict) -> str:
+        """배치 요청 ID (이력서번호 기반, 재실행해도 동일)"""
+        return f"offer-{person_data.get('이력서번호')}"
+
+    def write_batch_requests(self, people: List[Dict], request_jsonl: str) -> int:
+        """
+        배치 요청 파일(JSONL) 작성 - LLM 생성 대상만, 이력서번호당 1줄
+
+        Args:
+            people: 개인 정보 리스트
+            request_jsonl: 요청 파일 경로 (OpenAI Batch API 입력 형식)
+
+        Returns:
+            작성한 요청 수
+        """
+        Path(request_jsonl).parent.mkdir(parents=True, exist_ok=True)
+        written = set()
+        with open(request_jsonl, 'w', encoding='utf-8') as f:
+            for person in people:
+                custom_id = self.batch_custom_id(person)
+                if not person.get("이력서번호") or not self.needs_llm(person) or custom_id in written:
+                    continue
+                request = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._chat_body(self._create_prompt(person))
+                }
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+                written.add(custom_id)
+
+        print(f"📝 배치 요청 {len(written)}건 작성: {request_jsonl}")
+        print(f"   (자기소개서/자격증 없는 {sum(1 for p in people if not self.needs_llm(p))}명은 기본 템플릿 사용)")
+        return len(written)
+
+    def _require_client(self):
+        """배치 API용 OpenAI 클라이언트 (offline 모드/다른 백엔드에서는 사용 불가)"""
+        client = getattr(self.backend, "client", None)
+        if client is None:
+            raise ValueError("배치 API는 OpenAI 백엔드에서만 사용할 수 있습니다. 환경변수 OPENAI_API_KEY를 설정하거나 인자로 전달하세요.")
+        return client
+
+    def submit_batch(self, request_jsonl: str) -> str:
+        """
+        배치 요청 파일 업로드 및 배치 작업 생성 (24시간 내 처리)
+
+        Returns:
+            배치 ID (결과 다운로드에 사용)
+        """
+        client = self._require_client()
+        with open(request_jsonl, 'rb') as f:
+            input_file = client.files.create(file=f, purpose="batch")
+
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"🚀 배치 작업 생성: {batch.id} (상태: {batch.status})")
+        return batch.id
+
+    def download_batch_results(self, batch_id: str, results_jsonl: str) -> bool:
+        """
+        완료된 배치 작업의 결과 파일 다운로드
+
+        Returns:
+            다운로드 여부 (아직 처리 중이면 False)
+        """
+        client = self._require_client()
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            print(f"⏳ 배치 작업 {batch_id}: {batch.status} (완료 후 다시 실행)")
+            return False
+
+        content = client.files.content(batch.output_file_id)
+        Path(results_jsonl).parent.mkdir(parents=True, exist_ok=True)
+        with open(results_jsonl, 'w', encoding='utf-8') as f:
+            f.write(content.text)
+        print(f"📥 배치 결과 다운로드: {results_jsonl}")
+        return True
+
+    def ingest_batch_results(self, people: List[Dict], results_jsonl: str) -> Dict[str, int]:
+        """
+        배치 결과 파일(JSONL)을 읽어 이력서번호별로 포지션제안문구 추가
+
+        - LLM 생성 대상이 아니면 기본 템플릿
+        - 결과가 없거나 실패한 사람은 비워 둠 (요청 파일을 다시 만들어 재제출)
+
+        Args:
+            people: 개인 정보 리스트 (포지션제안문구가 추가됨)
+            results_jsonl: 결과 파일 경로 (OpenAI Batch API 출력 형식)
+
+        Returns:
+            {"generated": 반영, "template": 기본 템플릿, "missing": 결과 없음/실패}
+        """
+        results = {}
+        with open(results_jsonl, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    continue
+                try:
+                    content = response["body"]["choices"][0]["message"]["content"]
+                except (KeyError, IndexError, TypeError):
+                    continue
+                if content and content.strip():
+                    results[item["custom_id"]] = content.strip()
+
+        counts = {"generated": 0, "template": 0, "missing": 0}
+        for person in people:
+            if not self.needs_llm(person):
+                person["포지션제안문구"] = self.BASE_TEMPLATE
+                counts["template"] += 1
+                continue
+
+            offer = results.get(self.batch_custom_id(person))
+            if offer:
+                person["포지션제안문구"] = offer
+                counts["generated"] += 1
+            else:
+                counts["missing"] += 1
+
+        print(f"📥 배치 결과 반영: 생성 {counts['generated']}명, 기본 템플릿 {counts['template']}명, 결과 없음 {counts['missing']}명")
+        return counts
 
     def process_file(self, input_json: str, output_json: str):
         """
         JSON 파일을 읽어서 모든 지원자에 대해 제안 문구 생성
+        1명씩 제안문구 로그에 추가 기록 (중단 후 다시 실행하면 이어서), 출력 JSON은 마지막에 1번 저장
 
         Args:
             input_json: 입력 JSON 파일 경로 (with_details.json)
@@ -144,102 +859,89 @@ class PositionOfferGenerator:
             people = json.load(f)
 
         print(f"📋 총 {len(people)}명 처리 시작\n")
+        done = 0
 
-        # 각 사람에 대해 제안 문구 생성
-        for idx, person in enumerate(people, 1):
+        def on_result(idx: int, person: Dict, offer_text: str):
+            nonlocal done
+            done += 1
             name = person.get("이름", "Unknown")
-            print(f"[{idx}/{len(people)}] {name}")
-
-            # 제안 문구 생성
-            offer_text = self.generate_offer(person)
-
-            # 결과에 추가
-            person["포지션제안문구"] = offer_text
+            print(f"[{done}] {name}")
 
             # 미리보기
             preview = offer_text[:80] + "..." if len(offer_text) > 80 else offer_text
             print(f"   💬 {preview}\n")
 
-            # 즉시 저장 (중간 손실 방지)
-            with open(output_json, 'w', encoding='utf-8') as f:
-                json.dump(people, f, ensure_ascii=False, indent=2)
+        # 각 사람에 대해 제안 문구 생성 (로그에 기록된 사람은 건너뜀)
+        self.generate_offers_logged(people, CheckpointLog(offer_log_path(output_json)), on_result)
+        self.close()
 
+        save_json_atomic(people, output_json)
         print(f"\n✅ 완료! {len(people)}명의 제안 문구 생성")
         print(f"💾 저장: {output_json}")
 
 
+def offer_log_path(output_json: str) -> str:
+    """출력 파일에 대응하는 제안문구 로그 경로"""
+    path = Path(output_json)
+    return str(path.with_name(f"{path.stem}.offers.jsonl"))
+
+
+def save_json_atomic(records: List[Dict], output_json: str):
+    """JSON 저장 (임시 파일 기록 후 교체, 저장 중 중단되어도 기존 파일 유지)"""
+    Path(output_json).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{output_json}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_json)
+
+
 def update_excel_with_offers(excel_path: str, candidates: List[Dict], min_score: int = 30):
     """
-    엑셀 파일에 제안문구 컬럼 추가 (30점 이상만)
+    엑셀 파일에 제안문구 컬럼 추가 (30점 이상만), 점수 컬럼도 같은 패스에서 갱신
 
     Args:
         excel_path: 엑셀 파일 경로
         candidates: 제안문구가 포함된 후보자 리스트
         min_score: 최소 점수 (기본 30점)
     """
-    # 이력서번호 → 제안문구 매핑
+    # 이력서번호 → 점수/제안문구 매핑
+    score_map = {}
     offer_map = {}
     for candidate in candidates:
         rno = candidate.get("이력서번호")
+        if not rno:
+            continue
         score = candidate.get("점수상세", {}).get("총점", 0)
         offer = candidate.get("포지션제안문구", "")
 
+        if "점수상세" in candidate:
+            score_map[str(rno)] = score
+
         # 30점 이상만 제안문구 추가
-        if rno and score >= min_score and offer:
+        if score >= min_score and offer:
             offer_map[str(rno)] = offer
 
-    # 엑셀 파일 열기
-    if not Path(excel_path).exists():
-        print(f"⚠️  엑셀 파일을 찾을 수 없습니다: {excel_path}")
-        return
-
-    wb = openpyxl.load_workbook(excel_path)
-    ws = wb.active
-
-    # 헤더 찾기
-    headers = [cell.value for cell in ws[1]]
-
-    # "제안문구" 컬럼이 이미 있는지 확인
-    if "제안문구" in headers:
-        print(f"⚠️  '제안문구' 컬럼이 이미 존재합니다. 기존 제안문구를 업데이트합니다.")
-        offer_col_idx = headers.index("제안문구") + 1
-    else:
-        # 맨 뒤에 "제안문구" 컬럼 추가
-        offer_col_idx = len(headers) + 1
-        ws.cell(row=1, column=offer_col_idx).value = "제안문구"
-        ws.cell(row=1, column=offer_col_idx).font = Font(bold=True)
-        ws.cell(row=1, column=offer_col_idx).alignment = Alignment(horizontal='center')
-
-        # 헤더 다시 읽기
-        headers = [cell.value for cell in ws[1]]
-
-    # 이력서번호 컬럼 위치 찾기
-    rno_col_idx = None
-    if "이력서번호" in headers:
-        rno_col_idx = headers.index("이력서번호") + 1
-
-    if not rno_col_idx:
-        print(f"⚠️  '이력서번호' 컬럼을 찾을 수 없습니다.")
-        return
-
-    # 각 행에 제안문구 입력 (30점 이상만)
-    updated_count = 0
-    for row_idx in range(2, ws.max_row + 1):
-        rno = ws.cell(row=row_idx, column=rno_col_idx).value
-        if rno and str(rno) in offer_map:
-            offer = offer_map[str(rno)]
-            ws.cell(row=row_idx, column=offer_col_idx).value = offer
-            ws.cell(row=row_idx, column=offer_col_idx).alignment = Alignment(wrap_text=True, vertical='top')
-            updated_count += 1
-
-    # 제안문구 컬럼 너비 조정
-    ws.column_dimensions[openpyxl.utils.get_column_letter(offer_col_idx)].width = 50
-
-    # 저장
-    wb.save(excel_path)
-    print(f"\n📊 엑셀 파일 업데이트 완료!")
-    print(f"   파일: {excel_path}")
-    print(f"   제안문구 입력: {updated_count}개 행 ({min_score}점 이상만)")
+    ResultExcelUpdater(excel_path).update(scores=score_map, offers=offer_map)
+    print(f"   ({min_score}점 이상만 제안문구 입력)")
+
+
+def save_offer_results(qualified: List[Dict], candidates: List[Dict], output_json: str, excel_path: str, min_score: int = 30):
+    """
+    제안문구 결과 저장 (JSON은 합격자만, 엑셀은 전체 후보자 중 min_score 이상만 제안문구 입력)
+
+    Args:
+        qualified: 제안문구가 포함된 합격자 리스트
+        candidates: 전체 후보자 리스트
+        output_json: 출력 JSON 파일 경로
+        excel_path: 엑셀 파일 경로
+        min_score: 최소 점수
+    """
+    save_json_atomic(qualified, output_json)
+
+    print(f"✅ 제안문구 생성 완료!")
+    print(f"💾 저장: {output_json}\n")
+
+    update_excel_with_offers(excel_path, candidates, min_score)
 
 
 def main():
@@ -250,6 +952,40 @@ def main():
     EXCEL_FILE = "output/kspac2022_결과.xlsx"
     MIN_SCORE = 30
 
+    # 동시 생성 (API 사용 한도에 맞춰 조정)
+    CONCURRENCY = 8      # 동시 요청 수 (1이면 순차 처리)
+    RPM_LIMIT = 500      # 분당 최대 요청 수
+    TPM_LIMIT = 30000    # 분당 최대 토큰 수
+
+    # 배치 모드 (야간 실행 등 즉시 응답이 필요 없을 때, 비용/한도 부담 감소)
+    # None: 즉시 생성 / "write": 요청 파일 작성 / "submit": 요청 파일 작성 + 제출 / "ingest": 결과 반영
+    BATCH_MODE = None
+    BATCH_REQUEST_FILE = "output/kspac2022_offer_batch_requests.jsonl"
+    BATCH_RESULT_FILE = "output/kspac2022_offer_batch_results.jsonl"
+    BATCH_ID = None  # "submit" 때 출력된 배치 ID (설정하면 "ingest" 때 결과 파일을 먼저 다운로드)
+
+    # 제안문구 캐시 (경력/직무/자기소개서 요약/자격증/모델/온도가 같으면 재사용)
+    CACHE_FILE = "output/offer_cache.jsonl"
+    CACHE_MAX_ENTRIES = 5000   # 최대 보관 개수
+    CACHE_MAX_AGE_DAYS = 30    # 보관 기간 (일)
+
+    # 프롬프트 정보(경력/직무/자기소개서 요약/자격증)가 같은 사람끼리 1번만 생성해서 공유
+    BUCKET_OFFERS = True
+
+    # 한 번의 요청에 여러 명을 넣어 생성 (공통 지시문 반복 감소, 1이면 1명씩)
+    PROMPT_BATCH_SIZE = 5
+
+    # 1명 요청의 프롬프트 토큰 예산 (자기소개서/자격증을 예산에 맞춰 줄임, tiktoken 설치 시 정확히 계산)
+    MAX_PROMPT_TOKENS = 900
+
+    # OpenAI 호환 서버 주소 (None이면 OpenAI, 예: 로컬 테스트 서버 "http://127.0.0.1:8000/v1")
+    LLM_BASE_URL = None
+
+    # 일시적 오류(429/5xx/연결) 재시도, 오류율 급증 시 전체 일시 정지
+    MAX_RETRIES = 4          # 요청 1건당 최대 재시도 (지수 백오프 + 지터, 429는 Retry-After 준수)
+    BREAKER_COOLDOWN = 30    # 최근 호출 절반 이상 실패 시 일시 정지 시간 (초)
+    DEFERRED_ROUNDS = 1      # 재시도까지 실패한 사람을 마지막에 다시 생성하는 횟수 (그래도 실패하면 비워 둠)
+
     # OpenAI API 키 설정 (환경변수 또는 직접 입력)
     # export OPENAI_API_KEY_COMPANY="sk-..."
     # 또는
@@ -280,31 +1016,59 @@ def main():
             print(f"⚠️  {MIN_SCORE}점 이상인 사람이 없습니다.")
             return
 
-        # 3. 제안문구 생성
-        generator = PositionOfferGenerator()
+        # 3-1. 배치 모드: 요청 파일 작성/제출 (결과는 "ingest"로 반영)
+        if BATCH_MODE in ("write", "submit"):
+            generator = PositionOfferGenerator(offline=BATCH_MODE == "write")
+            generator.write_batch_requests(qualified, BATCH_REQUEST_FILE)
+            if BATCH_MODE == "submit":
+                batch_id = generator.submit_batch(BATCH_REQUEST_FILE)
+                print(f"💡 완료 후 BATCH_ID = \"{batch_id}\", BATCH_MODE = \"ingest\"로 실행")
+            return
+
+        if BATCH_MODE == "ingest":
+            generator = PositionOfferGenerator(offline=BATCH_ID is None)
+            if BATCH_ID and not generator.download_batch_results(BATCH_ID, BATCH_RESULT_FILE):
+                return
+            if not Path(BATCH_RESULT_FILE).exists():
+                print(f"❌ 파일을 찾을 수 없습니다: {BATCH_RESULT_FILE}")
+                return
+            generator.ingest_batch_results(qualified, BATCH_RESULT_FILE)
+            save_offer_results(qualified, candidates, OUTPUT_FILE, EXCEL_FILE, MIN_SCORE)
+            return
 
-        for idx, candidate in enumerate(qualified, 1):
+        # 3-2. 제안문구 생성
+        generator = PositionOfferGenerator(
+            max_concurrency=CONCURRENCY,
+            rpm_limit=RPM_LIMIT,
+            tpm_limit=TPM_LIMIT,
+            cache=OfferCache(CACHE_FILE, CACHE_MAX_ENTRIES, CACHE_MAX_AGE_DAYS),
+            bucket_offers=BUCKET_OFFERS,
+            prompt_batch_size=PROMPT_BATCH_SIZE,
+            max_prompt_tokens=MAX_PROMPT_TOKENS,
+            backend=HTTPBackend(LLM_BASE_URL, os.getenv("OPENAI_API_KEY_COMPANY")) if LLM_BASE_URL else None,
+            retry_policy=RetryPolicy(max_retries=MAX_RETRIES),
+            breaker=CircuitBreaker(cooldown=BREAKER_COOLDOWN),
+            deferred_rounds=DEFERRED_ROUNDS
+        )
+        done = 0
+
+        def on_result(idx: int, candidate: Dict, offer_text: str):
+            nonlocal done
+            done += 1
             name = candidate.get("이름", "Unknown")
             score = candidate.get("점수상세", {}).get("총점", 0)
-            print(f"[{idx}/{len(qualified)}] {name} ({score}점)")
-
-            # 제안 문구 생성
-            offer_text = generator.generate_offer(candidate)
-            candidate["포지션제안문구"] = offer_text
+            print(f"[{done}] {name} ({score}점)")
 
             # 미리보기
             preview = offer_text[:80] + "..." if len(offer_text) > 80 else offer_text
             print(f"   💬 {preview}\n")
 
-        # 4. JSON 저장 (합격자만)
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(qualified, f, ensure_ascii=False, indent=2)
-
-        print(f"✅ 제안문구 생성 완료!")
-        print(f"💾 저장: {OUTPUT_FILE}\n")
+        # 1명씩 제안문구 로그에 기록 (중단 후 다시 실행하면 기록된 사람은 건너뜀)
+        generator.generate_offers_logged(qualified, CheckpointLog(offer_log_path(OUTPUT_FILE)), on_result)
+        generator.close()
 
-        # 5. 엑셀 업데이트 (전체 후보자 중 30점 이상만 제안문구 입력)
-        update_excel_with_offers(EXCEL_FILE, candidates, MIN_SCORE)
+        # 4. JSON 저장 (합격자만) + 엑셀 업데이트
+        save_offer_results(qualified, candidates, OUTPUT_FILE, EXCEL_FILE, MIN_SCORE)
 
     except ValueError as e:
         print(f"❌ 오류: {e}")
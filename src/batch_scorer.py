@@ -0,0 +1,213 @@
+"""대량 후보자 일괄 채점 (pandas 벡터 연산)"""
+import json
+import re
+import warnings
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from src.keyword_matcher import FIELD_SEPARATOR, fold_normalize
+
+
+# 항상 실패하는 정규식 (키워드가 없는 그룹용)
+NEVER_MATCH = r"(?!)"
+
+
+class BatchScorer:
+    """
+    후보자 목록을 컬럼형 DataFrame으로 올려서 키워드 그룹/정규식을 컬럼 단위로 한 번에 평가
+
+    - CandidateScorer와 같은 채점 규칙(키워드 사전/정규식/배점)과 채점 텍스트 구성(TEXT_FIELDS) 사용
+    - 결과 컬럼: 영업경력점수, 커뮤니케이션점수, 전문성점수, 동기어학점수, 총점
+    - verify()로 CandidateScorer.calculate_score 결과와 일치하는지 확인
+    """
+
+    SCORE_COLUMNS = ["영업경력점수", "커뮤니케이션점수", "전문성점수", "동기어학점수", "총점"]
+
+    def __init__(self, scorer):
+        """
+        Args:
+            scorer: CandidateScorer 인스턴스 (키워드 사전/정규식/정규화 기준)
+        """
+        self.scorer = scorer
+        self.text_fields = scorer.TEXT_FIELDS
+        self._patterns_hash = None
+        self.group_patterns = {}
+
+    def _compile_patterns(self, rules):
+        """키워드 그룹별 정규식 패턴 (규칙이 바뀐 경우에만 다시 생성)"""
+        if self._patterns_hash == rules.content_hash:
+            return
+        normalize = self.scorer.normalize
+        self.group_patterns = {}
+        for name, keywords in rules.keywords.items():
+            patterns = [re.escape(normalize(kw)) for kw in keywords if normalize(kw)]
+            # 키워드가 없는 그룹은 매칭되지 않는 패턴 ("".join 결과인 빈 패턴은 모든 행에 매칭됨)
+            self.group_patterns[name] = "|".join(patterns) if patterns else NEVER_MATCH
+        self._patterns_hash = rules.content_hash
+
+    def to_frame(self, candidates: List[Dict]) -> pd.DataFrame:
+        """
+        채점에 필요한 필드만 컬럼형 DataFrame으로 변환
+
+        Args:
+            candidates: 후보자 리스트
+
+        Returns:
+            필드별 원문 컬럼 DataFrame
+        """
+        fields = sorted({field for fields in self.text_fields.values() for field in fields})
+        columns = {}
+        for field in fields:
+            if field == "자격증":
+                columns[field] = [self.scorer.extract_cert_text(c.get("자격증")) for c in candidates]
+            elif field == "자기소개서":
+                columns[field] = [self.scorer.extract_intro_text(c.get("자기소개서")) for c in candidates]
+            else:
+                columns[field] = [str(c.get(field, "")) for c in candidates]
+        return pd.DataFrame(columns)
+
+    def _texts(self, frame: pd.DataFrame) -> Dict[str, pd.Series]:
+        """채점 텍스트별 원문 컬럼 (필드를 공백으로 이어붙임)"""
+        texts = {}
+        for name, fields in self.text_fields.items():
+            text = frame[fields[0]]
+            for field in fields[1:]:
+                text = text + " " + frame[field]
+            texts[name] = text
+        return texts
+
+    def _normalized_texts(self, frame: pd.DataFrame) -> Dict[str, pd.Series]:
+        """채점 텍스트별 정규화 컬럼 (필드마다 1회 접기 정규화 후 필드 구분자로 연결)"""
+        folded = {
+            field: frame[field].map(fold_normalize)
+            for field in frame.columns
+        }
+        texts = {}
+        for name, fields in self.text_fields.items():
+            text = folded[fields[0]]
+            for field in fields[1:]:
+                text = text + FIELD_SEPARATOR + folded[field]
+            texts[name] = text
+        return texts
+
+    def _hits(self, normalized: pd.Series, group: str) -> np.ndarray:
+        """정규화된 텍스트 컬럼에서 키워드 그룹 등장 여부"""
+        return normalized.str.contains(self.group_patterns[group], regex=True).to_numpy()
+
+    def _search(self, text: pd.Series, rx: re.Pattern) -> pd.DataFrame:
+        """정규식 첫 매칭의 그룹 추출 (매칭 없으면 NaN)"""
+        return text.str.extract(rx.pattern, flags=rx.flags)
+
+    def score_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        DataFrame 전체 채점
+
+        Args:
+            frame: to_frame() 결과
+
+        Returns:
+            점수 컬럼 DataFrame (frame과 같은 인덱스)
+        """
+        rules = self.scorer.rules
+        self._compile_patterns(rules)
+        points = rules.points
+
+        raw = self._texts(frame)
+        norm = self._normalized_texts(frame)
+
+        def hits(name, *groups):
+            result = self._hits(norm[name], groups[0])
+            for group in groups[1:]:
+                result = result | self._hits(norm[name], group)
+            return result
+
+        # 영업 경력 (최대 30점)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # 캡처 그룹 포함 패턴 경고
+            number_hit = raw["exp"].str.contains(rules.regex["numberHit"]).to_numpy()
+        sales = points["sales"]
+        act_hit = hits("exp", "activity") | number_hit
+        base = np.select(
+            [hits("exp", "insuranceSales", "financeSales"), hits("exp", "generalSales"), hits("exp", "indirectSales")],
+            [sales["insuranceFinance"], sales["general"], sales["indirect"]], 0
+        )
+        activity = np.where(act_hit, np.where(number_hit, sales["activityNumber"], sales["activity"]), 0)
+        exp_25 = np.minimum(sales["expCap"], base + activity)
+        job_5 = np.select(
+            [hits("job", "insuranceSales", "financeSales"), hits("job", "generalSales")],
+            [sales["jobInsuranceFinance"], sales["jobGeneral"]], 0
+        )
+        sales_exp = exp_25 + job_5
+
+        # 고객 커뮤니케이션 (최대 25점, 인재상 점수는 없음)
+        comm = points["comm"]
+        customer_comm = np.select(
+            [hits("intro", "commStrong"), hits("intro", "commMedium")],
+            [comm["commStrong"], comm["commMedium"]], 0
+        )
+
+        # 전문성 (최대 30점)
+        cert_groups = ["certHigh", "certBasic", "certLight"]
+        cert_20 = np.select([hits("cert", group) for group in cert_groups], [points["cert"][group] for group in cert_groups], 0)
+        edu_10 = np.select(
+            [hits("edu", "majorFinance", "eduFinance"), hits("edu", "eduBasic")],
+            [points["edu"]["finance"], points["edu"]["basic"]], 0
+        )
+        specialization = cert_20 + edu_10
+
+        # 동기/어학 (최대 15점)
+        motive = points["motive"]
+        mot_10 = np.select(
+            [hits("intro", "motiveStrong"), hits("intro", "motiveWeak")],
+            [motive["motiveStrong"], motive["motiveWeak"]], 0
+        )
+        lang = points["lang"]
+        toeic = pd.to_numeric(self._search(raw["lang"], rules.regex["toeic"])[1], errors="coerce").to_numpy()
+        with np.errstate(invalid="ignore"):
+            lang_5 = np.select([toeic >= threshold for threshold, _ in lang["toeic"]], [score for _, score in lang["toeic"]], 0)
+
+        opic = self._search(raw["lang"], rules.regex["opic"])[1].str.upper()
+        opic_score = np.select(
+            [opic.str.contains("AL|IH", na=False).to_numpy(), opic.str.contains("IM", na=False).to_numpy()],
+            [lang["opicHigh"], lang["opicMid"]], lang["opicLow"]
+        )
+        lang_5 = np.where((lang_5 == 0) & opic.notna().to_numpy(), opic_score, lang_5)
+        lang_5 = np.where((lang_5 == 0) & hits("lang", "langNames"), lang["langName"], lang_5)
+        motivation_lang = mot_10 + lang_5
+
+        total = sales_exp + customer_comm + specialization + motivation_lang
+
+        return pd.DataFrame({
+            "영업경력점수": sales_exp,
+            "커뮤니케이션점수": customer_comm,
+            "전문성점수": specialization,
+            "동기어학점수": motivation_lang,
+            "총점": total,
+        }, index=frame.index).astype(int)
+
+    def score(self, candidates: List[Dict]) -> pd.DataFrame:
+        """후보자 리스트 일괄 채점 (이력서번호 컬럼 포함)"""
+        scores = self.score_frame(self.to_frame(candidates))
+        scores.insert(0, "이력서번호", [c.get("이력서번호") for c in candidates])
+        return scores
+
+    def score_file(self, input_json: str) -> pd.DataFrame:
+        """JSON 파일의 후보자 일괄 채점"""
+        with open(input_json, "r", encoding="utf-8") as f:
+            candidates = json.load(f)
+        return self.score(candidates)
+
+    def verify(self, candidates: List[Dict]) -> List[int]:
+        """
+        CandidateScorer.calculate_score 결과와 비교
+
+        Returns:
+            점수가 다른 후보자의 인덱스 리스트 (비어 있으면 전부 일치)
+        """
+        batch = self.score_frame(self.to_frame(candidates))[self.SCORE_COLUMNS].to_dict("records")
+        return [
+            idx for idx, (candidate, row) in enumerate(zip(candidates, batch))
+            if self.scorer.calculate_score(candidate) != row
+        ]
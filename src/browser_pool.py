@@ -0,0 +1,165 @@
+"""Playwright 헤드리스 Chromium 브라우저 풀"""
+import time
+from typing import Dict, List, Optional
+
+
+class BrowserPool:
+    """
+    헤드리스 Chromium을 Playwright로 직접 실행하고 계정별 격리 컨텍스트를 관리
+
+    - 디버깅 포트/외부 Chrome 프로세스 없이 실행 → 여러 인스턴스 동시 실행 가능
+    - 고정 대기(sleep) 대신 헬스체크로 준비 상태 확인
+    - 브라우저가 죽으면 재실행 후 컨텍스트(쿠키 포함) 복구
+    - 실행 시간 및 컨텍스트별 메모리(JS 힙) 사용량 보고
+    """
+
+    DEFAULT_ARGS = ["--disable-dev-shm-usage", "--no-first-run", "--no-default-browser-check"]
+
+    def __init__(self, playwright, headless: bool = True, launch_args: Optional[List[str]] = None, health_timeout: float = 10.0):
+        """
+        Args:
+            playwright: sync_playwright()로 얻은 Playwright 객체
+            headless: 헤드리스 실행 여부
+            launch_args: Chromium 실행 인자 (None이면 기본값)
+            health_timeout: 헬스체크 제한 시간(초)
+        """
+        self.playwright = playwright
+        self.headless = headless
+        self.launch_args = launch_args if launch_args is not None else self.DEFAULT_ARGS
+        self.health_timeout = health_timeout
+
+        self.browser = None
+        self.startup_seconds = None
+        self.restart_count = 0
+        self._probe_page = None
+        self._contexts = {}  # name → {"context": ..., "page": ..., "cookies": ...}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self) -> float:
+        """
+        브라우저 실행 후 헬스체크 통과까지 대기
+
+        Returns:
+            실행 소요 시간(초)
+        """
+        started = time.perf_counter()
+        self.browser = self.playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+
+        # 헬스체크 전용 페이지 (계정 컨텍스트와 분리)
+        self._probe_page = self.browser.new_page()
+        self._probe_page.set_default_timeout(self.health_timeout * 1000)
+
+        if not self.health_check():
+            raise RuntimeError("브라우저 헬스체크 실패")
+
+        self.startup_seconds = time.perf_counter() - started
+        print(f"✅ 헤드리스 Chromium 실행 완료 ({self.startup_seconds:.2f}초, 버전 {self.browser.version})")
+        return self.startup_seconds
+
+    def health_check(self) -> bool:
+        """브라우저 연결 및 응답 확인"""
+        if self.browser is None or not self.browser.is_connected():
+            return False
+        try:
+            return self._probe_page.evaluate("1 + 1") == 2
+        except Exception:
+            return False
+
+    def ensure_healthy(self) -> bool:
+        """
+        헬스체크 실패 시 브라우저 재실행 및 컨텍스트 복구
+
+        Returns:
+            재실행 여부
+        """
+        if self.health_check():
+            return False
+
+        print("⚠️  브라우저 응답 없음 → 재실행합니다.")
+        saved = {name: entry["cookies"] for name, entry in self._contexts.items()}
+        self._close_browser()
+        self.start()
+        self.restart_count += 1
+
+        self._contexts = {}
+        for name, cookies in saved.items():
+            self.new_context(name, cookies)
+        return True
+
+    def new_context(self, name: str, cookies: Optional[List[Dict]] = None):
+        """
+        격리된 컨텍스트 생성 (계정별 쿠키/세션 분리)
+
+        Args:
+            name: 컨텍스트 이름 (계정 아이디)
+            cookies: 주입할 쿠키 리스트
+
+        Returns:
+            컨텍스트의 작업 페이지
+        """
+        context = self.browser.new_context()
+        if cookies:
+            context.add_cookies(cookies)
+        page = context.new_page()
+
+        self._contexts[name] = {"context": context, "page": page, "cookies": cookies}
+        return page
+
+    def page(self, name: str):
+        """컨텍스트의 작업 페이지 반환"""
+        return self._contexts[name]["page"]
+
+    def memory_usage(self) -> Dict[str, Optional[int]]:
+        """
+        컨텍스트별 JS 힙 사용량 (CDP Performance.getMetrics)
+
+        Returns:
+            {컨텍스트 이름: 바이트} (측정 실패 시 None)
+        """
+        usage = {}
+        for name, entry in self._contexts.items():
+            try:
+                session = entry["context"].new_cdp_session(entry["page"])
+                session.send("Performance.enable")
+                metrics = session.send("Performance.getMetrics")["metrics"]
+                session.detach()
+                usage[name] = int(next(m["value"] for m in metrics if m["name"] == "JSHeapUsedSize"))
+            except Exception:
+                usage[name] = None
+        return usage
+
+    def print_report(self):
+        """실행 시간 및 컨텍스트별 메모리 출력"""
+        print(f"\n🧭 브라우저 풀 상태")
+        if self.startup_seconds is not None:
+            print(f"   실행 시간: {self.startup_seconds:.2f}초 (재실행 {self.restart_count}회)")
+        for name, used in self.memory_usage().items():
+            used_text = f"{used / 1024 / 1024:.1f}MB" if used is not None else "측정 실패"
+            print(f"   [{name}] JS 힙: {used_text}")
+
+    def _close_browser(self):
+        """브라우저 종료 (오류 무시)"""
+        if self.browser is None:
+            return
+        try:
+            self.browser.close()
+        except Exception:
+            pass
+        self.browser = None
+        self._probe_page = None
+
+    def close(self):
+        """모든 컨텍스트 및 브라우저 종료"""
+        for entry in self._contexts.values():
+            try:
+                entry["context"].close()
+            except Exception:
+                pass
+        self._contexts = {}
+        self._close_browser()
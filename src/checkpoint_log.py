@@ -0,0 +1,245 @@
+"""추가 전용(append-only) 체크포인트 로그"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class CheckpointLog:
+    """
+    레코드 1건당 한 줄씩 추가 기록하는 체크포인트 로그
+
+    한 줄 형식: ``{key}\\t{status}\\t{json}\\n``
+
+    - 저장 비용은 레코드 크기에만 비례 (전체 결과를 다시 쓰지 않음)
+    - fsync는 N건 / T초 단위로 묶어서 수행
+    - 재시작 시에는 줄 앞부분의 key/status만 읽음 (JSON 파싱 없음)
+    - 같은 key가 여러 번 기록되면 마지막 기록이 유효
+    - 여러 스레드에서 동시에 append 가능
+    """
+
+    STATUS_OK = "ok"
+    STATUS_ERROR = "error"
+    STATUS_SKIPPED = "skipped"
+
+    def __init__(self, path: str, fsync_every: int = 20, fsync_interval: float = 2.0):
+        """
+        Args:
+            path: 로그 파일 경로
+            fsync_every: 몇 건마다 fsync 할지
+            fsync_interval: 마지막 fsync 후 몇 초가 지나면 fsync 할지
+        """
+        self.path = Path(path)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.RLock()
+
+    def exists(self) -> bool:
+        """로그 파일 존재 여부"""
+        return self.path.exists()
+
+    def append(self, key: str, record: Dict, status: str = STATUS_OK):
+        """레코드 1건 추가 기록"""
+        line = f"{key}\t{status}\t{json.dumps(record, ensure_ascii=False)}\n"
+
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._truncate_partial_tail()
+                self._file = open(self.path, "a", encoding="utf-8")
+
+            self._file.write(line)
+            self._pending += 1
+
+            if self._pending >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self.flush()
+
+    def flush(self):
+        """버퍼 내용을 디스크에 기록 (fsync)"""
+        with self._lock:
+            if self._file is None or self._pending == 0:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+
+    def close(self):
+        """로그 파일 닫기"""
+        with self._lock:
+            if self._file is None:
+                return
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def _truncate_partial_tail(self):
+        """중단으로 잘린 마지막 줄 제거 (다음 기록이 잘린 줄에 이어 붙지 않도록)"""
+        if not self.path.exists():
+            return
+        with open(self.path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+
+            # 마지막 개행 위치 찾기
+            pos = size
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                newline_at = chunk.rfind(b"\n")
+                if newline_at != -1:
+                    f.truncate(pos + newline_at + 1)
+                    return
+            f.truncate(0)
+
+    def _iter_lines(self) -> Iterator[str]:
+        """완전히 기록된 줄만 반환 (중단으로 잘린 마지막 줄은 무시)"""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.endswith("\n"):
+                    yield line
+
+    def scan_keys(self) -> Dict[str, str]:
+        """
+        key → 마지막 status 매핑 반환 (레코드 본문은 파싱하지 않음)
+
+        Returns:
+            {key: status}
+        """
+        self.flush()
+        statuses = {}
+        for line in self._iter_lines():
+            parts = line.split("\t", 2)
+            if len(parts) == 3:
+                statuses[parts[0]] = parts[1]
+        return statuses
+
+    def iter_records(self) -> Iterator[Tuple[str, str, Dict]]:
+        """(key, status, record) 순회"""
+        self.flush()
+        for line in self._iter_lines():
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            try:
+                record = json.loads(parts[2])
+            except json.JSONDecodeError:
+                continue
+            yield parts[0], parts[1], record
+
+    def latest_records(self) -> Dict[str, Tuple[str, Dict]]:
+        """
+        key별 마지막 기록 반환 (처음 등장한 순서 유지)
+
+        Returns:
+            {key: (status, record)}
+        """
+        latest = {}
+        for key, status, record in self.iter_records():
+            latest[key] = (status, record)
+        return latest
+
+    def rewrite(self, entries: Iterable[Tuple[str, str, Dict]]):
+        """로그 전체를 주어진 레코드로 교체 (임시 파일 기록 후 원자적 교체)"""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, status, record in entries:
+                f.write(f"{key}\t{status}\t{json.dumps(record, ensure_ascii=False)}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def import_json(self, json_path: str, key_field: str, ok_field: Optional[str] = None, ok_value: Optional[str] = None) -> int:
+        """
+        기존 JSON 결과 파일을 로그로 옮기기 (이전 버전 출력 파일 이어서 하기용)
+
+        Args:
+            json_path: JSON 리스트 파일 경로
+            key_field: key로 사용할 필드명
+            ok_field: 성공 여부를 판단할 필드명
+            ok_value: 성공으로 판단할 값
+
+        Returns:
+            옮긴 레코드 수
+        """
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return 0
+
+        entries = []
+        for record in records:
+            key = record.get(key_field)
+            if key is None:
+                continue
+            ok = ok_field is None or record.get(ok_field) == ok_value
+            entries.append((str(key), self.STATUS_OK if ok else self.STATUS_ERROR, record))
+
+        self.rewrite(entries)
+        return len(entries)
+
+    def compact(self, output_json: str, key_field: Optional[str] = None, keep_fields: Iterable[str] = ()) -> List[Dict]:
+        """
+        로그를 key별 최종 레코드 리스트로 정리하여 JSON 파일로 저장
+        (로그 파일도 key별 마지막 기록만 남도록 다시 써서 실행할 때마다 커지지 않게 함)
+
+        Args:
+            output_json: 최종 JSON 파일 경로
+            key_field: 기존 JSON과 레코드를 맞춰 볼 필드명 (keep_fields 사용 시)
+            keep_fields: 로그에는 없고 기존 JSON에만 있는 필드 중 유지할 필드 (grade.py 점수 등)
+
+        Returns:
+            최종 레코드 리스트
+        """
+        latest = self.latest_records()
+        self.rewrite((key, status, record) for key, (status, record) in latest.items())
+        records = [record for _, record in latest.values()]
+
+        keep_fields = tuple(keep_fields)
+        if key_field and keep_fields:
+            kept = self._existing_fields(output_json, key_field, keep_fields)
+            for record in records:
+                for field, value in kept.get(str(record.get(key_field)), {}).items():
+                    record.setdefault(field, value)
+
+        tmp_path = Path(output_json).with_name(Path(output_json).name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, output_json)
+
+        return records
+
+    @staticmethod
+    def _existing_fields(json_path: str, key_field: str, fields: Tuple[str, ...]) -> Dict[str, Dict]:
+        """기존 JSON 파일에서 key별 유지할 필드 값 읽기 (파일이 없거나 깨졌으면 빈 매핑)"""
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        kept = {}
+        for record in records:
+            if not isinstance(record, dict) or record.get(key_field) is None:
+                continue
+            values = {field: record[field] for field in fields if field in record}
+            if values:
+                kept[str(record[key_field])] = values
+        return kept
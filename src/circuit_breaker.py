@@ -0,0 +1,108 @@
+"""오류율 기반 회로 차단기 (LLM 호출 워커 전체 일시 정지)"""
+import threading
+import time
+from collections import deque
+
+
+class CircuitBreaker:
+    """
+    최근 호출의 실패 비율이 높으면 모든 워커의 호출을 잠시 멈춤
+
+    - 닫힘: 최근 window건 중 실패 비율이 failure_ratio 이상(최소 min_calls건)이면 열림
+    - 열림: cooldown초 동안 wait()에서 대기 (워커 풀 전체 정지)
+    - 반열림: cooldown 후 1건만 시험 호출, 성공하면 닫힘 / 실패하면 다시 열림
+    - 열림/반열림 중에는 시험 호출 결과만 반영 (열리기 전에 보낸 호출이 늦게 끝난 결과는 무시)
+    - pause(): 429 Retry-After 등 서버가 지정한 시간만큼 상태와 관계없이 전체 대기
+    - 여러 스레드에서 동시에 사용 가능
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, window: int = 20, failure_ratio: float = 0.5, min_calls: int = 5, cooldown: float = 30.0):
+        """
+        Args:
+            window: 실패 비율을 계산할 최근 호출 수
+            failure_ratio: 열림 기준 실패 비율 (0~1)
+            min_calls: 열림 판단에 필요한 최소 호출 수
+            cooldown: 열린 뒤 대기 시간 (초)
+        """
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=window)
+        self._resume_at = 0.0
+        self._probing = False
+        self._cond = threading.Condition()
+        self.opened = 0
+        self.waited_seconds = 0.0
+
+    def wait(self) -> bool:
+        """
+        호출 가능할 때까지 대기 (열림/일시 정지 중이거나 다른 워커가 시험 호출 중이면 대기)
+
+        Returns:
+            시험 호출 여부 (True면 결과를 record(..., probe=True)로 기록)
+        """
+        started = time.monotonic()
+        probe = False
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    self._cond.wait(self._resume_at - now)
+                    continue
+                if self.state == self.OPEN:
+                    self.state = self.HALF_OPEN
+                if self.state == self.HALF_OPEN:
+                    if self._probing:
+                        self._cond.wait(1.0)
+                        continue
+                    self._probing = True
+                    probe = True
+                break
+            self.waited_seconds += time.monotonic() - started
+        return probe
+
+    def record(self, success: bool, probe: bool = False):
+        """
+        호출 결과 기록 (정상 응답이면 success=True, 오류면 종류와 관계없이 False)
+
+        Args:
+            success: 성공 여부
+            probe: wait()가 시험 호출로 허용한 호출인지
+        """
+        with self._cond:
+            if self.state != self.CLOSED:
+                if not probe:
+                    return  # 열림/반열림 중 도착한 이전 호출 결과는 상태에 반영하지 않음
+                self._probing = False
+                if success:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                    print(f"✅ LLM 호출 재개 (시험 호출 성공)")
+                else:
+                    self._trip()
+                self._cond.notify_all()
+                return
+
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if (self.state == self.CLOSED and len(self._outcomes) >= self.min_calls
+                    and failures / len(self._outcomes) >= self.failure_ratio):
+                self._trip()
+
+    def pause(self, seconds: float):
+        """지정한 시간 동안 모든 호출 대기 (상태는 그대로)"""
+        with self._cond:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def _trip(self):
+        """열림 상태로 전환 (락 안에서 호출)"""
+        self.state = self.OPEN
+        self.opened += 1
+        self._outcomes.clear()
+        self._resume_at = max(self._resume_at, time.monotonic() + self.cooldown)
+        print(f"🛑 LLM 오류율 급증 - {self.cooldown:.1f}초 동안 호출 일시 정지")
@@ -0,0 +1,122 @@
+"""이력서 상세정보(자기소개서/자격증) 캐시"""
+import time
+from typing import Dict, Optional
+
+from src.checkpoint_log import CheckpointLog
+from src.parser import PersonDataParser
+
+
+class DetailCache:
+    """
+    이력서번호 기준 상세정보 영구 캐시 (TTL + 이력서 수정 신호)
+
+    - 캐시된 지 ttl_hours가 지나지 않은 상세정보는 페이지 방문 없이 재사용
+    - 요약의 '최근활동'에 "이력서 수정"이 캐시 시점 이후로 찍혀 있으면 다시 수집
+    - 저장소는 CheckpointLog (1건당 한 줄 추가 기록, 종료 시 만료 항목 정리)
+    """
+
+    MODIFIED_ACTIVITY = "이력서 수정"
+
+    def __init__(self, path: str = "output/detail_cache.jsonl", ttl_hours: float = 72, use_change_signal: bool = True):
+        """
+        Args:
+            path: 캐시 파일 경로
+            ttl_hours: 캐시 유효 시간 (시간 단위)
+            use_change_signal: '최근활동'의 이력서 수정 기록으로 캐시 무효화 여부
+        """
+        self.ttl_seconds = ttl_hours * 3600
+        self.use_change_signal = use_change_signal
+        self._log = CheckpointLog(path)
+        self._entries = {
+            rno: record
+            for rno, (status, record) in self._log.latest_records().items()
+            if status == CheckpointLog.STATUS_OK
+        }
+        self.stats = {"hit": 0, "miss": 0, "expired": 0, "modified": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def modified_at(cls, resume: Dict, observed_at: float) -> Optional[float]:
+        """
+        요약의 '최근활동'에서 마지막 이력서 수정 시각 추정
+
+        "N분전/N시간전/N일전/N주전/N개월전"을 observed_at 기준으로 환산.
+        "3일전"처럼 단위가 큰 표기는 가능한 가장 늦은 시각(observed_at - 3일)으로 잡아
+        애매하면 다시 수집하는 쪽으로 판단
+
+        Args:
+            resume: 요약 레코드
+            observed_at: 요약을 수집한 시각 (epoch 초)
+
+        Returns:
+            이력서 수정 시각 (epoch 초), 기록이 없으면 None
+        """
+        activity = resume.get("최근활동") or ""
+        latest = None
+        for item in activity.split(","):
+            if cls.MODIFIED_ACTIVITY not in item:
+                continue
+            minutes = PersonDataParser.parse_activity_minutes(item)
+            if minutes is None:
+                continue
+            modified = observed_at - minutes * 60
+            if latest is None or modified > latest:
+                latest = modified
+        return latest
+
+    def get(self, resume: Dict, observed_at: Optional[float] = None) -> Optional[Dict]:
+        """
+        유효한 캐시 상세정보 반환
+
+        Args:
+            resume: 요약 레코드 (이력서번호, 최근활동 포함)
+            observed_at: 요약을 수집한 시각 (None이면 현재 시각)
+
+        Returns:
+            {"자기소개서": ..., "자격증": ...} 또는 None (캐시 없음/만료/수정됨)
+        """
+        rno = str(resume.get("이력서번호"))
+        entry = self._entries.get(rno)
+        if entry is None:
+            self.stats["miss"] += 1
+            return None
+
+        now = time.time()
+        if now - entry["cached_at"] > self.ttl_seconds:
+            self.stats["expired"] += 1
+            return None
+
+        if self.use_change_signal:
+            modified = self.modified_at(resume, observed_at if observed_at is not None else now)
+            if modified is not None and modified > entry["cached_at"]:
+                self.stats["modified"] += 1
+                return None
+
+        self.stats["hit"] += 1
+        return {"자기소개서": entry["자기소개서"], "자격증": entry["자격증"]}
+
+    def put(self, rno: str, intro_data: Optional[list], cert_data: Optional[list]):
+        """상세정보 저장"""
+        entry = {
+            "자기소개서": intro_data,
+            "자격증": cert_data,
+            "cached_at": time.time(),
+        }
+        self._entries[str(rno)] = entry
+        self._log.append(str(rno), entry)
+
+    def close(self):
+        """만료된 항목을 정리하여 캐시 파일 다시 쓰기"""
+        now = time.time()
+        self._log.rewrite(
+            (rno, CheckpointLog.STATUS_OK, entry)
+            for rno, entry in self._entries.items()
+            if now - entry["cached_at"] <= self.ttl_seconds
+        )
+
+    def print_stats(self):
+        """캐시 통계 출력"""
+        s = self.stats
+        print(f"🗃️  상세정보 캐시: 적중 {s['hit']}개 / 없음 {s['miss']}개 / 만료 {s['expired']}개 / 이력서 수정 {s['modified']}개")
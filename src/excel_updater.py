@@ -0,0 +1,173 @@
+"""결과 엑셀 점수/제안문구 일괄 업데이트"""
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
+
+from src.exporter import ExcelExporter
+
+
+class ResultExcelUpdater:
+    """
+    결과 엑셀(main.py 출력)에 점수/제안문구 컬럼을 한 번에 기록
+
+    - 원본을 읽기 전용으로 1회 스트리밍하면서 이력서번호 → 값 매핑으로 행마다 바로 채움
+    - 컬럼 삽입(insert_cols) 대신 새 컬럼 배치로 행을 다시 구성해 쓰기 전용 통합문서로 저장
+    - 점수(나이 다음)와 제안문구(맨 뒤)를 같은 패스에서 기록 (로드/저장 1회)
+    """
+
+    SCORE_COLUMN = "점수"
+    OFFER_COLUMN = "제안문구"
+    SCORE_AFTER = "나이"
+    RNO_COLUMN = "이력서번호"
+
+    SCORE_WIDTH = 10
+    OFFER_WIDTH = 50
+
+    def __init__(self, excel_path: str):
+        """
+        Args:
+            excel_path: 결과 엑셀 파일 경로
+        """
+        self.excel_path = excel_path
+
+    def _layout(self, headers: list, write_scores: bool, write_offers: bool) -> Optional[Dict]:
+        """
+        새 헤더 배치 계산
+
+        Returns:
+            {"headers": 새 헤더, "source": 새 컬럼별 원본 인덱스(없으면 None),
+             "score": 점수 컬럼 인덱스, "offer": 제안문구 컬럼 인덱스, "rno": 이력서번호 원본 인덱스}
+            (이력서번호 컬럼이 없으면 None)
+        """
+        if self.RNO_COLUMN not in headers:
+            print(f"⚠️  '{self.RNO_COLUMN}' 컬럼을 찾을 수 없습니다.")
+            return None
+
+        new_headers = list(headers)
+        source = list(range(len(headers)))
+
+        if write_scores and self.SCORE_COLUMN not in new_headers:
+            if self.SCORE_AFTER in new_headers:
+                pos = new_headers.index(self.SCORE_AFTER) + 1
+                new_headers.insert(pos, self.SCORE_COLUMN)
+                source.insert(pos, None)
+            else:
+                print(f"⚠️  '{self.SCORE_AFTER}' 컬럼을 찾을 수 없습니다. 점수는 기록하지 않습니다.")
+                write_scores = False
+
+        if write_offers and self.OFFER_COLUMN not in new_headers:
+            new_headers.append(self.OFFER_COLUMN)
+            source.append(None)
+
+        return {
+            "headers": new_headers,
+            "source": source,
+            "score": new_headers.index(self.SCORE_COLUMN) if write_scores else None,
+            "offer": new_headers.index(self.OFFER_COLUMN) if write_offers else None,
+            "rno": headers.index(self.RNO_COLUMN),
+        }
+
+    def _column_widths(self, headers: list) -> Dict[str, float]:
+        """헤더명 기준 컬럼 너비 (ExcelExporter 너비 + 점수/제안문구)"""
+        exporter_widths = {
+            name: ExcelExporter.COLUMN_WIDTHS[get_column_letter(idx)]
+            for idx, name in enumerate(ExcelExporter.COLUMNS, 1)
+            if get_column_letter(idx) in ExcelExporter.COLUMN_WIDTHS
+        }
+        exporter_widths[self.SCORE_COLUMN] = self.SCORE_WIDTH
+        exporter_widths[self.OFFER_COLUMN] = self.OFFER_WIDTH
+        return {
+            get_column_letter(idx): exporter_widths[name]
+            for idx, name in enumerate(headers, 1)
+            if name in exporter_widths
+        }
+
+    def update(self, scores: Optional[Dict[str, int]] = None, offers: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+        """
+        점수/제안문구 컬럼 일괄 기록
+
+        Args:
+            scores: 이력서번호 → 총점 (None이면 점수 컬럼은 그대로)
+            offers: 이력서번호 → 제안문구 (None이면 제안문구 컬럼은 그대로)
+
+        Returns:
+            {"scores": 점수 입력 행 수, "offers": 제안문구 입력 행 수}
+        """
+        counts = {"scores": 0, "offers": 0}
+        if not Path(self.excel_path).exists():
+            print(f"⚠️  엑셀 파일을 찾을 수 없습니다: {self.excel_path}")
+            return counts
+
+        source_wb = openpyxl.load_workbook(self.excel_path, read_only=True)
+        source_ws = source_wb.active
+        rows = source_ws.iter_rows(values_only=True)
+        headers = list(next(rows, ()))
+
+        layout = self._layout(headers, scores is not None, offers is not None)
+        if layout is None:
+            source_wb.close()
+            return counts
+
+        if scores is not None and self.SCORE_COLUMN in headers:
+            print(f"⚠️  '{self.SCORE_COLUMN}' 컬럼이 이미 존재합니다. 기존 점수를 업데이트합니다.")
+        if offers is not None and self.OFFER_COLUMN in headers:
+            print(f"⚠️  '{self.OFFER_COLUMN}' 컬럼이 이미 존재합니다. 기존 제안문구를 업데이트합니다.")
+
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(source_ws.title)
+        for letter, width in self._column_widths(layout["headers"]).items():
+            ws.column_dimensions[letter].width = width
+
+        header_cells = []
+        for name in layout["headers"]:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal='center')
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        source = layout["source"]
+        score_idx, offer_idx, rno_idx = layout["score"], layout["offer"], layout["rno"]
+        score_align = Alignment(horizontal='center')
+        offer_align = Alignment(wrap_text=True, vertical='top')
+
+        for values in rows:
+            row = [values[i] if i is not None and i < len(values) else None for i in source]
+            rno = values[rno_idx] if rno_idx < len(values) else None
+            key = str(rno) if rno else None
+
+            if score_idx is not None and key in scores:
+                row[score_idx] = scores[key]
+                counts["scores"] += 1
+            if offer_idx is not None and key in offers:
+                row[offer_idx] = offers[key]
+                counts["offers"] += 1
+
+            # 점수/제안문구 셀 정렬 (기존 값 포함)
+            for idx, alignment in ((score_idx, score_align), (offer_idx, offer_align)):
+                if idx is not None and row[idx] is not None:
+                    cell = WriteOnlyCell(ws, value=row[idx])
+                    cell.alignment = alignment
+                    row[idx] = cell
+
+            ws.append(row)
+
+        source_wb.close()
+
+        # 임시 파일에 저장 후 교체 (저장 중 중단되어도 원본 유지)
+        tmp_path = f"{self.excel_path}.tmp.xlsx"
+        wb.save(tmp_path)
+        os.replace(tmp_path, self.excel_path)
+
+        print(f"\n📊 엑셀 파일 업데이트 완료!")
+        print(f"   파일: {self.excel_path}")
+        if scores is not None:
+            print(f"   점수 입력: {counts['scores']}개 행")
+        if offers is not None:
+            print(f"   제안문구 입력: {counts['offers']}개 행")
+        return counts
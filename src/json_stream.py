@@ -0,0 +1,116 @@
+"""대용량 JSON 배열 스트리밍 읽기/쓰기"""
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+def iter_json_array(path: str, buffer_chars: int = 1 << 20) -> Iterator[Any]:
+    """
+    JSON 배열 파일을 전체 로드하지 않고 원소 단위로 읽기
+
+    Args:
+        path: JSON 배열 파일 경로 ([{...}, {...}, ...])
+        buffer_chars: 한 번에 읽을 문자 수
+
+    Yields:
+        배열 원소
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill():
+            nonlocal buffer, pos, eof
+            chunk = f.read(buffer_chars)
+            if not chunk:
+                eof = True
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    return
+                fill()
+
+        # 여는 대괄호
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] != "[":
+            raise ValueError(f"JSON 배열 파일이 아닙니다: {path}")
+        pos += 1
+
+        while True:
+            skip_whitespace()
+            if pos >= len(buffer):
+                raise ValueError(f"JSON 배열이 닫히지 않았습니다: {path}")
+            if buffer[pos] == "]":
+                return
+            if buffer[pos] == ",":
+                pos += 1
+                continue
+
+            # 원소 하나 디코딩 (버퍼에 원소가 다 들어오지 않았으면 더 읽기)
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                    # 숫자처럼 버퍼 끝에서 잘렸을 수 있는 값은 더 읽어서 확인
+                    if end == len(buffer) and not eof:
+                        fill()
+                        continue
+                    break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    fill()
+            pos = end
+            yield item
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """size개씩 묶어서 반환"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class JsonArrayWriter:
+    """JSON 배열 파일을 원소 단위로 이어서 쓰기 (전체를 메모리에 올리지 않음)"""
+
+    def __init__(self, path: str, indent: int = 2):
+        """
+        Args:
+            path: 출력 파일 경로
+            indent: 들여쓰기 (json.dump와 동일한 형식)
+        """
+        self.path = path
+        self.indent = indent
+        self._file = None
+        self._count = 0
+
+    def __enter__(self):
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write("[")
+        return self
+
+    def write(self, item: Dict):
+        """원소 1개 쓰기"""
+        text = json.dumps(item, ensure_ascii=False, indent=self.indent)
+        pad = " " * self.indent
+        text = "\n".join(pad + line for line in text.split("\n"))
+        self._file.write(("," if self._count else "") + "\n" + text)
+        self._count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.write("\n]" if self._count else "]")
+        self._file.close()
+        self._file = None
@@ -0,0 +1,137 @@
+"""다중 키워드 매칭 (Aho-Corasick)"""
+import re
+from collections import deque
+from typing import Callable, Dict, FrozenSet, Iterable, List, Set
+
+
+# 공백/문장부호/기호 (접기 대상)
+FOLD_PATTERN = re.compile(r"[\W_]+")
+
+# 접기 규칙 버전 (바뀌면 같은 규칙 파일이라도 채점 결과가 달라지므로 채점키에 포함)
+FOLD_VERSION = 3
+
+# 필드 구분자 (접힌 키워드에는 나올 수 없으므로 필드 경계를 넘는 매칭 방지)
+FIELD_SEPARATOR = "\n"
+
+
+def default_normalize(text: str) -> str:
+    """기본 정규화 (소문자 + 앞뒤 공백 제거)"""
+    return str(text).lower().strip()
+
+
+def _fold_separator(match: re.Match) -> str:
+    """
+    공백/문장부호 구간 치환 문자열
+
+    - 앞뒤 중 한쪽이라도 한글 등 비ASCII 문자면 제거 ("보험 영업" → "보험영업", "B2B 영업" → "b2b영업")
+    - 양쪽 모두 영문/숫자면 공백 1개로 축소 ("C#, SQL" → "c sql", 서로 붙어서 새 단어가 되지 않도록)
+    - 텍스트 앞뒤는 제거
+    """
+    text = match.string
+    start, end = match.span()
+    if start == 0 or end == len(text):
+        return ""
+    if text[start - 1].isascii() and text[end].isascii():
+        return " "
+    return ""
+
+
+def fold_normalize(text: str) -> str:
+    """
+    접기 정규화 (소문자 + 한글 사이 공백/문장부호 제거, 영문 사이는 공백 1개)
+
+    "보험 영업", "보험영업", "보험-영업"이 모두 "보험영업"이 되므로
+    키워드 사전에 띄어쓰기 변형을 따로 둘 필요가 없음
+    """
+    return FOLD_PATTERN.sub(_fold_separator, str(text).lower())
+
+
+class KeywordMatcher:
+    """
+    키워드 그룹 사전을 하나의 Aho-Corasick 오토마톤으로 컴파일
+
+    - 텍스트 1회 스캔으로 등장한 키워드 그룹 집합 반환
+    - 스캔 비용은 텍스트 길이에 비례 (사전 크기와 무관)
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]], normalize: Callable[[str], str] = default_normalize):
+        """
+        Args:
+            groups: {그룹명: [키워드, ...]}
+            normalize: 키워드/텍스트 공통 정규화 함수
+        """
+        self.normalize = normalize
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[FrozenSet[str]] = [frozenset()]
+
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                self._add(self.normalize(keyword), name)
+        self._build_failure_links()
+
+    @property
+    def pattern_count(self) -> int:
+        """컴파일된 키워드 수"""
+        return sum(len(keywords) for keywords in self.groups.values())
+
+    def _add(self, keyword: str, group: str):
+        """트라이에 키워드 추가"""
+        if not keyword:
+            return
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(frozenset())
+            state = nxt
+        self._out[state] = self._out[state] | {group}
+
+    def _build_failure_links(self):
+        """실패 링크 계산 (BFS) 및 출력 집합 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                if state == 0:
+                    continue  # 루트의 자식은 루트로 실패
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] | self._out[self._fail[nxt]]
+
+    def scan(self, text: str) -> Set[str]:
+        """
+        텍스트에 등장한 키워드 그룹 집합 반환
+
+        Args:
+            text: 검사할 텍스트 (정규화 전)
+
+        Returns:
+            {그룹명, ...}
+        """
+        return self.scan_normalized(self.normalize(text))
+
+    def scan_normalized(self, text: str) -> Set[str]:
+        """이미 정규화된 텍스트 스캔 (정규화 결과를 재사용하는 경우)"""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+
+        hits = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits |= out[state]
+        return hits
@@ -0,0 +1,139 @@
+"""LLM 호출 백엔드 (OpenAI SDK / OpenAI 호환 HTTP 서버)"""
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import requests
+
+
+class LLMBackendError(Exception):
+    """LLM 서버 오류 응답 (상태 코드, Retry-After 포함)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 → 대기 초 (초 단위 숫자 또는 HTTP 날짜)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMBackend:
+    """
+    Chat Completions 요청 1건을 보내는 백엔드 인터페이스
+
+    - chat(): 요청 본문(model, messages, temperature, response_format) → (응답 텍스트, 사용 토큰)
+    - 사용 토큰은 {"prompt_tokens", "completion_tokens", "total_tokens"} (서버가 주지 않으면 None)
+    - 서버 오류/연결 오류는 LLMBackendError로 변환 (재시도 판단용 상태 코드, Retry-After)
+    - 재시도는 호출하는 쪽에서 처리 (백엔드는 1번만 요청)
+    """
+
+    name = "base"
+
+    def chat(self, body: Dict) -> Tuple[str, Optional[Dict[str, int]]]:
+        raise NotImplementedError
+
+    def close(self):
+        """연결 정리"""
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI 공식 SDK 백엔드 (배치 API도 이 백엔드의 client로 사용)"""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        """
+        Args:
+            api_key: OpenAI API 키
+            base_url: API 주소 (None이면 OpenAI 기본 주소)
+        """
+        import openai
+
+        self._errors = openai
+        self.client = openai.OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+
+    def chat(self, body: Dict) -> Tuple[str, Optional[Dict[str, int]]]:
+        try:
+            response = self.client.chat.completions.create(**body)
+        except self._errors.APIStatusError as e:
+            raise LLMBackendError(
+                str(e),
+                status_code=e.status_code,
+                retry_after=parse_retry_after(e.response.headers.get("retry-after")),
+            ) from e
+        except self._errors.APIConnectionError as e:
+            raise LLMBackendError(f"연결 오류: {e}") from e
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            usage = {
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens,
+            }
+        return response.choices[0].message.content, usage
+
+
+class HTTPBackend(LLMBackend):
+    """
+    OpenAI 호환 HTTP 서버 백엔드 (requests로 직접 호출)
+
+    - 로컬 테스트 서버(MockLLMServer), 사내 프록시 등 /chat/completions를 제공하는 서버용
+    - 스레드마다 별도 세션 (동시 요청 시 연결 재사용)
+    """
+
+    name = "http"
+
+    def __init__(self, base_url: str, api_key: Optional[str] = None, timeout: float = 60):
+        """
+        Args:
+            base_url: API 주소 (예: "http://127.0.0.1:8000/v1")
+            api_key: Bearer 토큰 (없으면 인증 헤더 생략)
+            timeout: 요청 제한 시간 (초)
+        """
+        self.url = f"{base_url.rstrip('/')}/chat/completions"
+        self.api_key = api_key
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            if self.api_key:
+                session.headers["Authorization"] = f"Bearer {self.api_key}"
+            self._local.session = session
+        return session
+
+    def chat(self, body: Dict) -> Tuple[str, Optional[Dict[str, int]]]:
+        try:
+            response = self._session().post(self.url, json=body, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise LLMBackendError(f"연결 오류: {e}") from e
+
+        if response.status_code >= 400:
+            raise LLMBackendError(
+                f"HTTP {response.status_code}: {response.text[:200]}",
+                status_code=response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        data = response.json()
+        return data["choices"][0]["message"]["content"], data.get("usage")
+
+    def close(self):
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            session.close()
@@ -0,0 +1,125 @@
+"""LLM 호출 통계 (토큰/응답 시간/재시도/오류)"""
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class LLMTelemetry:
+    """
+    호출 방식(1명씩/묶음)별 LLM 호출 통계 수집 및 요약 출력
+
+    - 호출마다 요청/응답 토큰, 응답 시간 기록 (응답 시간 분위수 계산용으로 모두 보관)
+    - 재시도, 오류, 재시도 대기열 이동/최종 실패, 묶음 응답 누락으로 인한 재생성 인원 집계
+    - 기본 템플릿(자기소개서/자격증 없음, LLM 호출 없음) 사용 건수는 실패와 따로 집계
+    - 여러 스레드에서 동시에 사용 가능
+    """
+
+    PATH_LABELS = {"single": "1명씩", "multi": "묶음"}
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.paths = {
+            path: {"calls": 0, "offers": 0, "prompt_tokens": 0, "completion_tokens": 0, "errors": 0, "latencies": []}
+            for path in self.PATH_LABELS
+        }
+        self.retries = 0
+        self.templated = 0            # 자기소개서/자격증이 없어 LLM 없이 기본 템플릿 사용
+        self.deferred = 0             # 재시도 소진으로 재시도 대기열에 넣은 건수
+        self.failed = 0               # 재시도 대기열까지 실패해서 제안문구를 비워 둔 인원
+        self.regenerated = 0          # 묶음 응답 누락/검증 실패로 1명씩 다시 생성
+        self.truncated = set()        # 토큰 예산 때문에 자기소개서/자격증을 줄인 이력서번호
+
+    def record_call(self, path: str, offers: int, prompt_tokens: int, completion_tokens: int, latency: float):
+        """
+        성공한 호출 1건 기록
+
+        Args:
+            path: "single" 또는 "multi"
+            offers: 요청에 포함된 인원
+            prompt_tokens: 요청 토큰 수
+            completion_tokens: 응답 토큰 수
+            latency: 응답 시간 (초)
+        """
+        with self._lock:
+            total = self.paths[path]
+            total["calls"] += 1
+            total["offers"] += offers
+            total["prompt_tokens"] += prompt_tokens
+            total["completion_tokens"] += completion_tokens
+            total["latencies"].append(latency)
+
+    def record_error(self, path: str):
+        """실패한 호출 1건 기록"""
+        with self._lock:
+            self.paths[path]["errors"] += 1
+
+    def increment(self, name: str, count: int = 1):
+        """재시도/템플릿/대기열/실패/재생성 집계 (retries, templated, deferred, failed, regenerated)"""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + count)
+
+    def record_truncated(self, key: str):
+        """토큰 예산 때문에 정보를 줄인 지원자 기록 (같은 사람은 1번만 집계)"""
+        with self._lock:
+            self.truncated.add(key)
+
+    @staticmethod
+    def _percentile(values: list, ratio: float) -> float:
+        """정렬된 값의 분위수 (최근접 순위)"""
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(ratio * len(values)))]
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        호출 방식별 요약
+
+        Returns:
+            {"single"/"multi": {"calls", "offers", "errors", "error_rate", "prompt_tokens", "completion_tokens",
+                                "tokens_per_offer", "latency_per_offer", "latency_avg", "latency_p50", "latency_p95"}}
+        """
+        result = {}
+        with self._lock:
+            for path, total in self.paths.items():
+                attempts = total["calls"] + total["errors"]
+                if not attempts:
+                    continue
+                latencies = sorted(total["latencies"])
+                offers = max(1, total["offers"])
+                result[path] = {
+                    "calls": total["calls"],
+                    "offers": total["offers"],
+                    "errors": total["errors"],
+                    "error_rate": total["errors"] / attempts,
+                    "prompt_tokens": total["prompt_tokens"],
+                    "completion_tokens": total["completion_tokens"],
+                    "tokens_per_offer": (total["prompt_tokens"] / offers, total["completion_tokens"] / offers),
+                    "latency_per_offer": sum(latencies) / offers,
+                    "latency_avg": sum(latencies) / len(latencies) if latencies else 0.0,
+                    "latency_p50": self._percentile(latencies, 0.5),
+                    "latency_p95": self._percentile(latencies, 0.95),
+                }
+        return result
+
+    def print_summary(self, price_per_1m: Optional[Tuple[float, float]] = None):
+        """
+        실행 종료 시 통계 출력
+
+        Args:
+            price_per_1m: (요청, 응답) 100만 토큰당 가격(USD), 주면 예상 비용도 출력
+        """
+        summary = self.summary()
+        if not summary and not self.deferred and not self.templated:
+            return
+
+        print(f"📈 LLM 호출 통계")
+        for path, s in summary.items():
+            prompt_per_offer, completion_per_offer = s["tokens_per_offer"]
+            line = (f"   {self.PATH_LABELS[path]} 요청: {s['calls']}회 / {s['offers']}명, 오류 {s['errors']}회 ({s['error_rate']:.1%}), "
+                    f"1건당 요청 {prompt_per_offer:,.0f} + 응답 {completion_per_offer:,.0f} 토큰 / {s['latency_per_offer']:.2f}초, "
+                    f"호출 응답 시간 평균 {s['latency_avg']:.2f}초 / p50 {s['latency_p50']:.2f}초 / p95 {s['latency_p95']:.2f}초")
+            if price_per_1m:
+                cost = (s["prompt_tokens"] * price_per_1m[0] + s["completion_tokens"] * price_per_1m[1]) / 1_000_000
+                line += f", 약 ${cost:.4f}"
+            print(line)
+        print(f"   기본 템플릿 {self.templated}건 (LLM 호출 없음), 재시도 {self.retries}회, 재시도 대기열 {self.deferred}건, 최종 실패 {self.failed}명, "
+              f"묶음 누락 재생성 {self.regenerated}명, 토큰 예산 축소 {len(self.truncated)}명")
@@ -0,0 +1,167 @@
+"""부하 테스트용 로컬 LLM 서버 (OpenAI Chat Completions 호환)"""
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class MockLLMServer:
+    """
+    API 키/비용 없이 제안문구 생성 처리량을 측정하기 위한 로컬 서버
+
+    - POST /v1/chat/completions 만 처리, 응답 형식은 OpenAI와 동일 (choices, usage)
+    - 응답 지연(latency ± jitter), 오류 주입(error_rate → 500), 분당 요청 한도(rpm_limit → 429 + Retry-After)
+    - response_format이 json_object면 프롬프트의 "### 이력서번호 N" 항목마다 문구를 넣은 JSON 응답
+    - 백그라운드 스레드에서 실행, with 문 또는 start()/stop()
+    """
+
+    OFFER_TEXT = ("안녕하세요. 한국중소기업진흥원 입니다.\n"
+                  "고객 응대 경험을 갖춘 인재라고 생각되어 이렇게 제안 드립니다.\n"
+                  "긍정적인 검토 부탁 드리며, 관련 자세한 내용이 궁금하시다면 응답기간 내 회신 부탁 드립니다.")
+    RNO_PATTERN = re.compile(r"### 이력서번호 (\S+)")
+
+    def __init__(
+        self,
+        latency: float = 0.2,
+        jitter: float = 0.05,
+        error_rate: float = 0.0,
+        rpm_limit: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0
+    ):
+        """
+        Args:
+            latency: 평균 응답 지연 (초)
+            jitter: 응답 지연 변동폭 (초, ±)
+            error_rate: 500 오류 응답 비율 (0~1)
+            rpm_limit: 분당 최대 요청 수 (초과 시 429, None이면 제한 없음)
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            seed: 지연/오류 난수 시드
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rpm_limit = rpm_limit
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent = deque()  # 최근 60초 요청 시각
+        self.stats = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0}
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """HTTPBackend에 넘길 API 주소"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _admit(self) -> tuple:
+        """
+        요청 1건 허용 여부 결정
+
+        Returns:
+            (상태 코드, Retry-After 초, 응답 지연 초)
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+
+            if self.rpm_limit and len(self._recent) >= self.rpm_limit:
+                self.stats["rate_limited"] += 1
+                return 429, math.ceil(60 - (now - self._recent[0])), 0.0
+
+            self._recent.append(now)
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            if self._rng.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 500, None, delay
+
+            self.stats["ok"] += 1
+            return 200, None, delay
+
+    def _completion(self, body: dict) -> dict:
+        """요청 본문 → Chat Completions 응답"""
+        prompt = "".join(message.get("content", "") for message in body.get("messages", []))
+        if (body.get("response_format") or {}).get("type") == "json_object":
+            rnos = self.RNO_PATTERN.findall(prompt)
+            content = json.dumps({"offers": {rno: self.OFFER_TEXT for rno in rnos}}, ensure_ascii=False)
+        else:
+            content = self.OFFER_TEXT
+
+        prompt_tokens, completion_tokens = len(prompt), len(content)
+        return {
+            "id": f"mock-{time.time_ns()}",
+            "object": "chat.completion",
+            "model": body.get("model", "mock"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연(Nagle + delayed ACK) 방지
+
+            def _reply(self, status: int, payload: dict, retry_after: Optional[int] = None):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if retry_after is not None:
+                    self.send_header("Retry-After", str(retry_after))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._reply(404, {"error": {"message": "not found"}})
+                    return
+
+                status, retry_after, delay = server._admit()
+                time.sleep(delay)
+                if status == 429:
+                    self._reply(429, {"error": {"message": "rate limit exceeded", "type": "rate_limit"}}, retry_after)
+                elif status == 500:
+                    self._reply(500, {"error": {"message": "injected server error", "type": "server_error"}})
+                else:
+                    self._reply(200, server._completion(body))
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
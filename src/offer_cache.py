@@ -0,0 +1,128 @@
+"""포지션 제안 문구 생성 결과 캐시"""
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from src.checkpoint_log import CheckpointLog
+
+
+class OfferCache:
+    """
+    LLM 요청 내용 기준 제안 문구 영구 캐시 (개수/기간 제한)
+
+    - 키: 요청 본문(모델, 온도, 시스템/사용자 프롬프트)의 해시 → 경력/직무/자기소개서 요약/자격증이 같으면 적중
+    - 적중하면 API 호출 없이 재사용, 절약한 토큰/응답 시간 집계
+    - 저장소는 CheckpointLog (1건당 한 줄 추가 기록, 종료 시 오래된 항목/초과분 정리)
+    """
+
+    def __init__(self, path: str = "output/offer_cache.jsonl", max_entries: int = 5000, max_age_days: float = 30):
+        """
+        Args:
+            path: 캐시 파일 경로
+            max_entries: 최대 보관 개수 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+            max_age_days: 보관 기간 (일 단위, 지나면 다시 생성)
+        """
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+        self._log = CheckpointLog(path)
+        self._entries = {
+            key: record
+            for key, (status, record) in self._log.latest_records().items()
+            if status == CheckpointLog.STATUS_OK
+        }
+        self._lock = threading.Lock()
+        self.stats = {"hit": 0, "miss": 0, "expired": 0, "saved_prompt_tokens": 0, "saved_completion_tokens": 0, "saved_seconds": 0.0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(request_body: Dict) -> str:
+        """요청 본문 해시 (키 순서와 무관)"""
+        payload = json.dumps(request_body, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        유효한 캐시 제안 문구 반환
+
+        Args:
+            key: key()로 만든 요청 해시
+
+        Returns:
+            제안 문구 또는 None (캐시 없음/만료)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["miss"] += 1
+                return None
+
+            now = time.time()
+            if now - entry["cached_at"] > self.max_age_seconds:
+                self.stats["expired"] += 1
+                return None
+
+            entry["last_used"] = now
+            self.stats["hit"] += 1
+            self.stats["saved_prompt_tokens"] += entry.get("prompt_tokens", 0)
+            self.stats["saved_completion_tokens"] += entry.get("completion_tokens", 0)
+            self.stats["saved_seconds"] += entry.get("latency", 0.0)
+            return entry["offer"]
+
+    def put(self, key: str, offer: str, prompt_tokens: int = 0, completion_tokens: int = 0, latency: float = 0.0):
+        """
+        생성 결과 저장
+
+        Args:
+            key: 요청 해시
+            offer: 생성된 제안 문구
+            prompt_tokens: 요청 토큰 수
+            completion_tokens: 응답 토큰 수
+            latency: 응답 시간 (초)
+        """
+        now = time.time()
+        entry = {
+            "offer": offer,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "latency": round(latency, 3),
+            "cached_at": now,
+            "last_used": now,
+        }
+        with self._lock:
+            self._entries[key] = entry
+        self._log.append(key, entry)
+
+    def close(self):
+        """오래된 항목과 개수 초과분을 정리하여 캐시 파일 다시 쓰기"""
+        now = time.time()
+        with self._lock:
+            fresh = [
+                (key, entry) for key, entry in self._entries.items()
+                if now - entry["cached_at"] <= self.max_age_seconds
+            ]
+            fresh.sort(key=lambda item: item[1]["last_used"], reverse=True)
+            kept = fresh[:self.max_entries]
+            self._entries = dict(kept)
+
+        self._log.rewrite((key, CheckpointLog.STATUS_OK, entry) for key, entry in kept)
+
+    def print_stats(self, price_per_1m: Optional[Tuple[float, float]] = None):
+        """
+        캐시 통계 출력
+
+        Args:
+            price_per_1m: (요청, 응답) 100만 토큰당 가격(USD), 주면 절약 비용도 출력
+        """
+        s = self.stats
+        saved_tokens = s["saved_prompt_tokens"] + s["saved_completion_tokens"]
+        print(f"🗃️  제안문구 캐시: 적중 {s['hit']}개 / 없음 {s['miss']}개 / 만료 {s['expired']}개")
+        if s["hit"]:
+            line = f"   절약: API 호출 {s['hit']}회, 토큰 {saved_tokens:,}개, 응답 대기 {s['saved_seconds']:.1f}초"
+            if price_per_1m:
+                cost = (s["saved_prompt_tokens"] * price_per_1m[0] + s["saved_completion_tokens"] * price_per_1m[1]) / 1_000_000
+                line += f", 약 ${cost:.4f}"
+            print(line)
@@ -34,7 +34,8 @@ class PersonDataParser:
 
         return people
 
-    def _parse_activity_minutes(self, activity_text: str) -> Optional[int]:
+    @staticmethod
+    def parse_activity_minutes(activity_text: str) -> Optional[int]:
         """
         활동 시간 텍스트에서 분 단위로 변환
 
@@ -42,6 +43,9 @@ class PersonDataParser:
         - "10분전 이력서 수정" → 10
         - "1시간전 공고 스크랩" → 60
         - "2시간 30분전 입사지원" → 150
+        - "3일전 이력서 수정" → 4320
+        - "2주전 공고 스크랩" → 20160
+        - "1개월전 이력서 수정" → 43200 (1개월 = 30일)
         - "최근 활동 인재" → None
         """
         if not activity_text:
@@ -49,6 +53,12 @@ class PersonDataParser:
 
         total_minutes = 0
 
+        # "3일전", "2주전", "1개월전" 형식
+        for unit, unit_minutes in (("개월", 30 * 24 * 60), ("주", 7 * 24 * 60), ("일", 24 * 60)):
+            unit_match = re.search(rf'(\d+)\s*{unit}', activity_text)
+            if unit_match:
+                total_minutes += int(unit_match.group(1)) * unit_minutes
+
         # "1시간전", "2시간 전" 형식
         hour_match = re.search(r'(\d+)\s*시간', activity_text)
         if hour_match:
@@ -138,7 +148,7 @@ class PersonDataParser:
             text = li.get_text(strip=True)
 
             # 시간 정보가 있는 활동만 수집
-            activity_minutes = self._parse_activity_minutes(text)
+            activity_minutes = self.parse_activity_minutes(text)
 
             if activity_minutes is not None:
                 activity_items.append(text)
@@ -0,0 +1,83 @@
+"""분당 요청 수/토큰 수 제한 (LLM API 호출용)"""
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 지키는 토큰 버킷
+
+    - 버킷 용량은 분당 한도, 초당 한도/60씩 다시 채워짐
+    - acquire()는 요청 1건 + 예상 토큰이 모두 확보될 때까지 대기
+    - 응답 후 실제 사용 토큰으로 settle()하면 예상치와의 차이를 보정
+    - 여러 스레드에서 동시에 사용 가능
+    """
+
+    def __init__(self, rpm_limit: Optional[int] = None, tpm_limit: Optional[int] = None):
+        """
+        Args:
+            rpm_limit: 분당 최대 요청 수 (None이면 제한 없음)
+            tpm_limit: 분당 최대 토큰 수 (None이면 제한 없음)
+        """
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self._requests = float(rpm_limit or 0)
+        self._tokens = float(tpm_limit or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float):
+        """경과 시간만큼 버킷 채우기"""
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm_limit:
+            self._requests = min(self.rpm_limit, self._requests + elapsed * self.rpm_limit / 60)
+        if self.tpm_limit:
+            self._tokens = min(self.tpm_limit, self._tokens + elapsed * self.tpm_limit / 60)
+
+    def acquire(self, tokens: int = 0):
+        """
+        요청 1건 + 토큰 확보 (한도 초과 시 대기)
+
+        Args:
+            tokens: 이번 요청의 예상 토큰 수 (TPM 한도보다 크면 한도로 간주)
+        """
+        if self.tpm_limit:
+            tokens = min(tokens, self.tpm_limit)
+
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                wait = 0.0
+                if self.rpm_limit and self._requests < 1:
+                    wait = max(wait, (1 - self._requests) * 60 / self.rpm_limit)
+                if self.tpm_limit and self._tokens < tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tpm_limit)
+
+                if wait == 0.0:
+                    if self.rpm_limit:
+                        self._requests -= 1
+                    if self.tpm_limit:
+                        self._tokens -= tokens
+                    self.waited_seconds += now - started
+                    return
+            time.sleep(wait)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """
+        실제 사용 토큰으로 보정 (예상보다 적게 쓰면 반환, 많이 쓰면 추가 차감)
+
+        Args:
+            estimated_tokens: acquire()에 넘긴 예상 토큰 수
+            actual_tokens: 응답의 실제 사용 토큰 수
+        """
+        if not self.tpm_limit:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.tpm_limit, self._tokens + estimated_tokens - actual_tokens)
@@ -0,0 +1,68 @@
+"""LLM 호출 오류 분류 및 재시도 대기 시간 (지수 백오프 + 지터)"""
+import random
+from typing import Optional
+
+from src.llm_backend import LLMBackendError
+
+
+class RetryPolicy:
+    """
+    오류 종류별 재시도 여부와 대기 시간 결정
+
+    - rate_limit: 429 → 재시도 (Retry-After가 있으면 최소 그만큼 대기)
+    - transient: 5xx/408/409, 연결 오류/타임아웃 → 재시도
+    - fatal: 그 외 4xx(잘못된 요청, 인증 오류 등), 응답 파싱 오류 → 재시도하지 않음
+    - 대기 시간은 min(max_delay, base_delay × 2^시도) 범위의 무작위 값 (여러 워커가 동시에 재시도하지 않도록)
+    """
+
+    RATE_LIMIT = "rate_limit"
+    TRANSIENT = "transient"
+    FATAL = "fatal"
+
+    RETRYABLE_STATUS = {408, 409, 429}
+
+    def __init__(self, max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 30.0, seed: Optional[int] = None):
+        """
+        Args:
+            max_retries: 요청 1건당 최대 재시도 횟수
+            base_delay: 첫 재시도 최대 대기 (초)
+            max_delay: 재시도 대기 상한 (초, Retry-After는 상한과 관계없이 따름)
+            seed: 지터 난수 시드
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = random.Random(seed)
+
+    def classify(self, error: Exception) -> str:
+        """
+        오류 분류
+
+        Returns:
+            RATE_LIMIT / TRANSIENT / FATAL
+        """
+        if not isinstance(error, LLMBackendError):
+            return self.FATAL
+        status = error.status_code
+        if status == 429:
+            return self.RATE_LIMIT
+        if status is None or status >= 500 or status in self.RETRYABLE_STATUS:
+            return self.TRANSIENT
+        return self.FATAL
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        재시도 전 대기 시간
+
+        Args:
+            attempt: 지금까지 실패한 횟수 - 1 (0부터)
+            retry_after: 서버가 지정한 대기 시간 (초)
+
+        Returns:
+            대기 초
+        """
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = self._rng.uniform(0, backoff)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
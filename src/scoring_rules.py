@@ -0,0 +1,234 @@
+"""채점 규칙 로드/컴파일/자동 재로드"""
+import hashlib
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.keyword_matcher import KeywordMatcher, fold_normalize
+
+
+# 기본 규칙 파일 (실행 위치와 관계없이 저장소의 data/scoring_rules.json)
+DEFAULT_RULES_PATH = str(Path(__file__).resolve().parent.parent / "data" / "scoring_rules.json")
+DEFAULT_RULES_SHEET = "채점규칙"
+
+
+class ScoringRules:
+    """
+    컴파일된 채점 규칙 (키워드 사전, 정규식, 배점)
+
+    - keywords: {그룹명: [키워드, ...]} → 접기 정규화 후 하나의 KeywordMatcher로 컴파일
+    - regex: {이름: 컴파일된 정규식}
+    - points: 항목별 배점
+    - version / content_hash: 규칙 버전 식별 (version_key = "버전:해시 앞 12자리")
+    """
+
+    def __init__(self, version: str, keywords: Dict[str, List[str]], regex: Dict[str, re.Pattern], points: Dict, content_hash: str, source: str,
+                 matcher: KeywordMatcher = None):
+        self.version = version
+        self.keywords = keywords
+        self.regex = regex
+        self.points = points
+        self.content_hash = content_hash
+        self.source = source
+        self.matcher = matcher or KeywordMatcher(keywords, normalize=fold_normalize)
+
+    @property
+    def version_key(self) -> str:
+        """규칙 버전 + 내용 해시"""
+        return f"{self.version}:{self.content_hash[:12]}"
+
+    @classmethod
+    def from_dict(cls, data: Dict, content_hash: str, source: str = "") -> "ScoringRules":
+        """규칙 딕셔너리 → ScoringRules"""
+        regex = {}
+        for name, spec in data.get("regex", {}).items():
+            flags = 0
+            for flag in spec.get("flags", []):
+                flags |= getattr(re, flag)
+            regex[name] = re.compile(spec["pattern"], flags)
+
+        return cls(
+            version=str(data.get("version", "unversioned")),
+            keywords={name: list(keywords) for name, keywords in data["keywords"].items()},
+            regex=regex,
+            points=data["points"],
+            content_hash=content_hash,
+            source=source,
+        )
+
+
+    def with_overrides(self, name: str, overrides: Dict) -> "ScoringRules":
+        """
+        일부 항목만 바꾼 규칙 변형 생성 (what-if 비교용)
+
+        - points: 섹션별로 덮어쓸 배점 (예: {"cert": {"certHigh": 25}})
+        - keywords: 교체할 키워드 그룹 (예: {"certLight": ["운전면허"]})
+        - 키워드가 그대로면 매처/정규식을 재사용 (다시 컴파일하지 않음)
+
+        Args:
+            name: 변형 이름 (버전에 덧붙임)
+            overrides: {"points": {...}, "keywords": {...}}
+
+        Returns:
+            ScoringRules
+        """
+        points = {section: dict(values) for section, values in self.points.items()}
+        for section, values in overrides.get("points", {}).items():
+            points.setdefault(section, {}).update(values)
+
+        keywords = self.keywords
+        matcher = self.matcher
+        if overrides.get("keywords"):
+            keywords = {**self.keywords, **overrides["keywords"]}
+            matcher = None
+
+        payload = json.dumps([self.content_hash, overrides], ensure_ascii=False, sort_keys=True)
+        return ScoringRules(
+            version=f"{self.version}+{name}",
+            keywords=keywords,
+            regex=self.regex,
+            points=points,
+            content_hash=hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+            source=self.source,
+            matcher=matcher,
+        )
+
+
+def _parse_rules_sheet(path: str, sheet_name: str) -> Dict:
+    """
+    엑셀 '채점규칙' 시트 → 규칙 딕셔너리
+
+    시트 형식 (컬럼: 구분, 이름, 값):
+        버전   | -                | 2025.11.1
+        키워드 | insuranceSales   | 보험 영업, 보험상품, 설계사
+        정규식 | toeic            | (TOEIC|토익)\\s*[:\\-]?\\s*(\\d{3,4})   (대소문자 무시)
+        점수   | sales.general    | 15
+        점수   | lang.toeic       | 900:5, 700:3, 600:1
+    """
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    ws = wb[sheet_name]
+    rows = ws.iter_rows(values_only=True)
+    headers = [str(h).strip() if h is not None else "" for h in next(rows)]
+    col = {name: headers.index(name) for name in ("구분", "이름", "값")}
+
+    data = {"version": "unversioned", "keywords": {}, "regex": {}, "points": {}}
+    for row in rows:
+        kind = row[col["구분"]]
+        name = row[col["이름"]]
+        value = row[col["값"]]
+        if kind is None or value is None:
+            continue
+        kind = str(kind).strip()
+
+        if kind == "버전":
+            data["version"] = str(value).strip()
+        elif kind == "키워드":
+            keywords = [kw.strip() for kw in str(value).split(",") if kw.strip()]
+            data["keywords"].setdefault(str(name).strip(), []).extend(keywords)
+        elif kind == "정규식":
+            data["regex"][str(name).strip()] = {"pattern": str(value), "flags": ["IGNORECASE"]}
+        elif kind == "점수":
+            section, key = str(name).strip().split(".", 1)
+            if isinstance(value, str) and ":" in value:
+                value = [[int(a), int(b)] for a, b in (pair.split(":") for pair in value.split(","))]
+            data["points"].setdefault(section, {})[key] = value
+
+    wb.close()
+    return data
+
+
+# 내용 해시 → 컴파일된 규칙 (같은 내용이면 다시 컴파일하지 않음)
+_compiled_rules: Dict[str, ScoringRules] = {}
+_compiled_lock = threading.Lock()
+
+
+def load_rules(path: str = DEFAULT_RULES_PATH, sheet_name: str = DEFAULT_RULES_SHEET) -> ScoringRules:
+    """
+    규칙 파일 로드 (JSON 또는 엑셀 시트), 내용 해시 기준으로 컴파일 결과 캐시
+
+    - JSON: 파일 내용 해시
+    - 엑셀: 규칙 시트를 읽은 결과의 해시 (계정 등 다른 시트를 고쳐도 규칙 버전은 그대로)
+
+    Args:
+        path: 규칙 파일 경로 (.json 또는 .xlsx)
+        sheet_name: 엑셀일 때 규칙 시트명
+
+    Returns:
+        ScoringRules
+    """
+    if str(path).endswith(".xlsx"):
+        data = _parse_rules_sheet(path, sheet_name)
+        raw = json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    else:
+        data = None
+        raw = Path(path).read_bytes()
+    content_hash = hashlib.sha256(raw).hexdigest()
+
+    with _compiled_lock:
+        cached = _compiled_rules.get(content_hash)
+        if cached is not None:
+            return cached
+
+        if data is None:
+            data = json.loads(raw.decode("utf-8"))
+
+        rules = ScoringRules.from_dict(data, content_hash, source=str(path))
+        _compiled_rules[content_hash] = rules
+        return rules
+
+
+class RulesWatcher:
+    """규칙 파일 변경 감지 및 자동 재로드 (재시작 없이 반영)"""
+
+    def __init__(self, path: str = DEFAULT_RULES_PATH, sheet_name: str = DEFAULT_RULES_SHEET, check_interval: float = 1.0):
+        """
+        Args:
+            path: 규칙 파일 경로
+            sheet_name: 엑셀일 때 규칙 시트명
+            check_interval: 파일 변경 확인 간격(초), 0이면 매번 확인
+        """
+        self.path = path
+        self.sheet_name = sheet_name
+        self.check_interval = check_interval
+        self._stat = self._file_stat()
+        self._rules = load_rules(path, sheet_name)
+        self._last_check = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _file_stat(self) -> Optional[tuple]:
+        """파일 변경 감지용 (수정시각, 크기)"""
+        try:
+            st = Path(self.path).stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def current(self) -> ScoringRules:
+        """현재 규칙 반환 (파일이 바뀌었으면 재로드)"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return self._rules
+
+        with self._lock:
+            self._last_check = now
+            stat = self._file_stat()
+            if stat is None or stat == self._stat:
+                return self._rules
+
+            try:
+                rules = load_rules(self.path, self.sheet_name)
+            except Exception as e:
+                # 편집 중인 파일 등 → 기존 규칙 유지, 다음 확인 때 재시도
+                print(f"⚠️  채점 규칙 재로드 실패 (기존 규칙 유지): {e}")
+                return self._rules
+
+            self._stat = stat
+            if rules.content_hash != self._rules.content_hash:
+                print(f"🔄 채점 규칙 재로드: {self._rules.version_key} → {rules.version_key}")
+                self._rules = rules
+            return self._rules
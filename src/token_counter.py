@@ -0,0 +1,86 @@
+"""LLM 토큰 수 계산 (로컬 토크나이저, 없으면 근사치)"""
+import math
+from typing import Optional
+
+try:
+    import tiktoken
+except ImportError:  # 선택 패키지: 없으면 문자 기준 근사치 사용
+    tiktoken = None
+
+
+class TokenCounter:
+    """
+    프롬프트 토큰 수 계산/자르기
+
+    - tiktoken이 설치되어 있으면 모델 인코딩으로 정확히 계산
+    - 없으면 근사치 (한글 등 비ASCII 1자 = 1토큰, ASCII 4자 = 1토큰, 실제보다 크게 잡힘)
+    """
+
+    DEFAULT_ENCODING = "o200k_base"
+    ASCII_CHARS_PER_TOKEN = 4
+
+    def __init__(self, model: str = "gpt-4o"):
+        """
+        Args:
+            model: 토크나이저를 고를 모델명
+        """
+        self.model = model
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding(self.DEFAULT_ENCODING)
+
+    @property
+    def exact(self) -> bool:
+        """토크나이저로 정확히 계산하는지 여부"""
+        return self._encoding is not None
+
+    @classmethod
+    def _char_cost(cls, char: str) -> float:
+        """근사치 계산용 글자당 토큰"""
+        return 1 / cls.ASCII_CHARS_PER_TOKEN if ord(char) < 128 else 1.0
+
+    def count(self, text: Optional[str]) -> int:
+        """
+        텍스트 토큰 수
+
+        Args:
+            text: 텍스트 (None이면 0)
+
+        Returns:
+            토큰 수
+        """
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return math.ceil(sum(self._char_cost(char) for char in text))
+
+    def truncate(self, text: Optional[str], max_tokens: int) -> str:
+        """
+        앞에서부터 max_tokens 토큰 이내로 자르기
+
+        Args:
+            text: 텍스트
+            max_tokens: 최대 토큰 수
+
+        Returns:
+            잘린 텍스트 (이미 짧으면 그대로)
+        """
+        if not text or max_tokens <= 0:
+            return ""
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text)
+            if len(tokens) <= max_tokens:
+                return text
+            # 글자 중간에서 잘린 바이트는 버림
+            return self._encoding.decode(tokens[:max_tokens]).rstrip("�")
+
+        used = 0.0
+        for idx, char in enumerate(text):
+            used += self._char_cost(char)
+            if used > max_tokens:
+                return text[:idx]
+        return text
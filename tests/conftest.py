@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 저장소 루트 모듈(grade.py, Detail.py 등) import용
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,30 @@
+"""BatchScorer 테스트"""
+import json
+
+from grade import CandidateScorer
+from src.batch_scorer import BatchScorer
+from src.scoring_rules import DEFAULT_RULES_PATH
+
+CANDIDATES = [
+    {"이력서번호": "1", "경력": "보험 영업", "기술스택": "C#, SQL", "자격증": [{"자격증명": "MOS"}]},
+    {"이력서번호": "2", "경력": "매장관리", "기술스택": "CS 업무, TOEIC 850", "자기소개서": [{"body_text": "고객 응대"}]},
+    {"이력서번호": "3", "직무": "영업", "학력": "경영학과"},
+]
+
+
+def test_matches_candidate_scorer():
+    assert BatchScorer(CandidateScorer()).verify(CANDIDATES) == []
+
+
+def test_empty_keyword_group_never_matches(tmp_path):
+    with open(DEFAULT_RULES_PATH, encoding="utf-8") as f:
+        rules = json.load(f)
+    rules["keywords"]["certLight"] = []
+    rules_path = tmp_path / "scoring_rules.json"
+    rules_path.write_text(json.dumps(rules, ensure_ascii=False), encoding="utf-8")
+
+    batch = BatchScorer(CandidateScorer(str(rules_path)))
+    assert batch.verify(CANDIDATES) == []
+    norm = batch._normalized_texts(batch.to_frame(CANDIDATES))
+    batch._compile_patterns(batch.scorer.rules)
+    assert not batch._hits(norm["cert"], "certLight").any()
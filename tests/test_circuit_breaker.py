@@ -0,0 +1,33 @@
+"""CircuitBreaker 테스트"""
+from src.circuit_breaker import CircuitBreaker
+
+
+def _open_breaker():
+    breaker = CircuitBreaker(window=4, min_calls=2, cooldown=0.0)
+    for _ in range(2):
+        assert breaker.wait() is False
+        breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+
+def test_late_results_ignored_while_half_open():
+    breaker = _open_breaker()
+    assert breaker.wait() is True  # 시험 호출
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    # 열리기 전에 보낸 호출이 늦게 끝남 → 무시
+    breaker.record(True)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker.opened == 1
+
+    breaker.record(True, probe=True)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens():
+    breaker = _open_breaker()
+    assert breaker.wait() is True
+    breaker.record(False, probe=True)
+    assert breaker.state == CircuitBreaker.OPEN and breaker.opened == 2
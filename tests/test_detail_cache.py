@@ -0,0 +1,37 @@
+"""src/detail_cache.py 이력서 수정 신호 테스트"""
+import time
+
+from src.detail_cache import DetailCache
+from src.parser import PersonDataParser
+
+OBSERVED_AT = 1_700_000_000.0
+
+
+def test_relative_day_forms_are_parsed():
+    assert PersonDataParser.parse_activity_minutes("10분전 이력서 수정") == 10
+    assert PersonDataParser.parse_activity_minutes("2시간 30분전 입사지원") == 150
+    assert PersonDataParser.parse_activity_minutes("3일전 이력서 수정") == 3 * 24 * 60
+    assert PersonDataParser.parse_activity_minutes("2주전 공고 스크랩") == 14 * 24 * 60
+    assert PersonDataParser.parse_activity_minutes("1개월전 이력서 수정") == 30 * 24 * 60
+    assert PersonDataParser.parse_activity_minutes("최근 활동 인재") is None
+
+
+def test_modified_at_uses_observed_at_for_relative_forms():
+    resume = {"최근활동": "1시간전 공고 스크랩, 3일전 이력서 수정"}
+    assert DetailCache.modified_at(resume, OBSERVED_AT) == OBSERVED_AT - 3 * 86400
+
+    resume = {"최근활동": "5일전 이력서 수정, 2시간전 이력서 수정"}
+    assert DetailCache.modified_at(resume, OBSERVED_AT) == OBSERVED_AT - 2 * 3600
+
+
+def test_day_old_modification_invalidates_older_cache(tmp_path):
+    cache = DetailCache(str(tmp_path / "cache.jsonl"), ttl_hours=24 * 30)
+    cache.put("1", [{"body_text": "이전 자기소개서"}], None)
+    cache._entries["1"]["cached_at"] = time.time() - 5 * 86400
+
+    resume = {"이력서번호": "1", "최근활동": "2일전 이력서 수정"}
+    assert cache.get(resume) is None
+    assert cache.stats["modified"] == 1
+
+    resume = {"이력서번호": "1", "최근활동": "6일전 이력서 수정"}
+    assert cache.get(resume) is not None
@@ -0,0 +1,44 @@
+"""Detail.py 체크포인트 정리 → grade.py 증분 재채점 테스트"""
+import json
+
+from grade import CandidateScorer, grade_candidates
+from src.checkpoint_log import CheckpointLog
+
+
+def _candidate(rno, intro):
+    return {
+        "이력서번호": rno,
+        "이름": f"후보{rno}",
+        "경력": "보험 영업 3년",
+        "직무": "보험영업",
+        "자기소개서": [{"body_text": intro}],
+        "자격증": None,
+        "추출상태": "성공",
+    }
+
+
+def test_compact_keeps_scores_for_next_grade(tmp_path, capsys):
+    input_json = str(tmp_path / "with_introduction.json")
+    scored_json = str(tmp_path / "scored.json")
+    log = CheckpointLog(str(tmp_path / "with_introduction.checkpoint.jsonl"))
+
+    log.append("1", _candidate("1", "고객 상담 경험"))
+    log.append("2", _candidate("2", "지원 동기"))
+    log.compact(input_json, key_field="이력서번호", keep_fields=CandidateScorer.SCORE_FIELDS)
+    grade_candidates(input_json, scored_json)
+
+    # 다음 크롤링: 1번은 그대로(캐시), 2번은 자기소개서 변경 → 로그에는 점수 필드 없음
+    log.append("1", _candidate("1", "고객 상담 경험"))
+    log.append("2", _candidate("2", "고객 응대 경험"))
+    log.close()
+    records = log.compact(input_json, key_field="이력서번호", keep_fields=CandidateScorer.SCORE_FIELDS)
+    assert all("채점키" in record for record in records)
+
+    capsys.readouterr()
+    graded = grade_candidates(input_json, scored_json)
+    out = capsys.readouterr().out
+    assert "재사용: 1명" in out and "재채점: 1명" in out
+
+    with open(input_json, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert [c["점수상세"] for c in saved] == [c["점수상세"] for c in graded]
@@ -0,0 +1,34 @@
+"""KeywordMatcher / fold_normalize 테스트"""
+from grade import CandidateScorer
+from src.keyword_matcher import KeywordMatcher, fold_normalize
+
+
+def test_fold_joins_hangul_and_keeps_ascii_separator():
+    assert fold_normalize("보험 영업") == fold_normalize("보험-영업") == fold_normalize("보험\n영업") == "보험영업"
+    assert fold_normalize("B2B 영업") == "b2b영업"
+    assert fold_normalize("C#, SQL") == "c sql"
+    assert fold_normalize("Logic Studio") == "logic studio"
+
+
+def test_separators_do_not_merge_ascii_tokens():
+    matcher = KeywordMatcher({"indirectSales": ["CS"]}, normalize=fold_normalize)
+    assert matcher.scan("CS 업무") == {"indirectSales"}
+    assert matcher.scan("C#, SQL") == set()
+    assert matcher.scan("C, SQL, Java") == set()
+    assert matcher.scan("Logic Studio") == set()
+
+
+def test_substring_hits_kept_as_in_grade_js():
+    # 영문 키워드도 부분 문자열로 매칭 (기존 채점과 동일, 단어 경계 검사 없음)
+    scorer = CandidateScorer()
+    assert "indirectSales" in scorer.features({"경력": "CSR 담당"}).hits("exp")
+    assert "generalSales" in scorer.features({"경력": "ATM 관리"}).hits("exp")
+    assert "generalSales" in scorer.features({"경력": "HTML 퍼블리셔"}).hits("exp")
+
+
+def test_tech_stack_does_not_score_indirect_sales():
+    scorer = CandidateScorer()
+    for stack in ("C#, SQL", "C, SQL, Java", "Logic Studio"):
+        features = scorer.features({"기술스택": stack})
+        assert "indirectSales" not in features.hits("exp")
+        assert scorer.score_sales_exp(features) == 0
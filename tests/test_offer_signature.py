@@ -0,0 +1,28 @@
+"""position_offer.py 제안문구 로그 서명 테스트"""
+from position_offer import PositionOfferGenerator
+
+PERSON = {"이력서번호": "1", "경력": "보험 영업 3년", "직무": "보험영업", "자기소개서": [{"body_text": "고객 상담 경험"}]}
+
+
+def signature(**kwargs) -> str:
+    return PositionOfferGenerator(offline=True, **kwargs)._signature_hash(PERSON)
+
+
+def test_signature_is_stable_for_same_settings():
+    assert signature() == signature()
+
+
+def test_signature_changes_with_model_and_temperature():
+    base = signature()
+    assert signature(model="gpt-4o-mini") != base
+    assert signature(temperature=0.2) != base
+
+
+def test_signature_changes_with_prompt(monkeypatch):
+    base = signature()
+    monkeypatch.setattr(PositionOfferGenerator, "PROMPT_VERSION", PositionOfferGenerator.PROMPT_VERSION + 1)
+    assert signature() != base
+    monkeypatch.undo()
+
+    monkeypatch.setattr(PositionOfferGenerator, "BASE_TEMPLATE", PositionOfferGenerator.BASE_TEMPLATE + " 감사합니다.")
+    assert signature() != base
@@ -0,0 +1,41 @@
+"""Detail.py 점수 상한 기반 사전 필터링 테스트"""
+from Detail import prune_by_score_bound
+from grade import MIN_SCORE, CandidateScorer
+from src.scoring_rules import DEFAULT_RULES_PATH
+
+STRONG = {"이력서번호": "1", "경력": "보험 영업 월 120% 달성", "직무": "보험영업", "학력": "경영학과", "기술스택": "TOEIC 900"}
+EMPTY = {"이력서번호": "2", "경력": "", "직무": "디자인", "기술스택": "Photoshop"}
+
+
+def test_upper_bound_covers_detail_fields():
+    scorer = CandidateScorer()
+    detailed = {
+        **EMPTY,
+        "자격증": [{"자격증명": "AFPK"}],
+        "자기소개서": [{"body_text": "고객 상담 경험과 보험 영업에 대한 지원 동기"}],
+    }
+    assert scorer.calculate_score(detailed)["총점"] <= scorer.upper_bound_score(EMPTY)
+    assert scorer.upper_bound_score(EMPTY) == scorer.detail_headroom()
+
+
+def test_candidate_below_bound_is_pruned():
+    scorer = CandidateScorer()
+    min_score = scorer.detail_headroom() + 1
+
+    to_fetch, pruned = prune_by_score_bound([EMPTY, STRONG], min_score)
+    assert [resume["이력서번호"] for resume in to_fetch] == ["1"]
+    assert [(resume["이력서번호"], bound) for resume, bound in pruned] == [("2", scorer.detail_headroom())]
+
+
+def test_default_rules_prune_nobody():
+    # 기본 규칙 파일 + 기본 합격 기준: 상세정보만으로 50점까지 가능 → 제외 0명 (수집 순서만 정렬)
+    scorer = CandidateScorer(DEFAULT_RULES_PATH)
+    assert scorer.detail_headroom() == 50 >= MIN_SCORE
+
+    summaries = [EMPTY, STRONG] + [
+        {"이력서번호": str(i), "경력": "", "제목": "", "직무": "", "기술스택": "", "학력": ""} for i in range(10, 30)
+    ]
+    to_fetch, pruned = prune_by_score_bound(summaries, MIN_SCORE)
+    assert len(pruned) == 0
+    assert len(to_fetch) == len(summaries)
+    assert to_fetch[0]["이력서번호"] == "1"
@@ -0,0 +1,33 @@
+"""채점 규칙 로드 테스트"""
+import openpyxl
+
+from src.scoring_rules import DEFAULT_RULES_SHEET, load_rules
+
+
+def _write_workbook(path, account):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = DEFAULT_RULES_SHEET
+    ws.append(["구분", "이름", "값"])
+    ws.append(["버전", "-", "test.1"])
+    ws.append(["키워드", "certHigh", "AFPK, CFP"])
+    ws.append(["점수", "cert.certHigh", 20])
+    accounts = wb.create_sheet("계정")
+    accounts.append(["아이디", "비밀번호"])
+    accounts.append([account, "pw"])
+    wb.save(path)
+
+
+def test_excel_version_ignores_other_sheets(tmp_path):
+    path = str(tmp_path / "config.xlsx")
+    _write_workbook(path, "user1")
+    before = load_rules(path).version_key
+    _write_workbook(path, "user2")
+    assert load_rules(path).version_key == before
+
+
+def test_default_rules_path_independent_of_cwd(tmp_path, monkeypatch):
+    from grade import CandidateScorer
+
+    monkeypatch.chdir(tmp_path)
+    assert CandidateScorer().rules.keywords